@@ -0,0 +1,154 @@
+from math import exp
+
+import numpy as np
+
+from app.SO import SO
+from app.utils import LevyFlight
+
+
+class ArrayBA(SO):
+    """
+    Bat algorithm working on (population, dimension) arrays. Whole colony
+    is moved and evaluated at once, average loudness comes from a running sum.
+    Steps follow BA: bats are rated in their positions, then fly and search around
+    themselves or the best bat; candidate found around the best bat replaces it.
+    """
+
+    def __init__(self, population, dimension, opt_function, levy=False, **kwargs):
+        super().__init__(population, dimension, opt_function, **kwargs)
+
+        # positions, velocities and values of bats, y_bats belong to positions x_rated
+        self.x = np.empty((population, dimension))
+        self.v = np.empty((population, dimension))
+        self.x_rated = np.empty((population, dimension))
+        self.y_bats = np.empty(population)
+        # index of the best bat and bats every candidate was searched around
+        self.best_bat = 0
+        self.targets = np.empty(population, dtype=int)
+        # loudness, pulse rates and running sum of loudness
+        self.A = np.empty(population)
+        self.r = np.empty(population)
+        self.loudness_sum = 0.0
+        self.t = 0
+        # 0: positions of bats are asked, 1: echolocation candidates are asked
+        self.phase = 0
+        self.candidates = np.empty((population, dimension))
+
+        self.levy = levy
+        self.levy_probability = kwargs.get('levy_probability', 0.02)
+        self.levy_scale = kwargs.get('levy_scale', 1.0)
+        self.levy_flight = None
+
+        self.f_range = kwargs.get('freq_range', (0, 2))
+
+        self.mod_r = kwargs.get('mod_r', 0.8)  # pulse rate modifier | mod_r > 0
+        self.mod_A = kwargs.get('mod_A', 0.9)  # loudness modifier | 0 < mod_a < 1
+
+        self.reset()
+
+    def levy_or_not(self, v):
+        return self.levy_flight(v) if self.levy else v
+
+    def ask(self) -> np.ndarray:
+        shape = self.x.shape
+        # first phase: bats are rated in their positions
+        if self.phase == 0:
+            self.t += 1
+            return self.x
+
+        # second phase: bats fly
+        # calculate matrices of velocity and position
+        freq = self.f_range[0] + self.rng.random(shape) * (self.f_range[1] - self.f_range[0])
+        self.v = self.v + freq * (self.x - self.best_global)
+        self.x, self.v = self.handle_boundaries(self.x + self.levy_or_not(self.v), self.v)
+
+        # and search around best bat or around bat itself
+        self.targets = np.where(self.rng.random(self.population) > self.r, self.best_bat, np.arange(self.population))
+        self.candidates = self.x[self.targets] + self.rng.uniform(-1, 1, shape) * self.count_avg_loudness()
+        return self.candidates
+
+    def tell(self, values) -> bool:
+        values = np.asarray(values, dtype=float)
+        if self.phase == 0:
+            self.y_bats, self.x_rated = values, self.x.copy()
+            self.rate_bats()
+            self.phase = 1
+            return False
+
+        self.echolocation(values)
+        self.phase = 0
+        return True
+
+    def rate_bats(self):
+        best = int(np.argmin(self.y_bats))
+        if self.y_bats[best] < self.y:
+            self.y = float(self.y_bats[best])
+            self.best_global = self.x[best].copy()
+            self.best_bat = best
+
+    def echolocation(self, y):
+        """moves bats to better candidate positions found around them"""
+        chances = self.rng.random(self.population)
+        # every bat other than the best one has at most its own candidate, they are accepted at once
+        own = np.flatnonzero(self.targets != self.best_bat)
+        accepted = own[(y[own] < self.y_bats[own]) & (chances[own] < self.A[own])]
+        if len(accepted):
+            self.x[accepted], self.y_bats[accepted] = self.candidates[accepted], y[accepted]
+            self.x_rated[accepted] = self.candidates[accepted]
+            self.loudness_sum -= np.sum(self.A[accepted])
+            self.A[accepted] *= self.mod_A
+            self.loudness_sum += np.sum(self.A[accepted])
+            self.r[accepted] *= 1 - exp(-self.mod_r * self.t)
+
+        # candidates around the best bat compete for it one after another
+        best = self.best_bat
+        for i in np.flatnonzero(self.targets == best).tolist():
+            if y[i] < self.y_bats[best] and chances[i] < self.A[best]:
+                self.x[best], self.y_bats[best] = self.candidates[i], y[i]
+                self.x_rated[best] = self.candidates[i]
+                self.loudness_sum -= self.A[best]
+                self.A[best] *= self.mod_A
+                self.loudness_sum += self.A[best]
+                self.r[best] *= 1 - exp(-self.mod_r * self.t)
+
+    def count_avg_loudness(self):
+        return self.loudness_sum / self.population
+
+    def emigrants(self, k) -> tuple:
+        best = np.argsort(self.y_bats)[:k]
+        return self.x_rated[best].copy(), self.y_bats[best].copy()
+
+    def immigrate(self, xs, ys):
+        xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+        worst = np.argsort(self.y_bats)[::-1][:len(ys)]
+        xs, ys = xs[:len(worst)], ys[:len(worst)]
+        self.x[worst], self.x_rated[worst], self.y_bats[worst] = xs, xs, ys
+        self.v[worst] = 0
+        best = np.argmin(ys)
+        if ys[best] < self.y:
+            self.best_global = xs[best].copy()
+            self.best_bat = int(worst[best])
+            self.y = float(ys[best])
+
+    def evaluate(self, iterations=None, *args, **kwargs):
+        return super().evaluate(self.step, iterations)
+
+    def reset(self):
+        super().reset()
+
+        self.levy_flight = LevyFlight(self.rng, self.levy_probability, self.levy_scale)
+        self.phase = 0
+
+        self.v = np.zeros((self.population, self.dimensions))
+        # actual position of bat in dimension
+        self.x = self.rng.uniform(*self.opt_fun.x_range, size=(self.population, self.dimensions))
+        self.x_rated = self.x.copy()
+        self.y_bats = np.full(self.population, np.inf)
+        self.A = self.rng.uniform(1, 2, self.population)  # loudness
+        self.r = np.full(self.population, 0.5)  # pulse rate
+        self.loudness_sum = float(np.sum(self.A))
+
+        # best bat
+        self.best_bat = 0
+        self.best_global = self.x[0].copy()
+        self.t = 0
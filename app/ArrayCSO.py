@@ -0,0 +1,46 @@
+import numpy as np
+
+from app.ArrayMultiSO import ArrayMultiSO
+from app.CSO import validate_cso
+
+
+class ArrayCSO(ArrayMultiSO):
+    """CSO with all tournaments of a stage computed at once"""
+
+    @validate_cso
+    def __init__(self, population, dimension, opt_function, no_swarms, **kwargs):
+        super().__init__(population, dimension, opt_function, no_swarms, **kwargs)
+
+    def ask(self) -> np.ndarray:
+        selected_winners, losers_one = self.stage_one()
+        losers_two = self.stage_two(selected_winners)
+        return self.ask_moved(np.concatenate((losers_one, losers_two)))
+
+    def stage_one(self):
+        # take every 2 particles from swarm only once
+        pairs, swarms = self.group(2)
+        winners, losers = self.tournament(pairs, self.calculate_swarms_avg_pos()[swarms])
+        # select only one random winner particle for each swarm
+        return self.select_swarm_winners(winners, swarms), losers
+
+    def stage_two(self, winners):
+        winners_avg_pos = self.calculate_avg_pos(winners)
+
+        # take every 2 particles from winners only once
+        pairs = winners[:len(winners) - len(winners) % 2].reshape(-1, 2)
+        _, losers = self.tournament(pairs, winners_avg_pos)
+        return losers
+
+    def tournament(self, pairs, avg_swarm_pos) -> tuple:
+        w, los = self.rank(pairs).T
+
+        # compute new v for losers
+        shape = (len(los), self.dimensions)
+        x_l = self.x[los]
+        v_l = self.rng.random(shape) * self.v[los] \
+            + self.rng.random(shape) * (self.x[w] - x_l) \
+            + 0.3 * self.rng.random(shape) * (avg_swarm_pos - x_l)
+        self.move(los, v_l)
+
+        # return indexes of winners and losers
+        return w, los
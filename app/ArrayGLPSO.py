@@ -0,0 +1,120 @@
+import numpy as np
+
+from app.migration import ArrayLocalBestMigration
+from app.SO import SO
+from app.utils import LevyFlight
+
+
+class ArrayGLPSO(ArrayLocalBestMigration, SO):
+    """
+    GLPSO working on (population, dimension) arrays. Crossover, mutation,
+    exemplar blending and selection are done for all particles at once.
+    """
+
+    def __init__(self, population, dimension, opt_function, pm, levy=False, **kwargs):
+        super().__init__(population, dimension, opt_function, **kwargs)
+
+        # positions, velocities, local bests and their values
+        self.x = np.empty((population, dimension))
+        self.v = np.empty((population, dimension))
+        self.best_local = np.empty((population, dimension))
+        self.y_best = np.empty(population)
+        # exemplars guiding particles and their values
+        self.exemplars = np.empty((population, dimension))
+        self.y_exemplars = np.empty(population)
+        # 0: offsprings and exemplars are asked, 1: new positions of particles are asked
+        self.phase = 0
+        self.candidates = np.empty((2 * population, dimension))
+
+        self.w_v = kwargs.get('w_v', 0.729)
+        self.w_l = kwargs.get('w_l', 1.494)
+        self.w_g = kwargs.get('w_g', 1.494)
+        self.pm = pm
+        self.levy = levy
+        self.levy_probability = kwargs.get('levy_probability', 0.02)
+        self.levy_scale = kwargs.get('levy_scale', 1.0)
+        self.levy_flight = None
+
+        self.reset()
+
+    def levy_or_not(self, v):
+        return self.levy_flight(v) if self.levy else v
+
+    def ask(self) -> np.ndarray:
+        shape = self.x.shape
+        # second phase: particles follow selected exemplars
+        if self.phase == 1:
+            c_lg = (self.rng.coefficients(self.w_l, shape) + self.rng.coefficients(self.w_g, shape)) / 2
+            v = self.rng.coefficients(self.w_v, shape) * self.v \
+                + c_lg * self.rng.random(shape) * (self.exemplars - self.x)
+            # Check for edge and change position
+            self.x, self.v = self.handle_boundaries(self.x + v, self.levy_or_not(v))
+            return self.x
+
+        # first phase: offsprings and exemplars
+        rows = np.arange(self.population)[:, np.newaxis]
+        columns = np.arange(self.dimensions)
+
+        # Losowo wybierz cząstkę dla każdego wymiaru
+        partners = self.rng.integers(0, self.population, size=shape)
+        # Krzyżowanie
+        rd = self.rng.random(shape)
+        offsprings = np.where(
+            self.y_best[rows] < self.y_best[partners],
+            rd * self.best_local + (1 - rd) * self.best_global,
+            self.best_local[partners, columns]
+        )
+        # Mutacja
+        mutated = self.rng.random(shape) < self.pm
+        offsprings[mutated] = self.rng.uniform(*self.opt_fun.x_range, size=np.count_nonzero(mutated))
+        # Oblicz exemplar
+        c1_r1 = self.rng.coefficients(self.w_l, shape) * self.rng.random(shape)
+        c2_r2 = self.rng.coefficients(self.w_g, shape) * self.rng.random(shape)
+        exemplars = (c1_r1 * self.best_local + c2_r2 * self.best_global) / (c1_r1 + c2_r2)
+        self.candidates = np.concatenate((offsprings, exemplars))
+        return self.candidates
+
+    def tell(self, values) -> bool:
+        f_values = np.asarray(values, dtype=float)
+        if self.phase == 0:
+            # Selekcja: offsprings are first half of asked positions, exemplars second one
+            y_offsprings, y_exemplars = np.split(f_values, 2)
+            selected = y_offsprings < y_exemplars
+            self.exemplars = np.where(selected[:, np.newaxis], *np.split(self.candidates, 2))
+            self.y_exemplars = np.where(selected, y_offsprings, y_exemplars)
+            self.phase = 1
+            return False
+
+        # Check if value is new global minimum
+        best = np.argmin(f_values)
+        if f_values[best] < self.y:
+            self.best_global = self.x[best].copy()
+            self.y = float(f_values[best])
+
+        # Check which values are new local minimums
+        improved = f_values < self.y_best
+        self.best_local[improved] = self.x[improved]
+        self.y_best[improved] = f_values[improved]
+        self.phase = 0
+        return True
+
+    def evaluate(self, iterations=None, *args, **kwargs):
+        return super().evaluate(self.step, iterations)
+
+    def reset(self):
+        super().reset()
+
+        self.levy_flight = LevyFlight(self.rng, self.levy_probability, self.levy_scale)
+
+        self.v = np.zeros((self.population, self.dimensions))
+        # actual position of particle in dimension
+        self.x = self.rng.uniform(*self.opt_fun.x_range, size=(self.population, self.dimensions))
+        self.exemplars = self.rng.uniform(*self.opt_fun.x_range, size=(self.population, self.dimensions))
+        self.y_exemplars = np.full(self.population, np.inf)
+        self.phase = 0
+
+        # local max
+        self.best_local = self.x.copy()
+        self.y_best = self.evaluate_batch(self.x)
+        # global max
+        self.best_global = self.x[0].copy()
@@ -0,0 +1,46 @@
+import numpy as np
+
+from app.ArrayMultiSO import ArrayMultiSO
+from app.LCSO import validate_lcso
+
+
+class ArrayLCSO(ArrayMultiSO):
+    """LCSO with all tournaments of a stage computed at once"""
+
+    @validate_lcso
+    def __init__(self, population, dimension, opt_function, no_swarms, **kwargs):
+        super().__init__(population, dimension, opt_function, no_swarms, **kwargs)
+
+    def ask(self) -> np.ndarray:
+        selected_winners, moved_one = self.stage_one()
+        moved_two = self.stage_two(selected_winners)
+        return self.ask_moved(np.concatenate((moved_one, moved_two)))
+
+    def stage_one(self):
+        # take every 3 particles from swarm only once
+        triples, swarms = self.group(3)
+        winners, moved = self.tournament(triples)
+        # select only one random winner particle for each swarm
+        return self.select_swarm_winners(winners, swarms), moved
+
+    def stage_two(self, winners):
+        # take every 3 particles from winners only once
+        triples = winners[:len(winners) - len(winners) % 3].reshape(-1, 3)
+        _, moved = self.tournament(triples)
+        return moved
+
+    def tournament(self, triples) -> tuple:
+        w, s, los = self.rank(triples).T
+
+        # compute new v for seconds and losers
+        shape = (len(los), self.dimensions)
+        x_w, x_s, x_l = self.x[w], self.x[s], self.x[los]
+        v_s = self.rng.random(shape) * self.v[s] + self.rng.random(shape) * (x_w - x_s)
+        v_l = self.rng.random(shape) * self.v[los] \
+            + self.rng.random(shape) * (x_w - x_l) \
+            + self.rng.random(shape) * (x_s - x_l)
+        self.move(s, v_s)
+        self.move(los, v_l)
+
+        # return indexes of winners and of moved particles
+        return w, np.concatenate((s, los))
@@ -0,0 +1,113 @@
+from abc import abstractmethod
+
+import numpy as np
+
+from app.SO import SO
+
+
+class ArrayMultiSO(SO):
+    """
+    Base of competitive swarm optimizers working on (population, dimension) arrays.
+    Swarm membership is kept as an array of swarm ids, particle i belongs to swarm i % no_swarms.
+    """
+
+    def __init__(self, population, dimension, opt_function, no_swarms, **kwargs):
+        super().__init__(population, dimension, opt_function, **kwargs)
+        self.no_swarms = no_swarms
+
+        # positions, velocities and cached values of positions
+        self.x = np.empty((population, dimension))
+        self.v = np.empty((population, dimension))
+        self.y_particles = np.empty(population)
+        # indexes of particles moved in this iteration
+        self.moved = np.empty(0, dtype=int)
+
+        self.swarm_ids = np.arange(population) % no_swarms
+        self.swarm_sizes = np.bincount(self.swarm_ids, minlength=no_swarms)
+        # index of first particle of each swarm when particles are sorted by swarm
+        self.swarm_starts = np.cumsum(self.swarm_sizes) - self.swarm_sizes
+
+        self.reset()
+
+    def reset(self):
+        super().reset()
+
+        # random velocity at start
+        self.v = self.rng.uniform(*self.v_init_range, size=(self.population, self.dimensions))
+        self.x = self.rng.uniform(*self.opt_fun.x_range, size=(self.population, self.dimensions))
+        self.y_particles = self.evaluate_batch(self.x)
+
+        # global max
+        self.best_global = self.x[0].copy()
+
+    def group(self, size):
+        """
+        Shuffles particles inside swarms and splits every swarm into groups of given size.
+        First len(swarm) % size shuffled particles of swarm are left out.
+        :return: (groups, size) array of particle indexes and swarm id of every group
+        """
+        # sort by swarm id, random order inside swarm
+        order = np.lexsort((self.rng.random(self.population), self.swarm_ids))
+        swarms = self.swarm_ids[order]
+        rank = np.arange(self.population) - self.swarm_starts[swarms]
+        kept = rank >= (self.swarm_sizes % size)[swarms]
+        return order[kept].reshape(-1, size), swarms[kept][::size]
+
+    def select_swarm_winners(self, winners, swarms):
+        """selects one random winner for each swarm and shuffles them"""
+        order = self.rng.permutation(len(winners))
+        _, first = np.unique(swarms[order], return_index=True)
+        return self.rng.permutation(winners[order[first]])
+
+    def rank(self, groups):
+        """sorts every group ascending by cached values of particles"""
+        return np.take_along_axis(groups, np.argsort(self.y_particles[groups], axis=1), axis=1)
+
+    def calculate_swarms_avg_pos(self):
+        """(no_swarms, dimension) array of average positions in swarms"""
+        sums = np.zeros((self.no_swarms, self.dimensions))
+        np.add.at(sums, self.swarm_ids, self.x)
+        return sums / self.swarm_sizes[:, np.newaxis]
+
+    def calculate_avg_pos(self, idx) -> np.ndarray:
+        return np.mean(self.x[idx], axis=0)
+
+    def move(self, idx, v):
+        """sets new velocity and bounced position for particles with given indexes"""
+        self.x[idx], self.v[idx] = self.handle_boundaries(self.x[idx] + v, v)
+
+    def ask_moved(self, moved) -> np.ndarray:
+        """remembers indexes of particles moved in this iteration and returns their positions"""
+        self.moved = moved
+        return self.x[moved]
+
+    def tell(self, values) -> bool:
+        # only moved particles need new values
+        self.y_particles[self.moved] = values
+        # find particle with minimal value of optimisation function
+        best_particle_idx = np.argmin(self.y_particles)
+        self.y = float(self.y_particles[best_particle_idx])
+        self.best_global = self.x[best_particle_idx].copy()
+        return True
+
+    def emigrants(self, k) -> tuple:
+        best = np.argsort(self.y_particles)[:k]
+        return self.x[best].copy(), self.y_particles[best].copy()
+
+    def immigrate(self, xs, ys):
+        xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+        worst = np.argsort(self.y_particles)[::-1][:len(ys)]
+        xs, ys = xs[:len(worst)], ys[:len(worst)]
+        self.x[worst], self.y_particles[worst] = xs, ys
+        self.v[worst] = 0
+        best = np.argmin(ys)
+        if ys[best] < self.y:
+            self.y = float(ys[best])
+            self.best_global = xs[best].copy()
+
+    @abstractmethod
+    def ask(self) -> np.ndarray:
+        pass
+
+    def evaluate(self, iterations: int = None, *args, **kwargs):
+        return super().evaluate(self.step, iterations)
@@ -0,0 +1,85 @@
+import numpy as np
+
+from app.migration import ArrayLocalBestMigration
+from app.SO import SO
+
+
+class ArrayPSO(ArrayLocalBestMigration, SO):
+    """
+    PSO working on (population, dimension) arrays instead of list of dicts.
+    Whole swarm is moved and evaluated at once in every step.
+    """
+
+    def __init__(self, population, dimension, opt_function, **kwargs):
+        super().__init__(population, dimension, opt_function, **kwargs)
+
+        # positions, velocities, local bests and their values
+        self.x = np.empty((population, dimension))
+        self.v = np.empty((population, dimension))
+        self.best_local = np.empty((population, dimension))
+        self.y_best = np.empty(population)
+
+        self.w_v = kwargs.get('w_v', 0.729)
+        self.w_l = kwargs.get('w_l', 1.494)
+        self.w_g = kwargs.get('w_g', 1.494)
+        # alternative: particles are attracted by average distance to global best
+        self.alternative = kwargs.get('alternative', False)
+
+        self.reset()
+
+    def ask(self) -> np.ndarray:
+        if self.alternative:
+            # average distance from particles to global best in each dimension
+            attractor = np.mean(self.best_global - self.x, axis=0)
+        else:
+            attractor = self.best_global
+
+        shape = self.x.shape
+        # Calculate new velocity
+        self.v = self.rng.coefficients(self.w_v, shape) * self.v \
+            + self.rng.coefficients(self.w_l, shape) * self.rng.random(shape) * (self.best_local - self.x) \
+            + self.rng.coefficients(self.w_g, shape) * self.rng.random(shape) * (attractor - self.x)
+
+        # Check for edge and change position
+        self.x, self.v = self.handle_boundaries(self.x + self.v, self.v)
+        return self.x
+
+    def tell(self, values) -> bool:
+        f_values = np.asarray(values, dtype=float)
+
+        # Check if value is new global minimum
+        best = np.argmin(f_values)
+        if f_values[best] < self.y:
+            self.best_global = self.x[best].copy()
+            self.y = float(f_values[best])
+
+        # Check which values are new local minimums
+        improved = f_values < self.y_best
+        self.best_local[improved] = self.x[improved]
+        self.y_best[improved] = f_values[improved]
+        return True
+
+    def alt_step(self) -> float:
+        """one iteration of alternative variant, variant of swarm is not changed"""
+        alternative, self.alternative = self.alternative, True
+        try:
+            return self.step()
+        finally:
+            self.alternative = alternative
+
+    def evaluate(self, iterations=None, alternative=False, *args, **kwargs):
+        self.alternative = alternative
+        return super().evaluate(self.step, iterations)
+
+    def reset(self):
+        super().reset()
+
+        self.v = np.zeros((self.population, self.dimensions))
+        # actual position of particle in dimension
+        self.x = self.rng.uniform(*self.opt_fun.x_range, size=(self.population, self.dimensions))
+
+        # local max
+        self.best_local = self.x.copy()
+        self.y_best = self.evaluate_batch(self.x)
+        # global max
+        self.best_global = self.x[0].copy()
@@ -1,22 +1,31 @@
-from functools import partial
-from random import uniform
-from cmath import exp
+from math import exp
 
-from app.SO import SO
-from app.utils import bounce, levy_flight
+import numpy as np
+
+from app.SO import SO, MAX_FLOAT
+from app.utils import LevyFlight
 
 
 class BA(SO):
 
     def __init__(self, population, dimension, opt_function, levy=False, **kwargs):
-        super().__init__(population, dimension, opt_function)
+        super().__init__(population, dimension, opt_function, **kwargs)
 
         self.bats = {}
+        self.best_bat = {}
+        # 0: positions of bats are asked, 1: echolocation candidates are asked
+        self.phase = 0
+        # bats searching around themselves (or best bat) and their candidate positions
+        self.echolocating = []
+        self.candidates = np.empty((0, dimension))
+        # running sum of loudness of all bats
+        self.loudness_sum = 0.0
         self.t = 0
 
-        # feed bounce function with constant x_range to speed up computing
-        self.bounce = partial(bounce, x_range=self.opt_fun.x_range)
-        self.levy_or_not = lambda v: levy_flight(v) if levy else v
+        self.levy = levy
+        self.levy_probability = kwargs.get('levy_probability', 0.02)
+        self.levy_scale = kwargs.get('levy_scale', 1.0)
+        self.levy_flight = None
 
         self.f_range = kwargs.get('freq_range', (0, 2))
 
@@ -25,50 +34,91 @@ class BA(SO):
 
         self.reset()
 
-    def step(self) -> float:
-        self.t += 1
-        [self.rate_bat(bat) for bat in self.bats]
+    def levy_or_not(self, v):
+        return self.levy_flight(v) if self.levy else v
+
+    def ask(self) -> np.ndarray:
+        # first phase: bats are rated in their positions
+        if self.phase == 0:
+            self.t += 1
+            return np.array([bat['x'] for bat in self.bats])
 
-        for bat in self.bats:
+        # second phase: bats fly and search around themselves or best bat
+        for bat, freq in zip(self.bats, self.count_freq((self.population, self.dimensions)).tolist()):
             # calculate vectors of velocity and position
             bat['v'] = list(map(
-                lambda v, x: v + self.count_freq() * (x - self.best_global),
-                bat['v'], bat['x']
+                lambda v, x, x_best, f: v + f * (x - x_best),
+                bat['v'], bat['x'], self.best_global, freq
             ))
-            bat['x'] = list(map(
-                lambda v, x: self.bounce(x + self.levy_or_not(v)),
-                bat['v'], bat['x']
+            moves = self.levy_flight(np.array(bat['v'])).tolist() if self.levy else bat['v']
+            xv = list(map(
+                lambda x, move, v: self.handle_boundary(x + move, v),
+                bat['x'], moves, bat['v']
             ))
-
-        for bat in self.bats:
-            if uniform(0, 1) > bat['r']:
-                self.echolocation(self.best_global)
-            else:
-                self.echolocation(bat)
-        return self.y
-
-    def rate_bat(self, bat: dict):
-        bat['y'] = self.opt_fun(bat['x'])
-        if bat['y'] < self.y:
-            self.y = bat['y'].copy()
-            self.best_global = bat
-
-    def echolocation(self, bat: dict):
-        pos = list(map(
-            lambda x: x + uniform(-1, 1) * self.count_avg_loudness(),
-            bat['x']
-        ))
-        y = self.opt_fun(pos)
-        if y < bat['y'] and uniform(0, 1) < bat['A']:
-            bat['y'], bat['x'] = y, pos
-            bat['A'] = bat['A'] * self.mod_A
-            bat['r'] = bat['r'] * (1 - exp(-self.mod_r * self.t))
+            bat['x'], bat['v'] = [x for x, _ in xv], [v for _, v in xv]
+
+        self.echolocating = [
+            self.best_bat if r > bat['r'] else bat
+            for bat, r in zip(self.bats, self.rng.random(self.population).tolist())
+        ]
+        return self.echolocation(self.echolocating)
+
+    def tell(self, values) -> bool:
+        values = np.asarray(values).tolist()
+        if self.phase == 0:
+            self.rate_bats(values)
+            self.phase = 1
+            return False
+
+        self.accept(self.echolocating, values)
+        self.phase = 0
+        return True
+
+    def rate_bats(self, values):
+        for bat, y in zip(self.bats, values):
+            bat['y'], bat['x_rated'] = y, bat['x']
+            if bat['y'] < self.y:
+                self.y = bat['y']
+                self.best_global = bat['x'].copy()
+                self.best_bat = bat
+
+    def echolocation(self, bats: list) -> np.ndarray:
+        """candidate positions around every given bat"""
+        avg_loudness = self.count_avg_loudness()
+        self.candidates = (np.array([bat['x'] for bat in bats])
+                           + self.rng.uniform(-1, 1, (len(bats), self.dimensions)) * avg_loudness)
+        return self.candidates
+
+    def accept(self, bats: list, values):
+        """moves bats to better candidate positions, one after another"""
+        positions = self.candidates.tolist()
+        for bat, pos, y, chance in zip(bats, positions, values, self.rng.random(len(bats)).tolist()):
+            if y < bat['y'] and chance < bat['A']:
+                bat['y'], bat['x'], bat['x_rated'] = y, pos, pos
+                self.loudness_sum -= bat['A']
+                bat['A'] = bat['A'] * self.mod_A
+                self.loudness_sum += bat['A']
+                bat['r'] = bat['r'] * (1 - exp(-self.mod_r * self.t))
 
     def count_avg_loudness(self):
-        return sum(bat['A'] for bat in self.bats) / len(self.bats)
+        return self.loudness_sum / len(self.bats)
+
+    def emigrants(self, k) -> tuple:
+        best = sorted(self.bats, key=lambda bat: bat['y'])[:k]
+        return np.array([bat['x_rated'] for bat in best]), np.array([bat['y'] for bat in best])
 
-    def count_freq(self):
-        return self.f_range[0] + uniform(0, 1) * (self.f_range[1] - self.f_range[0])
+    def immigrate(self, xs, ys):
+        worst = sorted(self.bats, key=lambda bat: bat['y'], reverse=True)
+        for bat, x, y in zip(worst, np.asarray(xs).tolist(), np.asarray(ys).tolist()):
+            bat['x'], bat['x_rated'], bat['y'] = x, x, y
+            bat['v'] = [0] * self.dimensions
+            if y < self.y:
+                self.best_global = x.copy()
+                self.best_bat = bat
+                self.y = y
+
+    def count_freq(self, size=None):
+        return self.f_range[0] + self.rng.random(size) * (self.f_range[1] - self.f_range[0])
 
     def evaluate(self, iterations=None, *args, **kwargs):
         return super().evaluate(self.step, iterations)
@@ -76,13 +126,26 @@ class BA(SO):
     def reset(self):
         super().reset()
 
+        self.levy_flight = LevyFlight(self.rng, self.levy_probability, self.levy_scale)
+        self.phase = 0
+
         self.bats = [{
             'v': [0] * self.dimensions,
             # actual position of particle in dimension
-            'x': [uniform(*self.opt_fun.x_range) for _ in range(self.dimensions)],
-            'A': uniform(1, 2),  # loudness
+            'x': x,
+            # position bat was rated in and its value
+            'x_rated': x,
+            'y': MAX_FLOAT,
+            'A': A,  # loudness
             'r': 0.5  # pulse rate
-        } for _ in range(self.population)]
+        } for x, A in zip(
+            self.rng.uniform(*self.opt_fun.x_range, (self.population, self.dimensions)).tolist(),
+            self.rng.uniform(1, 2, self.population).tolist()
+        )]
+
+        self.loudness_sum = sum(bat['A'] for bat in self.bats)
 
         # best bat
+        self.best_bat = self.bats[0]
+        self.best_global = self.bats[0]['x'].copy()
         self.t = 0
@@ -1,8 +1,9 @@
 from collections import OrderedDict
-from random import uniform, choice
+
+import numpy as np
 
 from app.MultiSO import MultiSO
-from app.utils import shuffle, grouped
+from app.utils import grouped
 
 
 def validate_cso(init):
@@ -28,25 +29,24 @@ class CSO(MultiSO):
     def __init__(self, population, dimension, opt_function, no_swarms, **kwargs):
         super().__init__(population, dimension, opt_function, no_swarms, **kwargs)
 
-    def step(self) -> float:
+    def ask(self) -> np.ndarray:
         self.shuffle()
         selected_winners = self.stage_one()
         self.stage_two(selected_winners)
-        self.select_best()
-        return self.y
+        return self.moved_positions()
 
     def stage_one(self):
         winners = []
-        for i, swarm in enumerate(self.particles):
-            swarm_avg_pos = self.calculate_avg_pos(swarm)
+        for i, swarm in enumerate(self.swarms):
+            swarm_avg_pos = self.calculate_avg_pos([self.particles[p] for p in swarm])
 
             # select only one random winner particle for each swarm
-            winners.append(choice(
+            winners.append(self.rng.pick(
                 # take every 2 particles from swarm only once and get winners
                 [self.tournament([(i, p), (i, p + 1)], swarm_avg_pos)
                  for p in range(len(swarm) % 2, len(swarm), 2)]
             ))
-        return shuffle(winners)
+        return self.rng.shuffled(winners)
 
     def stage_two(self, winners):
         winners_avg_pos = self.calculate_avg_pos(
@@ -58,27 +58,27 @@ class CSO(MultiSO):
             self.tournament(bests, winners_avg_pos)
 
     def tournament(self, idx_particles: list, avg_swarm_pos: list) -> tuple:
-        # sort ascending indexes by calculated function value
+        # sort ascending indexes by cached function value
         ordered = OrderedDict(sorted(
             {i: self.get_particle(*i) for i in idx_particles}.items(),
-            key=lambda kv: self.opt_fun(kv[1]['x'])
+            key=lambda kv: kv[1]['y']
         ))
         # assign particles to w and los (these are not copies!)
         w, los = ordered.values()
 
-        def count_xv(x_w, x_l, v_l, avg_pos):
-            v_l = uniform(0, 1) * v_l \
-                  + uniform(0, 1) * (x_w - x_l) \
-                  + 0.3 * uniform(0, 1) * (avg_pos - x_l)
-            return v_l + x_l, v_l
+        def count_xv(x_w, x_l, v_l, avg_pos, r1, r2, r3):
+            v_l = r1 * v_l \
+                  + r2 * (x_w - x_l) \
+                  + 0.3 * r3 * (avg_pos - x_l)
+            return self.handle_boundary(v_l + x_l, v_l)
 
-        # compute new position and v for loser
-        xv = list(map(count_xv, w['x'], los['x'], los['v'], avg_swarm_pos))
+        # compute new bounced position and v for loser
+        xv = list(map(count_xv, w['x'], los['x'], los['v'], avg_swarm_pos,
+                      *self.rng.random((3, self.dimensions)).tolist()))
         # rotate matrix to extract x_l and v_l in vectors
-        vector_x_l, los['v'] = list(zip(*xv))
-
-        # perform map to get full vector of bounced positions and save them
-        los['x'] = list(map(self.bounce, vector_x_l))
+        vector_x_l, vector_v_l = list(zip(*xv))
+        los['x'], los['v'] = list(vector_x_l), list(vector_v_l)
+        self.moved.append(los)
 
         # return indexes of winner
         return next(iter(ordered))
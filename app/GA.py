@@ -13,28 +13,41 @@ class GA:
             raise Exception(f'Given dimension is out of boundaries: '
                             f'{dimension} not in {opt_function.dimension_constraints}')
 
+        # fitness_batch_size: solutions evaluated in one batch, whole population by default
+        # (None or 1 evaluates one solution at a time)
+        parameters = {
+            'num_parents_mating': 2,
+            'sol_per_pop': 50,
+            'parent_selection_type': 'sss',
+            'keep_parents': 1,
+            'crossover_type': 'single_point',
+            'mutation_type': 'random',
+            'mutation_percent_genes': 5,
+            'mutation_by_replacement': True
+        }
+        # given kwargs override defaults
+        parameters.update(kwargs)
+        parameters.setdefault('fitness_batch_size', parameters['sol_per_pop'])
+
         def fitness_func(solution, _):
             output = opt_function(solution)
             fitness = -output
             return fitness
 
+        def batch_fitness_func(solutions, _):
+            # (batch, D) array of solutions at once
+            return (-opt_function.batch(solutions)).tolist()
+
+        batched = parameters['fitness_batch_size'] not in (None, 1)
         self.ga_instance = pygad.GA(
             num_generations=iterations,
-            num_parents_mating=kwargs.get('num_parents_mating', 2),
             num_genes=dimension,
-            sol_per_pop=kwargs.get('sol_per_pop', 50),
             init_range_low=opt_function.x_range[0],
             init_range_high=opt_function.x_range[1],
-            parent_selection_type=kwargs.get('parent_selection_type', 'sss'),
-            keep_parents=kwargs.get('keep_parents', 1),
-            crossover_type=kwargs.get('crossover_type', 'single_point'),
-            mutation_type=kwargs.get('mutation_type', 'random'),
-            mutation_percent_genes=kwargs.get('mutation_percent_genes', 5),
-            fitness_func=fitness_func,
-            mutation_by_replacement=True,
+            fitness_func=batch_fitness_func if batched else fitness_func,
             random_mutation_min_val=opt_function.x_range[0],
             random_mutation_max_val=opt_function.x_range[1],
-            **kwargs
+            **parameters
         )
         self.opt_function = opt_function
 
@@ -42,5 +55,6 @@ class GA:
         self.ga_instance.run()
 
     def best_solution(self):
-        solution, _, _ = self.ga_instance.best_solution()
+        # fitness of last generation is not computed again
+        solution, _, _ = self.ga_instance.best_solution(self.ga_instance.last_generation_fitness)
         return solution, self.opt_function(solution)
@@ -1,89 +1,127 @@
-from random import uniform, random
-import random
+import numpy as np
 
-from app.SO import SO
-from app.utils import bounce, levy_flight
+from app.migration import LocalBestMigration
+from app.SO import SO, MAX_FLOAT
+from app.utils import LevyFlight
 
 
-def call_w(w):
-    """if 'w' looks like [*args] call uniform with args"""
-    if isinstance(w, (tuple, list)):
-        return uniform(*w)
-    return w
-
-
-class GLPSO(SO):
+class GLPSO(LocalBestMigration, SO):
 
     def __init__(self, population, dimension, opt_function, pm, levy=False, **kwargs):
-        super().__init__(population, dimension, opt_function)
+        super().__init__(population, dimension, opt_function, **kwargs)
 
         self.particles = {}
         self.exemplars = {}
         self.offsprings = {}
+        # 0: offsprings and exemplars are asked, 1: new positions of particles are asked
+        self.phase = 0
+        # coefficients of particle moves drawn in first phase
+        self.moves = []
 
         self.w_v = kwargs.get('w_v', 0.729)
         self.w_l = kwargs.get('w_l', 1.494)
         self.w_g = kwargs.get('w_g', 1.494)
         self.pm = pm
 
-        self.levy_or_not = lambda v: levy_flight(v) if levy else v
+        self.levy = levy
+        self.levy_probability = kwargs.get('levy_probability', 0.02)
+        self.levy_scale = kwargs.get('levy_scale', 1.0)
+        self.levy_flight = None
 
         self.reset()
 
-    def step(self) -> float:
-        i = 0
-        for pn in self.particles:
+    def draw_blocks(self):
+        """random numbers for every particle and dimension needed in one step"""
+        shape = (self.population, self.dimensions)
+        mutated = self.rng.random(shape) < self.pm
+        return tuple(block.tolist() for block in (
+            # partners, crossover and mutation
+            self.rng.integers(0, self.population, shape),
+            self.rng.random(shape),
+            mutated,
+            self.rng.uniform(*self.opt_fun.x_range, shape),
+            self.rng.uniform(-10, 10, shape),
+            # exemplar
+            self.rng.coefficients(self.w_l, shape) * self.rng.random(shape),
+            self.rng.coefficients(self.w_g, shape) * self.rng.random(shape),
+            # velocity
+            np.broadcast_to(self.rng.coefficients(self.w_v, shape), shape),
+            (self.rng.coefficients(self.w_l, shape) + self.rng.coefficients(self.w_g, shape)) / 2
+            * self.rng.random(shape)
+        ))
+
+    def ask(self) -> np.ndarray:
+        # second phase: particles follow selected exemplars
+        if self.phase == 1:
+            # levy flight multipliers of velocity, velocity is not multiplied without levy
+            flights = self.levy_flight.multipliers((self.population, self.dimensions)).tolist() if self.levy \
+                else [None] * self.population
+            for pn, exemplar, (c_v, c_lg), flight in zip(self.particles, self.exemplars, self.moves, flights):
+                for d in range(self.dimensions):
+                    # Calculate new velocity
+                    v = c_v[d] * pn['v'][d] + c_lg[d] * (exemplar['x'][d] - pn['x'][d])
+
+                    if flight is not None:
+                        v_new = flight[d] * v
+                    else:
+                        v_new = v
+
+                    # Check for edge and change position
+                    pn['x'][d], pn['v'][d] = self.handle_boundary(pn['x'][d] + v, v_new)
+            return np.array([pn['x'] for pn in self.particles])
+
+        # first phase: offsprings and exemplars
+        blocks = zip(self.particles, self.offsprings, self.exemplars, *self.draw_blocks())
+        self.moves = []
+        for i, (pn, offspring, exemplar, partners, rd, mutated, x_mutated, v_mutated,
+                c1_r1, c2_r2, c_v, c_lg) in enumerate(blocks):
             for d in range(self.dimensions):
                 # Losowo wybierz cząstkę
-                p2 = self.particles[random.randint(0, len(self.particles)-1)]
-                # Krzyżowanie
-                if self.opt_fun(pn['best_local']) < self.opt_fun(p2['best_local']):
-                    rd = uniform(0, 1)
-                    self.offsprings[i]['x'][d] = rd * pn['best_local'][d] + (1 - rd) * self.best_global[d]
+                p2 = self.particles[partners[d]]
+                # Krzyżowanie (porównanie zapamiętanych wartości best_local)
+                if pn['y_best'] < p2['y_best']:
+                    offspring['x'][d] = rd[d] * pn['best_local'][d] + (1 - rd[d]) * self.best_global[d]
                 else:
-                    self.offsprings[i]['x'][d] = p2['best_local'][d]
+                    offspring['x'][d] = p2['best_local'][d]
                 # Mutacja
             for d in range(self.dimensions):
-                if uniform(0, 1) < self.pm:
-                    self.offsprings[i]['x'][d] = uniform(self.opt_fun.x_range[0], self.opt_fun.x_range[1])
-                    self.offsprings[i]['v'][d] = uniform(-10, 10)
+                if mutated[d]:
+                    offspring['x'][d] = x_mutated[d]
+                    offspring['v'][d] = v_mutated[d]
                 # Oblicz exemplar
             for d in range(self.dimensions):
-                self.exemplars[i]['x'][d] = self.calculate_exemplar(i, d)
-                # Selekcja
-            if self.opt_fun(self.offsprings[i]['x']) < self.opt_fun(self.exemplars[i]['x']):
-                self.exemplars[i]['x'] = self.offsprings[i]['x']
-                # Update cząstek
-            for d in range(self.dimensions):
-                # Calculate new velocity
-                v = call_w(self.w_v) * pn['v'][d] \
-                    + (call_w(self.w_l) + call_w(self.w_g)) / 2 * uniform(0, 1) \
-                    * (self.exemplars[i]['x'][d] - pn['x'][d])
-                pn['v'][d] = self.levy_or_not(v)
-
-                # Check for edge and change position
-                pn['x'][d] = bounce(pn['x'][d] + v, self.opt_fun.x_range)
-
-            # Calculate new value
-            f_value = self.opt_fun(pn['x'])
-
+                exemplar['x'][d] = self.calculate_exemplar(i, d, c1_r1[d], c2_r2[d])
+            self.moves.append((c_v, c_lg))
+        return np.array([o['x'] for o in self.offsprings] + [e['x'] for e in self.exemplars])
+
+    def tell(self, values) -> bool:
+        values = np.asarray(values).tolist()
+        if self.phase == 0:
+            # Selekcja
+            for offspring, exemplar, y_offspring, y_exemplar in zip(
+                    self.offsprings, self.exemplars, values[:self.population], values[self.population:]):
+                offspring['y'], exemplar['y'] = y_offspring, y_exemplar
+                if offspring['y'] < exemplar['y']:
+                    exemplar['x'] = offspring['x'].copy()
+                    exemplar['y'] = offspring['y']
+            self.phase = 1
+            return False
+
+        for pn, f_value in zip(self.particles, values):
             # Check if value is new global minimum
             if f_value < self.y:
                 self.best_global = pn['x'].copy()
                 self.y = f_value
 
             # Check if value is new local minimum
-            if f_value < self.opt_fun(pn['best_local']):
+            if f_value < pn['y_best']:
                 pn['best_local'] = pn['x'].copy()
+                pn['y_best'] = f_value
+        self.phase = 0
+        return True
 
-        return self.y
-
-    def calculate_exemplar(self, i, d):
-        c1 = call_w(self.w_l)
-        c2 = call_w(self.w_g)
-        r1 = uniform(0, 1)
-        r2 = uniform(0, 1)
-        return (c1 * r1 * self.particles[i]['best_local'][d] + c2 * r2 * self.best_global[d]) / (c1 * r1 + c2 * r2)
+    def calculate_exemplar(self, i, d, c1_r1, c2_r2):
+        return (c1_r1 * self.particles[i]['best_local'][d] + c2_r2 * self.best_global[d]) / (c1_r1 + c2_r2)
 
     def evaluate(self, iterations=None, *args, **kwargs):
         return super().evaluate(self.step, iterations)
@@ -91,26 +129,36 @@ class GLPSO(SO):
     def reset(self):
         super().reset()
 
+        self.levy_flight = LevyFlight(self.rng, self.levy_probability, self.levy_scale)
+        self.phase = 0
+        self.moves = []
+
         self.particles = [{
             'v': [0] * self.dimensions,
             # actual position of particle in dimension
-            'x': [uniform(*self.opt_fun.x_range) for _ in range(self.dimensions)]
-        } for _ in range(self.population)]
+            'x': x
+        } for x in self.rng.uniform(*self.opt_fun.x_range, (self.population, self.dimensions)).tolist()]
 
         self.offsprings = [{
             'v': [0] * self.dimensions,
             # actual position of particle in dimension
-            'x': [uniform(*self.opt_fun.x_range) for _ in range(self.dimensions)]
-        } for _ in range(self.population)]
+            'x': x,
+            # cached value of x, computed in step
+            'y': MAX_FLOAT
+        } for x in self.rng.uniform(*self.opt_fun.x_range, (self.population, self.dimensions)).tolist()]
 
         self.exemplars = [{
             'v': [0] * self.dimensions,
             # actual position of particle in dimension
-            'x': [uniform(*self.opt_fun.x_range) for _ in range(self.dimensions)]
-        } for _ in range(self.population)]
-
-        # local max
-        for p in self.particles:
+            'x': x,
+            # cached value of x, computed in step
+            'y': MAX_FLOAT
+        } for x in self.rng.uniform(*self.opt_fun.x_range, (self.population, self.dimensions)).tolist()]
+
+        # local max with its cached value
+        y_best = self.evaluate_batch([p['x'] for p in self.particles])
+        for p, y in zip(self.particles, y_best):
             p['best_local'] = p['x'].copy()
+            p['y_best'] = float(y)
         # global max
         self.best_global = self.particles[0]['x'].copy()
@@ -0,0 +1,235 @@
+import multiprocessing
+
+import numpy as np
+
+from app.SO import SO, MODEL_ONLY_KWARGS
+from app.random_stream import spawn_seeds
+
+
+def migration_sources(topology, no_islands, rng) -> list:
+    """for every island, list of islands sending it their emigrants"""
+    if topology == 'ring':
+        return [[(i - 1) % no_islands] for i in range(no_islands)]
+    elif topology == 'full':
+        return [[j for j in range(no_islands) if j != i] for i in range(no_islands)]
+    elif topology == 'random':
+        # one random island other than itself
+        shifts = rng.integers(1, no_islands, no_islands) if no_islands > 1 else np.zeros(1, dtype=int)
+        return [[(i + shift) % no_islands] for i, shift in enumerate(shifts.tolist())]
+    raise Exception(f'Migration topology {topology} not recognised, '
+                    f"expected one of ('ring', 'full', 'random')")
+
+
+def run_epoch(island: SO, immigrants, iterations, migrants, evaluate_kwargs) -> tuple:
+    """
+    Accepts immigrants, runs island for given iterations
+    :return: y-s of iterations, island best (x, y), its emigrants and number of evaluations
+    """
+    if immigrants is not None:
+        island.immigrate(*immigrants)
+    island.evaluate(iterations, **evaluate_kwargs)
+    return island.logs['y'], (np.asarray(island.best_global), island.y), island.emigrants(migrants), \
+        island.evaluations
+
+
+def island_worker(connection):
+    """keeps one island in worker process and runs its epochs until None is received"""
+    island = None
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+        command, payload = message
+        if command == 'island':
+            island = payload
+            connection.send(None)
+        elif command == 'get':
+            connection.send(island)
+        else:
+            connection.send(run_epoch(island, *payload))
+    connection.close()
+
+
+class IslandModel(SO):
+    """
+    Population split into islands, each one an independent optimizer (PSO, GLPSO, CSO, LCSO
+    or their array versions) running in its own worker process. Islands synchronise only
+    every migration_interval iterations, when their best particles migrate along topology
+    and replace the worst particles of receiving islands.
+    """
+
+    def __init__(self, population, dimension, opt_function, island_class, no_islands,
+                 migration_interval=10, migrants=1, topology='ring', processes=True, **kwargs):
+        super().__init__(population, dimension, opt_function, **kwargs)
+        if no_islands < 1 or population < no_islands:
+            raise Exception(f'Number of islands should be between 1 and population, '
+                            f'got islands: {no_islands}, pop: {population}')
+        if not isinstance(migration_interval, int) or migration_interval < 1:
+            raise Exception(f'Migration interval should be positive integer, got {migration_interval}')
+        # fail early on unknown topology
+        migration_sources(topology, no_islands, self.rng)
+        if self.refinement is not None:
+            raise Exception('Refinement is not supported by island model')
+
+        self.island_class = island_class
+        self.no_islands = no_islands
+        self.migration_interval = migration_interval
+        self.migrants = migrants
+        self.topology = topology
+        self.processes = processes
+        # parameters of every island, e.g. w_v, pm or no_swarms; islands get own seeds and evaluators
+        # and are saved in checkpoints of the model
+        self.island_kwargs = {k: v for k, v in kwargs.items() if k not in MODEL_ONLY_KWARGS}
+        # islands may not be equal in size
+        self.island_sizes = [population // no_islands + (i < population % no_islands)
+                             for i in range(no_islands)]
+
+        self.islands = []
+        # (connection, process) of every island in process mode, started on first epoch
+        self.workers = []
+        # workers keep current islands, otherwise islands of the model are current
+        self.islands_sent = False
+        # emigrants waiting to join every island at start of next epoch
+        self.immigrants = []
+        # best y of all islands in every iteration
+        self.trace = []
+        self.evaluate_kwargs = {}
+
+        self.reset()
+
+    def reset(self):
+        super().reset()
+
+        # islands are independent streams derived from seed of the model
+        self.islands = [
+            self.island_class(size, self.dimensions, self.opt_fun, seed=seed, **self.island_kwargs)
+            for size, seed in zip(self.island_sizes, spawn_seeds(self.rng.seed, self.no_islands))
+        ]
+        self.immigrants = [None] * self.no_islands
+        self.trace = []
+        self.evaluations = sum(island.evaluations for island in self.islands)
+
+        # global max from evaluated starting particles
+        xs, ys = zip(*(island.emigrants(1) for island in self.islands))
+        best = int(np.argmin([y[0] for y in ys]))
+        self.y = float(ys[best][0])
+        self.best_global = xs[best][0].copy()
+        # new islands are sent to workers with the next epoch
+        self.islands_sent = False
+
+    def send_islands(self):
+        """places islands in worker processes, workers are started on first call"""
+        self.start_workers()
+        for (connection, _), island in zip(self.workers, self.islands):
+            connection.send(('island', island))
+        for connection, _ in self.workers:
+            connection.recv()
+        self.islands_sent = True
+
+    def checkpoint_state(self) -> dict:
+        if self.islands_sent:
+            # current islands live in worker processes
+            for connection, _ in self.workers:
+                connection.send(('get', None))
+            self.islands = [connection.recv() for connection, _ in self.workers]
+        state = super().checkpoint_state()
+        state.pop('workers')
+        state.pop('islands_sent')
+        # islands without their configuration, e.g. function
+        state['islands'] = [island.checkpoint_state() for island in self.islands]
+        return state
+
+    def restore_state(self, state: dict):
+        state = state.copy()
+        island_states = state.pop('islands')
+        super().restore_state(state)
+        for island, island_state in zip(self.islands, island_states):
+            island.restore_state(island_state)
+        self.islands_sent = False
+
+    def start_workers(self):
+        if self.workers:
+            return
+        for _ in range(self.no_islands):
+            connection, worker_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=island_worker, args=(worker_connection,), daemon=True)
+            process.start()
+            self.workers.append((connection, process))
+
+    def run_islands(self) -> list:
+        payloads = [(immigrants, self.migration_interval, self.migrants, self.evaluate_kwargs)
+                    for immigrants in self.immigrants]
+        if not self.processes:
+            return [run_epoch(island, *payload) for island, payload in zip(self.islands, payloads)]
+
+        if not self.islands_sent:
+            self.send_islands()
+        # islands run in parallel, results are collected in order
+        for (connection, _), payload in zip(self.workers, payloads):
+            connection.send(('epoch', payload))
+        return [connection.recv() for connection, _ in self.workers]
+
+    def migrate(self, emigrants):
+        self.immigrants = [None] * self.no_islands
+        if self.migrants < 1 or self.no_islands < 2:
+            return
+        for i, sources in enumerate(migration_sources(self.topology, self.no_islands, self.rng)):
+            xs = np.concatenate([emigrants[j][0] for j in sources])
+            ys = np.concatenate([emigrants[j][1] for j in sources])
+            # best immigrants first, no more than island can take
+            order = np.argsort(ys, kind='stable')[:self.island_sizes[i]]
+            self.immigrants[i] = (xs[order], ys[order])
+
+    def step(self) -> float:
+        """one epoch: every island runs migration_interval iterations, then migration"""
+        results = self.run_islands()
+
+        trace = np.min([logs_y for logs_y, _, _, _ in results], axis=0).tolist()
+        if self.keep_history:
+            self.trace.extend(trace)
+        else:
+            self.trace = trace[-1:]
+        for _, (x, y), _, _ in results:
+            if y < self.y:
+                self.y = float(y)
+                self.best_global = x.copy()
+        self.evaluations = sum(evaluations for _, _, _, evaluations in results)
+
+        self.migrate([emigrants for _, _, emigrants, _ in results])
+        return self.y
+
+    def evaluate(self, iterations=None, *args, **kwargs):
+        """
+        :param iterations: iterations of every island, rounded up to whole epochs;
+            if empty, epochs run until stopping criteria of the model (counted in epochs) are met
+        """
+        # e.g. alternative step of PSO
+        self.evaluate_kwargs = kwargs
+        epochs = None if iterations is None else -(-iterations // self.migration_interval)
+        super().evaluate(self.step, epochs)
+
+        self.logs['iterations'] *= self.migration_interval
+        self.logs['y'] = tuple(self.trace)
+        return self.logs['y'][-1]
+
+    def close(self):
+        """stops worker processes of islands, if they were started"""
+        if self.islands_sent:
+            # islands of the model are current again
+            for connection, _ in self.workers:
+                connection.send(('get', None))
+            self.islands = [connection.recv() for connection, _ in self.workers]
+            self.islands_sent = False
+        for connection, process in self.workers:
+            connection.send(None)
+            process.join()
+            connection.close()
+        self.workers = []
+        super().close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # copy starts its own workers
+        state['workers'] = []
+        state['islands_sent'] = False
+        return state
@@ -1,8 +1,9 @@
 from collections import OrderedDict
-from random import uniform, choice
+
+import numpy as np
 
 from app.MultiSO import MultiSO
-from app.utils import shuffle, grouped
+from app.utils import grouped
 
 
 def validate_lcso(init):
@@ -28,23 +29,22 @@ class LCSO(MultiSO):
     def __init__(self, population, dimension, opt_function, no_swarms, **kwargs):
         super().__init__(population, dimension, opt_function, no_swarms, **kwargs)
 
-    def step(self) -> float:
+    def ask(self) -> np.ndarray:
         self.shuffle()
         selected_winners = self.stage_one()
         self.stage_two(selected_winners)
-        self.select_best()
-        return self.y
+        return self.moved_positions()
 
     def stage_one(self):
         winners = []
-        for i, swarm in enumerate(self.particles):
+        for i, swarm in enumerate(self.swarms):
             # select only one random winner particle for each swarm
-            winners.append(choice(
+            winners.append(self.rng.pick(
                 # take every 3 particles from swarm only once and get winners
                 [self.tournament([(i, p), (i, p + 1), (i, p + 2)])
                  for p in range(len(swarm) % 3, len(swarm), 3)]
             ))
-        return shuffle(winners)
+        return self.rng.shuffled(winners)
 
     def stage_two(self, winners):
         # take every 3 particles from swarm only once
@@ -52,31 +52,29 @@ class LCSO(MultiSO):
             self.tournament(bests)
 
     def tournament(self, idx_particles: list) -> tuple:
-        # sort ascending indexes by calculated function value
+        # sort ascending indexes by cached function value
         ordered = OrderedDict(sorted(
             {i: self.get_particle(*i) for i in idx_particles}.items(),
-            key=lambda kv: self.opt_fun(kv[1]['x'])
+            key=lambda kv: kv[1]['y']
         ))
         # assign particles to w, s and los (these are not copies!)
         w, s, los = ordered.values()
 
-        def count_xv(x_w, x_s, x_l, v_s, v_l):
-            v_s = uniform(0, 1) * v_s + uniform(0, 1) * (x_w - x_s)
-            v_l = uniform(0, 1) * v_l \
-                + uniform(0, 1) * (x_w - x_l) \
-                + uniform(0, 1) * (x_s - x_l)
-            return v_s + x_s, v_l + x_l, v_s, v_l
-
-        # compute new position and v for s and loser
-        xv = list(map(count_xv, w['x'], s['x'], los['x'], s['v'], los['v']))
-        # rotate matrix to extract x_s, x_l, v_s and v_l in vectors
-        vector_x_s, vector_x_l, vector_v_s, vector_v_l = list(zip(*xv))
-
-        # perform map to get full vector of x
-        s['x'] = list(map(self.bounce, vector_x_s))
-        los['x'] = list(map(self.bounce, vector_x_l))
-        s['v'] = vector_v_s
-        los['v'] = vector_v_l
+        def count_xv(x_w, x_s, x_l, v_s, v_l, r1, r2, r3, r4, r5):
+            v_s = r1 * v_s + r2 * (x_w - x_s)
+            v_l = r3 * v_l \
+                + r4 * (x_w - x_l) \
+                + r5 * (x_s - x_l)
+            return self.handle_boundary(v_s + x_s, v_s) + self.handle_boundary(v_l + x_l, v_l)
+
+        # compute new bounced position and v for s and loser
+        xv = list(map(count_xv, w['x'], s['x'], los['x'], s['v'], los['v'],
+                      *self.rng.random((5, self.dimensions)).tolist()))
+        # rotate matrix to extract x_s, v_s, x_l and v_l in vectors
+        vector_x_s, vector_v_s, vector_x_l, vector_v_l = list(zip(*xv))
+        s['x'], s['v'] = list(vector_x_s), list(vector_v_s)
+        los['x'], los['v'] = list(vector_x_l), list(vector_v_l)
+        self.moved.extend((s, los))
 
         # return indexes of winner
         return next(iter(ordered))
@@ -1,9 +1,8 @@
 from abc import abstractmethod
-from functools import partial
-from random import uniform, sample
+
+import numpy as np
 
 from app.SO import SO
-from app.utils import bounce, flatten
 
 
 class MultiSO(SO):
@@ -11,11 +10,12 @@ class MultiSO(SO):
     def __init__(self, population, dimension, opt_function, no_swarms, **kwargs):
         super().__init__(population, dimension, opt_function, **kwargs)
         self.particles = []
+        # indexes of particles in every swarm
+        self.swarms = []
+        # particles which changed position since last select_best
+        self.moved = []
         self.no_swarms = no_swarms
 
-        # feed bounce function with constant x_range to speed up computing
-        self.bounce = partial(bounce, x_range=self.opt_fun.x_range)
-
         self.reset()
 
     def reset(self):
@@ -23,33 +23,67 @@ class MultiSO(SO):
 
         # initialises particles splitting them into swarms
         # e.g. [[swarm 0], [swarm 1], ...]; swarms may not be equal in size
-        self.particles = [[{
+        shape = (self.population, self.dimensions)
+        self.particles = [{
             # random velocity at start
-            'v': [uniform(*self.v_init_range) for _ in range(self.dimensions)],
-            'x': [uniform(*self.opt_fun.x_range) for _ in range(self.dimensions)]
-        } for _ in range(swarm, self.population, self.no_swarms)]
-            for swarm in range(self.no_swarms)]
+            'v': v,
+            'x': x
+        } for v, x in zip(
+            self.rng.uniform(*self.v_init_range, shape).tolist(),
+            self.rng.uniform(*self.opt_fun.x_range, shape).tolist()
+        )]
+        self.swarms = [list(range(swarm, self.population, self.no_swarms))
+                       for swarm in range(self.no_swarms)]
+
+        # cached values of positions
+        for p, y in zip(self.particles, self.evaluate_batch([p['x'] for p in self.particles])):
+            p['y'] = float(y)
+        self.moved = []
 
         # global max
-        self.best_global = self.particles[0][0]['x'].copy()
+        best = min(self.particles, key=lambda p: p['y'])
+        self.y = best['y']
+        self.best_global = best['x'].copy()
 
     def get_particle(self, swarm_idx, particle_idx):
-        return self.particles[swarm_idx][particle_idx]
+        return self.particles[self.swarms[swarm_idx][particle_idx]]
+
+    def moved_positions(self) -> np.ndarray:
+        """positions of particles moved in this iteration, to be told by their values"""
+        return np.array([p['x'] for p in self.moved]).reshape(-1, self.dimensions)
+
+    def tell(self, values) -> bool:
+        # only moved particles need new values, the rest keeps cached ones
+        if self.moved:
+            for p, y in zip(self.moved, np.asarray(values).tolist()):
+                p['y'] = y
+            # find moved particle with minimal value of optimisation function
+            best = min(self.moved, key=lambda p: p['y'])
+            if best['y'] < self.y:
+                self.y = best['y']
+                self.best_global = best['x'].copy()
+        self.moved = []
+        return True
+
+    def emigrants(self, k) -> tuple:
+        best = sorted(self.particles, key=lambda p: p['y'])[:k]
+        return np.array([p['x'] for p in best]), np.array([p['y'] for p in best])
 
-    def select_best(self):
-        flattened = flatten(self.particles)
-        computed = {i: self.opt_fun(p['x']) for i, p in enumerate(flattened)}
-        # find particle with minimal value of optimisation function
-        best_particle_idx = min(computed, key=computed.get)
-        self.y = computed[best_particle_idx]
-        self.best_global = flattened[best_particle_idx]['x']
+    def immigrate(self, xs, ys):
+        worst = sorted(self.particles, key=lambda p: p['y'], reverse=True)
+        for p, x, y in zip(worst, np.asarray(xs).tolist(), np.asarray(ys).tolist()):
+            p['x'], p['y'] = x, y
+            p['v'] = [0] * self.dimensions
+            if y < self.y:
+                self.y = y
+                self.best_global = x.copy()
 
     def shuffle(self):
-        self.particles = [sample(self.particles[i], k=len(self.particles[i]))
-                          for i in range(self.no_swarms)]
+        for swarm in self.swarms:
+            self.rng.shuffle(swarm)
 
     @abstractmethod
-    def step(self) -> float:
+    def ask(self) -> np.ndarray:
         pass
 
     def evaluate(self, iterations: int = None, *args, **kwargs):
@@ -1,92 +1,81 @@
-from random import uniform
+import numpy as np
 
+from app.migration import LocalBestMigration
 from app.SO import SO
-from app.utils import bounce
 
 
-def call_w(w):
-    """if 'w' looks like [*args] call uniform with args"""
-    if isinstance(w, (tuple, list)):
-        return uniform(*w)
-    return w
-
-
-class PSO(SO):
+class PSO(LocalBestMigration, SO):
 
     def __init__(self, population, dimension, opt_function, **kwargs):
-        super().__init__(population, dimension, opt_function)
+        super().__init__(population, dimension, opt_function, **kwargs)
 
         self.particles = {}
 
         self.w_v = kwargs.get('w_v', 0.729)
         self.w_l = kwargs.get('w_l', 1.494)
         self.w_g = kwargs.get('w_g', 1.494)
+        # alternative: particles are attracted by average distance to global best
+        self.alternative = kwargs.get('alternative', False)
 
         self.reset()
 
-    def step(self) -> float:
-        for pn in self.particles:
+    def draw_coefficients(self):
+        """blocks of w_v, w_l * r_l and w_g * r_g for every particle and dimension"""
+        shape = (self.population, self.dimensions)
+        return (
+            np.broadcast_to(self.rng.coefficients(self.w_v, shape), shape).tolist(),
+            (self.rng.coefficients(self.w_l, shape) * self.rng.random(shape)).tolist(),
+            (self.rng.coefficients(self.w_g, shape) * self.rng.random(shape)).tolist()
+        )
+
+    def ask(self) -> np.ndarray:
+        if self.alternative:
+            # average distance from particles to global best in each dimension
+            avg_diff = [0] * self.dimensions
             for d in range(self.dimensions):
-                # Calculate new velocity
-                v = call_w(self.w_v) * pn['v'][d] \
-                    + call_w(self.w_l) * uniform(0, 1) * (pn['best_local'][d] - pn['x'][d]) \
-                    + call_w(self.w_g) * uniform(0, 1) * (self.best_global[d] - pn['x'][d])
-                pn['v'][d] = v
-
-                # Check for edge and change position
-                pn['x'][d] = bounce(pn['x'][d] + v, self.opt_fun.x_range)
-
-            # Calculate new value
-            f_value = self.opt_fun(pn['x'])
-
-            # Check if value is new global minimum
-            if f_value < self.y:
-                self.best_global = pn['x'].copy()
-                self.y = f_value
-
-            # Check if value is new local minimum
-            if f_value < self.opt_fun(pn['best_local']):
-                pn['best_local'] = pn['x'].copy()
-
-        return self.y
-
-    def alt_step(self) -> float:
-        avg_diff = [0] * self.dimensions
-        for d in range(self.dimensions):
-            for pn in self.particles:
-                avg_diff[d] += self.best_global[d] - pn['x'][d]
-            avg_diff[d] /= len(self.particles)
+                for pn in self.particles:
+                    avg_diff[d] += self.best_global[d] - pn['x'][d]
+                avg_diff[d] /= len(self.particles)
+            attractor = avg_diff
+        else:
+            attractor = self.best_global
 
-        for pn in self.particles:
+        for pn, c_v, c_l, c_g in zip(self.particles, *self.draw_coefficients()):
             for d in range(self.dimensions):
                 # Calculate new velocity
-                v = call_w(self.w_v) * pn['v'][d] \
-                    + call_w(self.w_l) * uniform(0, 1) * (pn['best_local'][d] - pn['x'][d]) \
-                    + call_w(self.w_g) * uniform(0, 1) * (avg_diff[d] - pn['x'][d])
-                pn['v'][d] = v
+                v = c_v[d] * pn['v'][d] \
+                    + c_l[d] * (pn['best_local'][d] - pn['x'][d]) \
+                    + c_g[d] * (attractor[d] - pn['x'][d])
 
                 # Check for edge and change position
-                pn['x'][d] = bounce(pn['x'][d] + v, self.opt_fun.x_range)
+                pn['x'][d], pn['v'][d] = self.handle_boundary(pn['x'][d] + v, v)
 
-            # Calculate new value
-            f_value = self.opt_fun(pn['x'])
+        return np.array([pn['x'] for pn in self.particles])
 
+    def tell(self, values) -> bool:
+        for pn, f_value in zip(self.particles, np.asarray(values).tolist()):
             # Check if value is new global minimum
             if f_value < self.y:
                 self.best_global = pn['x'].copy()
                 self.y = f_value
 
             # Check if value is new local minimum
-            if f_value < self.opt_fun(pn['best_local']):
+            if f_value < pn['y_best']:
                 pn['best_local'] = pn['x'].copy()
+                pn['y_best'] = f_value
+        return True
 
-        return self.y
+    def alt_step(self) -> float:
+        """one iteration of alternative variant, variant of swarm is not changed"""
+        alternative, self.alternative = self.alternative, True
+        try:
+            return self.step()
+        finally:
+            self.alternative = alternative
 
     def evaluate(self, iterations=None, alternative=False, *args, **kwargs):
-        if alternative:
-            return super().evaluate(self.alt_step, iterations)
-        else:
-            return super().evaluate(self.step, iterations)
+        self.alternative = alternative
+        return super().evaluate(self.step, iterations)
 
     def reset(self):
         super().reset()
@@ -94,11 +83,13 @@ class PSO(SO):
         self.particles = [{
             'v': [0] * self.dimensions,
             # actual position of particle in dimension
-            'x': [uniform(*self.opt_fun.x_range) for _ in range(self.dimensions)]
-        } for _ in range(self.population)]
+            'x': x
+        } for x in self.rng.uniform(*self.opt_fun.x_range, (self.population, self.dimensions)).tolist()]
 
-        # local max
-        for p in self.particles:
+        # local max with its cached value
+        y_best = self.evaluate_batch([p['x'] for p in self.particles])
+        for p, y in zip(self.particles, y_best):
             p['best_local'] = p['x'].copy()
+            p['y_best'] = float(y)
         # global max
         self.best_global = self.particles[0]['x'].copy()
@@ -0,0 +1,144 @@
+from app.SO import SO, MODEL_ONLY_KWARGS
+from app.stopping import StoppingCriterion, Stagnation
+
+
+class RestartsExhausted(StoppingCriterion):
+    """optimizer stagnated after its last allowed restart"""
+    name = 'restarts'
+
+    def __call__(self, so, iteration, y_prev) -> bool:
+        return so.exhausted
+
+
+class RestartModel(SO):
+    """
+    Runs optimizer of so_class (PSO, GLPSO, CSO, LCSO, BA or their array versions) and restarts it
+    with new particles whenever its y does not improve by more than tolerance for 'stagnation'
+    iterations (IPOP-style: population grows by population_factor with every restart, up to
+    max_population). Best solution of all runs is kept, evaluations of all runs are counted
+    together and every restart is recorded in logs['restarts'].
+    """
+
+    def __init__(self, population, dimension, opt_function, so_class, stagnation=50, tolerance=0.0,
+                 population_factor=2.0, max_population=None, max_restarts=None, **kwargs):
+        super().__init__(population, dimension, opt_function, **kwargs)
+        if not isinstance(stagnation, int) or stagnation < 1:
+            raise Exception(f'Stagnation should be positive integer, got {stagnation}')
+        if population_factor < 1:
+            raise Exception(f'Population factor should be at least 1, got {population_factor}')
+
+        self.so_class = so_class
+        self.stagnation = stagnation
+        self.tolerance = tolerance
+        self.population_factor = population_factor
+        self.max_population = max_population
+        self.max_restarts = max_restarts
+        self.initial_population = population
+        # parameters of restarted optimizers, e.g. w_v, pm or no_swarms; they share evaluator of the model
+        self.so_kwargs = {k: v for k, v in kwargs.items() if k not in MODEL_ONLY_KWARGS}
+        self.evaluate_kwargs = {}
+
+        self.so = None
+        # iterations of current optimizer without improvement
+        self.stalled = 0
+        # no restarts left and current optimizer stagnated
+        self.exhausted = False
+        self.restarts = []
+        self.t = 0
+
+        self.reset()
+
+    def create_so(self, population, seed) -> SO:
+        so = self.so_class(population, self.dimensions, self.opt_fun, evaluator=self.evaluator,
+                           seed=seed, **self.so_kwargs)
+        # e.g. alternative step of PSO
+        for name, value in self.evaluate_kwargs.items():
+            setattr(so, name, value)
+        return so
+
+    def start(self, population):
+        """new optimizer, its starting particles are counted in evaluations"""
+        self.population = population
+        # every optimizer gets seed drawn from stream of the model
+        self.so = self.create_so(population, int(self.rng.integers(2 ** 63)))
+        self.evaluations += self.so.evaluations
+        self.stalled = 0
+        self.update_best()
+
+    def update_best(self):
+        if self.so.y < self.y:
+            self.y = self.so.y
+            self.best_global = list(self.so.best_global)
+
+    def reset(self):
+        super().reset()
+        self.restarts = []
+        self.exhausted = False
+        self.t = 0
+        self.start(self.initial_population)
+
+    def restart(self):
+        population = int(self.population * self.population_factor)
+        if self.max_population is not None:
+            population = min(population, self.max_population)
+        self.restarts.append({
+            'iteration': self.t,
+            'evaluations': self.evaluations,
+            'population': population,
+            'y': self.y,
+            'y_run': self.so.y
+        })
+        self.start(population)
+
+    def step(self) -> float:
+        """one iteration of current optimizer, restart if it stagnated"""
+        self.t += 1
+        evaluations, y = self.so.evaluations, self.so.y
+        self.so.step()
+        self.evaluations += self.so.evaluations - evaluations
+        self.stalled = self.stalled + 1 if y - self.so.y <= self.tolerance else 0
+        self.update_best()
+
+        if self.stalled >= self.stagnation:
+            if self.max_restarts is not None and len(self.restarts) >= self.max_restarts:
+                self.exhausted = True
+            else:
+                self.restart()
+        return self.y
+
+    def emigrants(self, k) -> tuple:
+        return self.so.emigrants(k)
+
+    def immigrate(self, xs, ys):
+        self.so.immigrate(xs, ys)
+        self.update_best()
+
+    def stopping_criteria(self, iterations=None) -> list:
+        """criteria of SO, in accuracy mode restarts take place of stagnation"""
+        criteria = super().stopping_criteria(iterations)
+        if iterations is None and not self.stopping:
+            criteria = [criterion for criterion in criteria if not isinstance(criterion, Stagnation)]
+        return criteria + [RestartsExhausted()]
+
+    def checkpoint_state(self) -> dict:
+        state = super().checkpoint_state()
+        # current optimizer without its configuration, e.g. function
+        state['so'] = self.so.checkpoint_state()
+        return state
+
+    def restore_state(self, state: dict):
+        state = state.copy()
+        so_state = state.pop('so')
+        super().restore_state(state)
+        # random stream of optimizer is restored with its state
+        self.so = self.create_so(self.population, None)
+        self.so.restore_state(so_state)
+
+    def evaluate(self, iterations=None, *args, **kwargs):
+        self.evaluate_kwargs = kwargs
+        for name, value in kwargs.items():
+            setattr(self.so, name, value)
+        super().evaluate(self.step, iterations)
+
+        self.logs['restarts'] = list(self.restarts)
+        return self.logs['y'][-1]
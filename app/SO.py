@@ -1,9 +1,25 @@
-import math
+import os
+import pickle
+import time
 from collections.abc import Callable
 
+import numpy as np
+
+from app.boundaries import boundary_switcher
+from app.evaluators import SerialEvaluator
 from app.optimization_functions import OptimizationFunction
+from app.random_stream import RandomStream
+from app.refinement import refinement_switcher
+from app.stopping import stopping_switcher, Accuracy, MaxEvaluations, MaxIterations, MaxTime, Stagnation
 
 MAX_FLOAT = float('inf')
+# upper limit of iterations in accuracy mode
+MAX_ITERATIONS = 10000
+# attributes set up by user, not saved in checkpoints
+CONFIGURATION = ('opt_fun', 'evaluator', 'checkpoint', 'checkpoint_interval', 'checkpoint_config', 'stopping',
+                 'telemetry', 'keep_history', 'run', 'refinement')
+# kwargs of models (IslandModel, RestartModel) not passed to optimizers they run
+MODEL_ONLY_KWARGS = CONFIGURATION + ('seed',)
 
 
 class SO:
@@ -30,41 +46,214 @@ class SO:
             (-velocity_magnitude, velocity_magnitude)
         ))
 
+        # source of all random numbers, seed is drawn if not given
+        self.rng = RandomStream(kwargs.get('seed', None))
+        # strategy for particles leaving x_range, see app.boundaries
+        self.boundary_handler = boundary_switcher(kwargs.get('boundary', 'reflect'))
+        self.boundary_handler_scalar = boundary_switcher(kwargs.get('boundary', 'reflect'), scalar=True)
+        # evaluates batches of positions, see app.evaluators
+        self.evaluator = kwargs.get('evaluator', None) or SerialEvaluator()
+        # file with state of unfinished evaluate, saved every checkpoint_interval iterations
+        self.checkpoint = kwargs.get('checkpoint', None)
+        self.checkpoint_interval = kwargs.get('checkpoint_interval', 100)
+        # hash of configuration checkpoint belongs to, checkpoint of other one is discarded
+        self.checkpoint_config = kwargs.get('checkpoint_config', None)
+        # extra stopping criteria, see app.stopping
+        self.stopping = kwargs.get('stopping', None)
+        # callable getting record of every iteration, e.g. sink from app.telemetry
+        self.telemetry = kwargs.get('telemetry', None)
+        # name of run in telemetry records
+        self.run = kwargs.get('run', None)
+        # keep y of every iteration in logs['y'], otherwise only the last one
+        self.keep_history = kwargs.get('keep_history', True)
+        # local search from best positions, see app.refinement
+        self.refinement = refinement_switcher(kwargs.get('refinement', None))
+        # number of evaluated positions since reset
+        self.evaluations = 0
+
         self.logs = {}
 
+    def handle_boundaries(self, x, v):
+        """returns new positions x and velocities v (arrays) fixed by boundary strategy"""
+        return self.boundary_handler(
+            np.asarray(x, dtype=float),
+            None if v is None else np.asarray(v, dtype=float),
+            self.opt_fun.x_range,
+            self.rng
+        )
+
+    def handle_boundary(self, x, v):
+        """returns new coordinate x and its velocity v (floats) fixed by boundary strategy"""
+        return self.boundary_handler_scalar(x, v, self.opt_fun.x_range, self.rng)
+
+    def evaluate_batch(self, positions) -> np.ndarray:
+        """values of (N, D) positions, in order"""
+        self.evaluations += len(positions)
+        return self.evaluator(self.opt_fun, positions)
+
+    def ask(self) -> np.ndarray:
+        """
+        (N, D) array of positions to evaluate in next phase of iteration;
+        every ask has to be followed by tell with values of these positions
+        """
+        raise Exception(f'{type(self).__name__} does not support ask/tell')
+
+    def tell(self, values) -> bool:
+        """applies values of asked positions, returns True when iteration is complete"""
+        raise Exception(f'{type(self).__name__} does not support ask/tell')
+
+    def step(self) -> float:
+        """one iteration, asked positions are evaluated by evaluator"""
+        while not self.tell(self.evaluate_batch(self.ask())):
+            pass
+        return self.y
+
+    def emigrants(self, k) -> tuple:
+        """
+        k best known positions with their values, best first
+        :return: ((k, D) array of positions, (k,) array of values)
+        """
+        raise Exception(f'{type(self).__name__} does not support migration')
+
+    def immigrate(self, xs, ys):
+        """replaces the worst particles with given positions of known values"""
+        raise Exception(f'{type(self).__name__} does not support migration')
+
+    def close(self):
+        """releases workers of evaluator"""
+        self.evaluator.close()
+
+    def reseed(self, seed=None):
+        """starts new random stream; call reset after it to draw new particles"""
+        self.rng = RandomStream(seed)
+
     def reset(self):
         self.y = MAX_FLOAT
+        self.evaluations = 0
         self.logs = {}
 
+    def checkpoint_state(self) -> dict:
+        """state of optimizer, without its configuration (function, evaluator, checkpoint)"""
+        return {k: v for k, v in self.__dict__.items() if k not in CONFIGURATION}
+
+    def restore_state(self, state: dict):
+        self.__dict__.update(state)
+
+    def save_checkpoint(self, iteration, logs_y, criteria):
+        """writes state with progress of evaluate; file is replaced only by complete checkpoint"""
+        with open(f'{self.checkpoint}.tmp', 'wb') as f:
+            pickle.dump({
+                'config': self.checkpoint_config,
+                'iteration': iteration,
+                'logs_y': logs_y,
+                'criteria': criteria,
+                'state': self.checkpoint_state()
+            }, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(f'{self.checkpoint}.tmp', self.checkpoint)
+        self.flush_telemetry()
+
+    def flush_telemetry(self):
+        flush = getattr(self.telemetry, 'flush', None)
+        if flush is not None:
+            flush()
+
+    def load_checkpoint(self):
+        """
+        Restores optimizer from checkpoint file if there is one, of the same configuration
+        :return: checkpoint with number of done iterations, their y-s and stopping criteria
+        """
+        if self.checkpoint is None or not os.path.exists(self.checkpoint):
+            return None
+        with open(self.checkpoint, 'rb') as f:
+            checkpoint = pickle.load(f)
+        if checkpoint.get('config') != self.checkpoint_config:
+            # left by run of other configuration, e.g. with changed iterations
+            os.remove(self.checkpoint)
+            return None
+        self.restore_state(checkpoint['state'])
+        return checkpoint
+
+    def stopping_criteria(self, iterations=None) -> list:
+        """
+        Criteria of evaluate: given number of iterations, or accuracy mode
+        (accuracy, stagnation over 50 iterations) when neither iterations nor 'stopping' are given;
+        criteria from 'stopping' are added in both cases, MAX_ITERATIONS is the upper limit
+        """
+        if iterations is not None:
+            if not isinstance(iterations, int) or iterations < 1:
+                raise Exception(f'Iterations should be integer or left empty, got {iterations}')
+            return stopping_switcher(self.stopping) + [MaxIterations(iterations)]
+        if self.stopping:
+            return stopping_switcher(self.stopping) + [MaxIterations(MAX_ITERATIONS)]
+        return [Accuracy(), Stagnation(50), MaxIterations(MAX_ITERATIONS)]
+
+    def evaluations_left(self, criteria):
+        """evaluations left under MaxEvaluations criteria, None if there is no such limit"""
+        limits = [criterion.evaluations - self.evaluations for criterion in criteria
+                  if isinstance(criterion, MaxEvaluations)]
+        return min(limits) if limits else None
+
     def evaluate(
             self,
             step_function: Callable[[], float],
             iterations: int = None
     ):
-        logs_y = []
-        # accuracy mode
-        if iterations is None:
-            for i in range(10000):
-                y, self.y = self.y, step_function()
-                logs_y.append(self.y)
+        criteria = self.stopping_criteria(iterations)
+        iteration, logs_y = 0, []
+        # resumed run continues from saved iteration
+        checkpoint = self.load_checkpoint()
+        if checkpoint is not None:
+            iteration, logs_y, criteria = checkpoint['iteration'], checkpoint['logs_y'], checkpoint['criteria']
+        else:
+            for criterion in criteria:
+                criterion.reset()
 
-                # 10 last solutions are equal => break
-                if 0 < math.fabs(self.y - y) <= self.opt_fun.accuracy \
-                        or len(logs_y) > 50 \
-                        and all(logs_y[-1] == log_y for log_y in logs_y[-50:]):
-                    self.logs['iterations'] = i
-                    break
+        start_time = time.monotonic()
+        stop_reasons = []
+        while not stop_reasons:
+            evaluations = self.evaluations
+            y, self.y = self.y, step_function()
+            iteration += 1
+            # evaluations of one iteration, without refinement
+            step_evaluations = self.evaluations - evaluations
+            if self.refinement is not None and self.refinement.due(iteration):
+                self.refinement(self, self.evaluations_left(criteria))
+            if self.keep_history:
+                logs_y.append(self.y)
             else:
-                self.logs['iterations'] = 10000
-
-        # iteration mode
-        elif isinstance(iterations, int) and iterations > 0:
-            for i in range(iterations):
-                y = step_function()
-                logs_y.append(y)
-            self.logs['iterations'] = iterations
-        else:
-            raise Exception(f'Iterations should be integer or left empty, got {iterations}')
+                logs_y[:] = [self.y]
+            if self.telemetry is not None:
+                self.telemetry({
+                    'run': self.run,
+                    'iteration': iteration,
+                    'y': self.y,
+                    'evaluations': self.evaluations,
+                    'elapsed': time.monotonic() - start_time
+                })
+
+            # every criterion has to see every iteration
+            stop_reasons = [criterion.name for criterion in criteria if criterion(self, iteration, y)]
+            # run stops before its next iteration would go over max_evaluations
+            if not stop_reasons:
+                left = self.evaluations_left(criteria)
+                if left is not None and left < step_evaluations:
+                    stop_reasons = [MaxEvaluations.name]
+            if not stop_reasons and self.checkpoint is not None and iteration % self.checkpoint_interval == 0:
+                self.save_checkpoint(iteration, logs_y, criteria)
+
+        # refinement after the last iteration is part of it, unless budget has run out
+        if self.refinement is not None and self.refinement.at_end \
+                and not {MaxEvaluations.name, MaxTime.name} & set(stop_reasons):
+            self.refinement(self, self.evaluations_left(criteria))
+            logs_y[-1] = self.y
 
+        self.logs['iterations'] = iteration
+        self.logs['stop_reason'] = stop_reasons[0]
+        self.logs['evaluations'] = self.evaluations
         self.logs['y'] = tuple(logs_y)
+        self.logs['seed'] = self.rng.seed
+        self.flush_telemetry()
+        # finished run starts from beginning next time
+        if self.checkpoint is not None and os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
         return self.logs['y'][-1]
@@ -0,0 +1,113 @@
+"""
+Throughput benchmarks: evaluations per second of optimization functions (scalar
+calls and batches) and iterations per second of optimizers, over matrix of
+populations and dimensions. Every case is warmed up and timed several times
+with fixed seeds, the best time is kept. Results are compared with baseline file.
+"""
+import json
+import time
+
+import numpy as np
+
+from app.BA import BA
+from app.CSO import CSO
+from app.GLPSO import GLPSO
+from app.LCSO import LCSO
+from app.PSO import PSO
+from app.optimization_functions import OptimizationFunction
+
+FUNCTIONS = ('f1', 'f2', 'f3', 'f5', 'f7', 'f10', 'f11', 'f12', 'f17', 'f21', 'f24')
+OPTIMIZERS = {
+    'PSO': (PSO, {}),
+    'GLPSO': (GLPSO, {'pm': 0.05}),
+    'CSO': (CSO, {'no_swarms': 4}),
+    'LCSO': (LCSO, {'no_swarms': 4}),
+    'BA': (BA, {})
+}
+POPULATIONS = (20, 50, 100)
+DIMENSIONS = (10, 30)
+
+
+def best_rate(run, min_time=0.05, repeats=3, warmup=1, setup=None) -> float:
+    """
+    Calls of run per second, from the fastest of repeats; number of calls
+    in one repeat is doubled until it takes at least min_time seconds
+    :param setup: called (not timed) before warmup and every repeat, e.g. to reset state run changes
+    """
+    if setup is not None:
+        setup()
+    for _ in range(warmup):
+        run()
+    number, best = 1, 0.0
+    while best < min_time:
+        number *= 2
+        best = float('inf')
+        for _ in range(repeats):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            for _ in range(number):
+                run()
+            best = min(best, time.perf_counter() - start)
+    return number / best
+
+
+def function_benchmarks(populations=POPULATIONS, dimensions=DIMENSIONS, functions=FUNCTIONS,
+                        min_time=0.05, repeats=3) -> dict:
+    """evaluations per second of every function, called for each position and for whole batch"""
+    results = {}
+    for fun_id in functions:
+        opt_fun = OptimizationFunction(fun_id)
+        for population in populations:
+            for dimension in dimensions:
+                # functions of fixed dimension are measured in it
+                dimension = min(max(dimension, opt_fun.dimension_constraints[0]), opt_fun.dimension_constraints[1])
+                positions = np.random.default_rng(0).uniform(*opt_fun.x_range, (population, dimension))
+                rows = positions.tolist()
+                results[f'{fun_id}/scalar/p{population}/d{dimension}'] = population * best_rate(
+                    lambda: [opt_fun(x) for x in rows], min_time, repeats)
+                results[f'{fun_id}/batch/p{population}/d{dimension}'] = population * best_rate(
+                    lambda: opt_fun.batch(positions), min_time, repeats)
+    return results
+
+
+def optimizer_benchmarks(populations=POPULATIONS, dimensions=DIMENSIONS, optimizers=tuple(OPTIMIZERS),
+                         fun_id='f1', min_time=0.05, repeats=3) -> dict:
+    """
+    Iterations per second of every optimizer on function fun_id; every timed
+    window starts from the same swarm (seed 0), not from converged one of previous window
+    """
+    results = {}
+    for name in optimizers:
+        so_class, kwargs = OPTIMIZERS[name]
+        for population in populations:
+            for dimension in dimensions:
+                so = so_class(population, dimension, OptimizationFunction(fun_id), seed=0, **kwargs)
+                results[f'{name}/p{population}/d{dimension}'] = best_rate(
+                    so.step, min_time, repeats, setup=lambda: restart(so))
+    return results
+
+
+def restart(so):
+    """new swarm of so, the same for every call"""
+    so.reseed(0)
+    so.reset()
+
+
+def load_baseline(path) -> dict:
+    with open(path) as f:
+        return json.load(f)['results']
+
+
+def save_baseline(path, results):
+    with open(path, 'w') as f:
+        json.dump({'unit': 'per second', 'results': results}, f, indent=4)
+
+
+def compare(results, baseline, tolerance=0.1) -> list:
+    """
+    Cases slower than baseline by more than tolerance (as fraction of baseline rate)
+    :return: list of (case, baseline rate, current rate)
+    """
+    return [(case, baseline[case], rate) for case, rate in results.items()
+            if case in baseline and rate < baseline[case] * (1 - tolerance)]
@@ -0,0 +1,80 @@
+"""
+Boundary handling strategies. Every strategy takes arrays of new positions x
+and velocities v (any shape, v may be None), x_range and numpy Generator,
+and returns positions inside x_range with (possibly changed) velocities.
+Scalar versions (list engines) take one coordinate and its velocity.
+"""
+import numpy as np
+
+from app.utils import bounce, bounce_array, glue_to_wall
+
+
+def boundary_switcher(strategy, scalar=False):
+    # strategy: (array version, scalar version)
+    strategies = {
+        'reflect': (reflect, reflect_scalar),
+        'clamp': (clamp, clamp_scalar),
+        'wrap': (wrap, wrap_scalar),
+        'random': (reinitialise, reinitialise_scalar),
+        'absorb': (absorb, absorb_scalar)
+    }
+    if strategy not in strategies:
+        raise Exception(f'Boundary strategy {strategy} not recognised, '
+                        f'expected one of {tuple(strategies)}')
+    return strategies[strategy][1 if scalar else 0]
+
+
+def reflect(x, v, x_range, rng):
+    """bounces x from walls as many times as needed (utils.bounce_array)"""
+    # x inside is returned as it is, without rounding errors of bounce_array
+    return np.where((x < x_range[0]) | (x > x_range[1]), bounce_array(x, x_range), x), v
+
+
+def clamp(x, v, x_range, rng):
+    """glues x to the nearest wall (array version of utils.glue_to_wall)"""
+    return np.clip(x, *x_range), v
+
+
+def wrap(x, v, x_range, rng):
+    """toroidal space: leaving through one wall enters through the opposite one"""
+    return x_range[0] + np.mod(x - x_range[0], x_range[1] - x_range[0]), v
+
+
+def reinitialise(x, v, x_range, rng):
+    """draws new random coordinates in place of those out of x_range"""
+    outside = (x < x_range[0]) | (x > x_range[1])
+    x = np.where(outside, 0, x)
+    x[outside] = rng.uniform(*x_range, size=np.count_nonzero(outside))
+    return x, v
+
+
+def absorb(x, v, x_range, rng):
+    """glues x to the wall and stops velocity in dimensions out of x_range"""
+    outside = (x < x_range[0]) | (x > x_range[1])
+    if v is not None:
+        v = np.where(outside, 0, v)
+    return np.clip(x, *x_range), v
+
+
+def reflect_scalar(x, v, x_range, rng):
+    return bounce(x, x_range), v
+
+
+def clamp_scalar(x, v, x_range, rng):
+    return glue_to_wall(x, x_range), v
+
+
+def wrap_scalar(x, v, x_range, rng):
+    return x_range[0] + (x - x_range[0]) % (x_range[1] - x_range[0]), v
+
+
+def reinitialise_scalar(x, v, x_range, rng):
+    if x_range[0] <= x <= x_range[1]:
+        return x, v
+    return rng.uniform(*x_range), v
+
+
+def absorb_scalar(x, v, x_range, rng):
+    if x_range[0] <= x <= x_range[1]:
+        return x, v
+    return glue_to_wall(x, x_range), 0.0
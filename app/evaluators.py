@@ -0,0 +1,80 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from math import ceil
+
+import numpy as np
+
+
+def evaluator_switcher(config=None):
+    """
+    Creates evaluator from config, e.g. {'type': 'process', 'workers': 8, 'chunk_size': 16}
+    """
+    config = dict(config or {})
+    evaluator_type = config.pop('type', 'serial')
+    evaluators = {
+        'serial': SerialEvaluator,
+        'thread': ThreadPoolEvaluator,
+        'process': ProcessPoolEvaluator
+    }
+    if evaluator_type not in evaluators:
+        raise Exception(f'Evaluator {evaluator_type} not recognised, '
+                        f'expected one of {tuple(evaluators)}')
+    return evaluators[evaluator_type](**config)
+
+
+class SerialEvaluator:
+    """Evaluates whole batch in calling thread"""
+
+    def __call__(self, opt_fun, positions) -> np.ndarray:
+        """
+        :param opt_fun: OptimizationFunction
+        :param positions: (N, D) array-like of positions
+        :return: (N,) array of values in order of positions
+        """
+        return opt_fun.batch(positions)
+
+    def close(self):
+        pass
+
+
+class PoolEvaluator(SerialEvaluator):
+    """
+    Splits batch into chunks evaluated in pool of workers.
+    Pool is started on first use and is not copied with evaluator.
+    """
+    executor_class = None
+
+    def __init__(self, workers=None, chunk_size=None):
+        self.workers = workers or os.cpu_count() or 1
+        # default: one chunk per worker
+        self.chunk_size = chunk_size
+        self.executor = None
+
+    def __call__(self, opt_fun, positions) -> np.ndarray:
+        positions = np.asarray(positions, dtype=float)
+        if self.executor is None:
+            self.executor = self.executor_class(self.workers)
+        chunk_size = self.chunk_size or max(1, ceil(len(positions) / self.workers))
+        chunks = [positions[i:i + chunk_size] for i in range(0, len(positions), chunk_size)]
+        # map returns results in order of chunks
+        return np.concatenate([np.empty(0), *self.executor.map(opt_fun.batch, chunks)])
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['executor'] = None
+        return state
+
+
+class ThreadPoolEvaluator(PoolEvaluator):
+    """for objectives releasing GIL, e.g. numpy heavy or calling external programs"""
+    executor_class = ThreadPoolExecutor
+
+
+class ProcessPoolEvaluator(PoolEvaluator):
+    """for pure python objectives; opt_fun has to be picklable"""
+    executor_class = ProcessPoolExecutor
@@ -0,0 +1,41 @@
+"""
+Migration (SO.emigrants and SO.immigrate) shared by optimizers keeping local bests
+of particles: best particles are chosen and the worst ones replaced by their local bests.
+"""
+import numpy as np
+
+
+class LocalBestMigration:
+    """for list engines, particles are dicts with 'best_local' and 'y_best' (PSO, GLPSO)"""
+
+    def emigrants(self, k) -> tuple:
+        best = sorted(self.particles, key=lambda p: p['y_best'])[:k]
+        return np.array([p['best_local'] for p in best]), np.array([p['y_best'] for p in best])
+
+    def immigrate(self, xs, ys):
+        worst = sorted(self.particles, key=lambda p: p['y_best'], reverse=True)
+        for pn, x, y in zip(worst, np.asarray(xs).tolist(), np.asarray(ys).tolist()):
+            pn['x'], pn['best_local'], pn['y_best'] = x, x.copy(), y
+            pn['v'] = [0] * self.dimensions
+            if y < self.y:
+                self.best_global = x.copy()
+                self.y = y
+
+
+class ArrayLocalBestMigration:
+    """for array engines with x, v, best_local and y_best arrays (ArrayPSO, ArrayGLPSO)"""
+
+    def emigrants(self, k) -> tuple:
+        best = np.argsort(self.y_best)[:k]
+        return self.best_local[best].copy(), self.y_best[best].copy()
+
+    def immigrate(self, xs, ys):
+        xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+        worst = np.argsort(self.y_best)[::-1][:len(ys)]
+        xs, ys = xs[:len(worst)], ys[:len(worst)]
+        self.x[worst], self.best_local[worst], self.y_best[worst] = xs, xs, ys
+        self.v[worst] = 0
+        best = np.argmin(ys)
+        if ys[best] < self.y:
+            self.best_global = xs[best].copy()
+            self.y = float(ys[best])
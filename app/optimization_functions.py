@@ -1,70 +1,83 @@
 import math
 
+import numpy as np
+
 
 def fun_switcher(fun_id):
     return {
         'f1': {
             'fun': f1,
+            'batch_fun': f1_batch,
             'dimension_constraints': (2, 100),
             'x_range': (-100, 100),
             'accuracy': 0.0001
         },
         'f2': {
             'fun': f2,
+            'batch_fun': f2_batch,
             'dimension_constraints': (2, 100),
             'x_range': (-100, 100),
             'accuracy': 0.0001
         },
         'f5': {
             'fun': f5,
+            'batch_fun': f5_batch,
             'dimension_constraints': (2, 100),
             'x_range': (-5.12, 5.12),
             'accuracy': 30
         },
         'f7': {
             'fun': f7,
+            'batch_fun': f7_batch,
             'dimension_constraints': (2, 2),
             'x_range': (-10, 10),
             'accuracy': 0.000001
         },
         'f10': {
             'fun': f10,
+            'batch_fun': f10_batch,
             'dimension_constraints': (2, 100),
             'x_range': (-10, 10),
             'accuracy': 0.000001
         },
         'f11': {
             'fun': f11,
+            'batch_fun': f11_batch,
             'dimension_constraints': (2, 100),
             'x_range': (-10, 10),
             'accuracy': 0.001
         },
         'f12': {
             'fun': f12,
+            'batch_fun': f12_batch,
             'dimension_constraints': (2, 2),
             'x_range': (-100, 100),
             'accuracy': 0.00001
         },
         'f3': {
             'fun': f3,
+            'batch_fun': f3_batch,
             'dimension_constraints': (2, 100),
             'x_range': (-100, 100),
             'accuracy': 0.00001
         },
         'f17': {
             'fun': f17,
+            'batch_fun': f17_batch,
             'dimension_constraints': (2, 100),
             'x_range': (-100, 100),
             'accuracy': 0.00001
         },
         'f21': {
             'fun': f21,
+            'batch_fun': f21_batch,
             'dimension_constraints': (2, 100),
             'x_range': (-100, 100),
             'accuracy': 0.00001
         },
         'f24': {
             'fun': f24,
+            'batch_fun': f24_batch,
             'dimension_constraints': (2, 100),
             'x_range': (-65, 65),
             'accuracy': 0.00001
@@ -161,13 +174,93 @@ def f24(vector_x):
     return sum1
 
 
+# batch versions: take population as (N, D) array and return N values
+
+def f1_batch(population):
+    return np.einsum('ij,ij->i', population, population)
+
+
+def f2_batch(population):
+    shifted = population - np.arange(1, population.shape[1] + 1)
+    return np.einsum('ij,ij->i', shifted, shifted)
+
+
+def f5_batch(population):
+    return np.sum(population * population - 10 * np.cos(2 * np.pi * population) + 10, axis=1)
+
+
+def f7_batch(population):
+    x1 = population[:, 0]
+    x2 = population[:, 1]
+    x1_pi_2 = (-x1 - np.pi) * (-x1 - np.pi)
+    x2_pi_2 = (-x2 - np.pi) * (-x2 - np.pi)
+    return -1 * np.cos(x1) * np.cos(x2) * np.exp(x1_pi_2 - x2_pi_2)
+
+
+def f10_batch(population):
+    abs_x = np.abs(population)
+    return np.einsum('ij,ij->i', abs_x, abs_x) + np.prod(abs_x, axis=1)
+
+
+def f11_batch(population):
+    _sum = population @ (np.arange(1, population.shape[1] + 1) * 0.5)
+    _sum2 = _sum * _sum
+    return -np.sum(population, axis=1) + _sum2 + _sum2 * _sum2
+
+
+def f12_batch(population):
+    squares = population[:, 0] * population[:, 0] + population[:, 1] * population[:, 1]
+    meter = np.sin(np.sqrt(squares)) ** 2 - 0.5
+    denominator = (1 + 0.001 * squares) ** 2
+    return 0.5 + meter / denominator
+
+
+def f3_batch(population):
+    # prefix sums of x_0 ... x_(i-1) for every i > 0 (for i = 0 the sum is empty)
+    prefix = np.cumsum(population[:, :-1], axis=1)
+    return np.einsum('ij,ij->i', prefix, prefix)
+
+
+def f17_batch(population):
+    return np.sum((population - 1) ** 2, axis=1) - np.sum(population ** 2 - 1, axis=1)
+
+
+def f21_batch(population):
+    return population[:, 1] + 10**6 * np.einsum('ij,ij->i', population, population)
+
+
+def f24_batch(population):
+    # inner sum does not depend on j, so it is x_i^2 added D times
+    return population.shape[1] * np.einsum('ij,ij->i', population, population)
+
+
 class OptimizationFunction:
     def __init__(self, opt_function_id: str, **kwargs):
         temp_function = fun_switcher(opt_function_id)
         self.opt_function = temp_function['fun']
+        # numpy version of built-in function; used only while opt_function is not replaced
+        self.batch_function = temp_function['batch_fun']
+        self._builtin_function = temp_function['fun']
         self.dimension_constraints = temp_function['dimension_constraints']
         self.x_range = kwargs.get('x_range', temp_function['x_range'])
         self.accuracy = kwargs.get('accuracy', temp_function['accuracy'])
 
     def __call__(self, vector_x, *args, **kwargs):
         return self.opt_function(vector_x)
+
+    def batch(self, population):
+        """
+        Evaluates whole population at once
+        :param population: (N, D) array-like of positions
+        :return: (N,) array of function values
+        """
+        population = np.asarray(population, dtype=float)
+        if population.ndim != 2:
+            raise ValueError(f'Population should be 2-dimensional, got shape {population.shape}')
+        if self.opt_function is self._builtin_function:
+            return self.batch_function(population)
+        # user function: fall back to scalar calls
+        return np.fromiter(
+            (self.opt_function(x) for x in population.tolist()),
+            dtype=float, count=len(population)
+        )
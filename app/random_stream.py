@@ -0,0 +1,61 @@
+import numpy as np
+
+
+def spawn_seeds(seed, n):
+    """n independent seeds derived from one seed; the same seed gives the same list"""
+    return [int(s.generate_state(1, np.uint64)[0])
+            for s in np.random.SeedSequence(seed).spawn(n)]
+
+
+class RandomStream:
+    """
+    Source of random numbers for one run, backed by numpy Generator.
+    Hands out whole blocks of numbers, e.g. for every particle and dimension at once.
+    """
+
+    def __init__(self, seed=None):
+        # draw seed if not given so every run can be repeated
+        self.seed = np.random.SeedSequence().entropy if seed is None else seed
+        self.generator = np.random.default_rng(self.seed)
+
+    def random(self, size=None):
+        """uniform numbers from [0, 1)"""
+        return self.generator.random(size)
+
+    def uniform(self, low=0.0, high=1.0, size=None):
+        return self.generator.uniform(low, high, size)
+
+    def standard_normal(self, size=None):
+        return self.generator.standard_normal(size)
+
+    def coefficients(self, w, size=None):
+        """if 'w' looks like [low, high] draw uniform block with them, otherwise return w"""
+        if isinstance(w, (tuple, list)):
+            return self.generator.uniform(*w, size)
+        return w
+
+    def integers(self, low, high=None, size=None):
+        return self.generator.integers(low, high, size)
+
+    def permutation(self, x):
+        return self.generator.permutation(x)
+
+    def shuffle(self, sequence):
+        """shuffles list or array in place"""
+        self.generator.shuffle(sequence)
+
+    def shuffled(self, sequence) -> list:
+        """shuffled copy of any sequence as list"""
+        return [sequence[i] for i in self.generator.permutation(len(sequence))]
+
+    def pick(self, sequence):
+        """random element of sequence"""
+        return sequence[self.generator.integers(len(sequence))]
+
+    @property
+    def state(self):
+        return self.generator.bit_generator.state
+
+    @state.setter
+    def state(self, state):
+        self.generator.bit_generator.state = state
@@ -0,0 +1,86 @@
+"""
+Memetic refinement of SO.evaluate: local search of scipy.optimize (L-BFGS-B or
+Nelder-Mead bounded by x_range) started from the best known positions of optimizer.
+Improved positions replace the worst particles (see SO.immigrate), evaluations of
+local search are counted in optimizer's evaluations.
+"""
+import numpy as np
+
+METHODS = ('L-BFGS-B', 'Nelder-Mead')
+
+
+def refinement_switcher(config=None):
+    """
+    Creates refinement from config, e.g. {"method": "L-BFGS-B", "interval": 50, "top_k": 3,
+    "evaluations": 300, "at_end": true}
+    """
+    if not config:
+        return None
+    if isinstance(config, Refinement):
+        return config
+    return Refinement(**config)
+
+
+class BudgetExhausted(Exception):
+    pass
+
+
+class Refinement:
+    def __init__(self, method='L-BFGS-B', interval=None, top_k=1, evaluations=100, at_end=True):
+        """
+        :param method: local optimizer of scipy.optimize.minimize
+        :param interval: refine every interval iterations, only at the end if None
+        :param top_k: number of best positions local search starts from
+        :param evaluations: evaluations of one refinement, split between starting positions
+        :param at_end: refine also after the last iteration
+        """
+        if method not in METHODS:
+            raise Exception(f'Refinement method {method} not recognised, expected one of {METHODS}')
+        self.method = method
+        self.interval = interval
+        self.top_k = top_k
+        self.evaluations = evaluations
+        self.at_end = at_end
+
+    def due(self, iteration) -> bool:
+        return self.interval is not None and iteration % self.interval == 0
+
+    def __call__(self, so, budget=None) -> int:
+        """
+        Refines best positions of so, returns number of improved ones
+        :param budget: evaluations left to optimizer, refinement takes no more than them
+        """
+        evaluations = self.evaluations if budget is None else min(self.evaluations, budget)
+        if evaluations < 1:
+            return 0
+        # every starting position gets at least one evaluation
+        xs, ys = so.emigrants(min(self.top_k, evaluations))
+        budget = evaluations // len(ys)
+        improved = [self.search(so, x, y, budget) for x, y in zip(xs, ys)]
+        improved = [(x, y) for (x, y), y_start in zip(improved, ys) if y < y_start]
+        if improved:
+            so.immigrate(np.array([x for x, _ in improved]), np.array([y for _, y in improved]))
+        return len(improved)
+
+    def search(self, so, x_start, y_start, budget) -> tuple:
+        """best position found by local search from x_start within budget of evaluations"""
+        # scipy is imported only when refinement is used
+        from scipy.optimize import minimize
+
+        best = [np.array(x_start, dtype=float), float(y_start)]
+        used = [0]
+
+        def fun(x):
+            if used[0] >= budget:
+                raise BudgetExhausted()
+            used[0] += 1
+            y = float(so.evaluate_batch(np.clip(x, *so.opt_fun.x_range)[np.newaxis])[0])
+            if y < best[1]:
+                best[:] = [np.clip(x, *so.opt_fun.x_range), y]
+            return y
+
+        try:
+            minimize(fun, best[0], method=self.method, bounds=[so.opt_fun.x_range] * len(best[0]))
+        except BudgetExhausted:
+            pass
+        return best[0], best[1]
@@ -0,0 +1,35 @@
+"""
+Registry of algorithms of inputs. Input is run by algorithm named by prefix of
+its name (e.g. 'glpso' of 'glpso_a_mod'); module of algorithm is imported only
+when it is used for the first time.
+"""
+import importlib
+from functools import lru_cache
+
+# name: (class, array-backed class used with "vectorized"), as 'module:class'
+ALGORITHMS = {
+    'pso': ('app.PSO:PSO', 'app.ArrayPSO:ArrayPSO'),
+    'lcso': ('app.LCSO:LCSO', 'app.ArrayLCSO:ArrayLCSO'),
+    'cso': ('app.CSO:CSO', 'app.ArrayCSO:ArrayCSO'),
+    'glpso': ('app.GLPSO:GLPSO', 'app.ArrayGLPSO:ArrayGLPSO'),
+    'ba': ('app.BA:BA', 'app.ArrayBA:ArrayBA')
+}
+
+
+def algorithm_name(user_input) -> str:
+    name = user_input.split('_', 1)[0]
+    if name not in ALGORITHMS:
+        raise Exception(f'Algorithm for input {user_input} not recognised, '
+                        f'expected prefix of one of {tuple(ALGORITHMS)}')
+    return name
+
+
+def algorithm_class(name, vectorized=False):
+    return load(ALGORITHMS[name][1 if vectorized else 0])
+
+
+@lru_cache(maxsize=None)
+def load(path):
+    """object at 'module:name', module is imported on first use"""
+    module, name = path.split(':')
+    return getattr(importlib.import_module(module), name)
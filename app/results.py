@@ -0,0 +1,129 @@
+"""
+Results of TaskManager kept in SQLite database: one row per run of TaskManager,
+per configuration (by hash from app.sweep) and per repeat, with y of every
+iteration stored as blob of float64. Summary and repeats are also views,
+which can be exported to csv.
+"""
+import csv
+import json
+import sqlite3
+from datetime import datetime
+
+import numpy as np
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started TEXT,
+    seed TEXT,
+    repeats INTEGER,
+    settings TEXT
+);
+CREATE TABLE IF NOT EXISTS configs (
+    hash TEXT PRIMARY KEY,
+    input TEXT
+);
+CREATE TABLE IF NOT EXISTS repeats (
+    run_id INTEGER REFERENCES runs(id),
+    input TEXT,
+    config_hash TEXT REFERENCES configs(hash),
+    repeat INTEGER,
+    y REAL,
+    iterations INTEGER,
+    time INTEGER,
+    evaluations INTEGER,
+    stop_reason TEXT,
+    seed TEXT,
+    best_global BLOB,
+    curve BLOB,
+    PRIMARY KEY (run_id, input, repeat)
+);
+CREATE INDEX IF NOT EXISTS repeats_config ON repeats(config_hash);
+CREATE VIEW IF NOT EXISTS summary AS
+    SELECT run_id, input, config_hash, COUNT(*) AS repeats, AVG(y) AS avg_y, MIN(y) AS min_y,
+           AVG(iterations) AS avg_iterations, AVG(time) AS avg_times, AVG(evaluations) AS avg_evaluations
+    FROM repeats GROUP BY run_id, input;
+CREATE VIEW IF NOT EXISTS details AS
+    SELECT run_id, input, config_hash, repeat, y, iterations, time, evaluations, stop_reason, seed
+    FROM repeats;
+'''
+
+
+def to_blob(values) -> bytes:
+    return np.asarray(values, dtype='<f8').tobytes()
+
+
+def from_blob(blob) -> np.ndarray:
+    return np.frombuffer(blob, dtype='<f8')
+
+
+class ResultsStore:
+    """
+    Database of results at path; results of repeats are buffered
+    and written in one transaction for every batch_size of them
+    """
+
+    def __init__(self, path, batch_size=100):
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+        self.batch_size = batch_size
+        # (config row, repeat row) not written yet
+        self.buffer = []
+
+    def add_run(self, seed, repeats, settings, run_id=None) -> int:
+        """new run of TaskManager, returns its id; existing run with given run_id is kept (resumed run)"""
+        with self.connection:
+            cursor = self.connection.execute(
+                'INSERT OR IGNORE INTO runs (id, started, seed, repeats, settings) VALUES (?, ?, ?, ?, ?)',
+                (run_id, datetime.now().isoformat(), str(seed), repeats, json.dumps(settings))
+            )
+        return cursor.lastrowid if run_id is None else run_id
+
+    def add_result(self, run_id, user_input, input_hash, input_data, repeat, result):
+        """result of repeat as returned by run_repeat"""
+        self.buffer.append((
+            (input_hash, json.dumps(input_data, sort_keys=True)),
+            (run_id, user_input, input_hash, repeat, result['y'], result['iterations'], result['time'],
+             result.get('evaluations'), result.get('stop_reason'), str(result.get('seed')),
+             to_blob(result.get('best_global', [])), to_blob(result.get('logs_y', [])))
+        ))
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        with self.connection:
+            self.connection.executemany('INSERT OR IGNORE INTO configs VALUES (?, ?)',
+                                        [config for config, _ in self.buffer])
+            self.connection.executemany('INSERT OR REPLACE INTO repeats VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                                        [row for _, row in self.buffer])
+        self.buffer = []
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+    def query(self, sql, parameters=()) -> list:
+        self.flush()
+        return self.connection.execute(sql, parameters).fetchall()
+
+    def curves(self, run_id, user_input) -> list:
+        """y of every iteration of repeats of input, in order of repeats"""
+        return [from_blob(curve) for curve, in self.query(
+            'SELECT curve FROM repeats WHERE run_id = ? AND input = ? ORDER BY repeat', (run_id, user_input)
+        )]
+
+    def export_csv(self, path, view='summary', run_id=None):
+        """writes rows of view (summary or details), of one run if run_id is given"""
+        if view not in ('summary', 'details'):
+            raise Exception(f'View {view} not recognised, expected one of {("summary", "details")}')
+        self.flush()
+        if run_id is None:
+            cursor = self.connection.execute(f'SELECT * FROM {view}')
+        else:
+            cursor = self.connection.execute(f'SELECT * FROM {view} WHERE run_id = ?', (run_id,))
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(column[0] for column in cursor.description)
+            writer.writerows(cursor)
@@ -0,0 +1,161 @@
+"""
+Stopping criteria of SO.evaluate. Every criterion is updated once per iteration
+in constant time and tells if the run should stop; name of the first criterion
+which stopped the run is kept in logs['stop_reason'].
+"""
+import math
+import time
+from abc import abstractmethod
+
+
+def stopping_switcher(config) -> list:
+    """
+    Creates criteria from config, e.g. {"max_evaluations": 20000, "max_time": 60, "target": 1e-8,
+    "stagnation": {"iterations": 50, "tolerance": 1e-12}, "relative_improvement": 1e-6}.
+    Parameters are given as dict or as the first parameter only; list of criteria is returned as it is.
+    """
+    if isinstance(config, (list, tuple)):
+        return list(config)
+    criteria = {
+        'max_iterations': MaxIterations,
+        'max_evaluations': MaxEvaluations,
+        'max_time': MaxTime,
+        'target': TargetFitness,
+        'stagnation': Stagnation,
+        'relative_improvement': RelativeImprovement,
+        'accuracy': Accuracy
+    }
+    result = []
+    for name, params in (config or {}).items():
+        if name not in criteria:
+            raise Exception(f'Stopping criterion {name} not recognised, '
+                            f'expected one of {tuple(criteria)}')
+        result.append(criteria[name](**params) if isinstance(params, dict) else criteria[name](params))
+    return result
+
+
+class StoppingCriterion:
+    name = None
+
+    def reset(self):
+        """called at start of evaluate"""
+        pass
+
+    @abstractmethod
+    def __call__(self, so, iteration, y_prev) -> bool:
+        """
+        :param so: optimizer after iteration
+        :param iteration: number of done iterations
+        :param y_prev: best y before iteration
+        :return: True if run should stop
+        """
+        pass
+
+
+class MaxIterations(StoppingCriterion):
+    name = 'max_iterations'
+
+    def __init__(self, iterations):
+        if not isinstance(iterations, int) or iterations < 1:
+            raise Exception(f'Iterations should be positive integer, got {iterations}')
+        self.iterations = iterations
+
+    def __call__(self, so, iteration, y_prev) -> bool:
+        return iteration >= self.iterations
+
+
+class MaxEvaluations(StoppingCriterion):
+    """
+    Budget of function evaluations, checked after every iteration; SO.evaluate also stops
+    when the next iteration (as large as the last one) would go over it
+    """
+    name = 'max_evaluations'
+
+    def __init__(self, evaluations):
+        self.evaluations = evaluations
+
+    def __call__(self, so, iteration, y_prev) -> bool:
+        return so.evaluations >= self.evaluations
+
+
+class MaxTime(StoppingCriterion):
+    """wall time budget in seconds; time before checkpoint counts in resumed run"""
+    name = 'max_time'
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.start = time.monotonic()
+
+    def reset(self):
+        self.start = time.monotonic()
+
+    def __call__(self, so, iteration, y_prev) -> bool:
+        return time.monotonic() - self.start >= self.seconds
+
+    def __getstate__(self):
+        return {'seconds': self.seconds, 'elapsed': time.monotonic() - self.start}
+
+    def __setstate__(self, state):
+        self.seconds = state['seconds']
+        self.start = time.monotonic() - state['elapsed']
+
+
+class TargetFitness(StoppingCriterion):
+    name = 'target'
+
+    def __init__(self, target):
+        self.target = target
+
+    def __call__(self, so, iteration, y_prev) -> bool:
+        return so.y <= self.target
+
+
+class Accuracy(StoppingCriterion):
+    """y changed, but not more than accuracy (of optimisation function if not given)"""
+    name = 'accuracy'
+
+    def __init__(self, accuracy=None):
+        self.accuracy = accuracy
+
+    def __call__(self, so, iteration, y_prev) -> bool:
+        accuracy = so.opt_fun.accuracy if self.accuracy is None else self.accuracy
+        return 0 < math.fabs(so.y - y_prev) <= accuracy
+
+
+class Stagnation(StoppingCriterion):
+    """last 'iterations' y-s are equal (within tolerance), counted with running length of equal y-s"""
+    name = 'stagnation'
+
+    def __init__(self, iterations=50, tolerance=0.0):
+        self.iterations = iterations
+        self.tolerance = tolerance
+        self.equal = 0
+
+    def reset(self):
+        self.equal = 0
+
+    def __call__(self, so, iteration, y_prev) -> bool:
+        self.equal = self.equal + 1 if math.fabs(so.y - y_prev) <= self.tolerance else 1
+        return self.equal >= self.iterations and iteration > self.iterations
+
+
+class RelativeImprovement(StoppingCriterion):
+    """relative improvement of y was below threshold for 'iterations' iterations in a row"""
+    name = 'relative_improvement'
+
+    def __init__(self, threshold, iterations=1):
+        self.threshold = threshold
+        self.iterations = iterations
+        self.small = 0
+
+    def reset(self):
+        self.small = 0
+
+    def __call__(self, so, iteration, y_prev) -> bool:
+        if math.isinf(y_prev):
+            self.small = 0
+        elif y_prev - so.y <= self.threshold * math.fabs(y_prev):
+            self.small += 1
+        else:
+            self.small = 0
+        return self.small >= self.iterations
@@ -0,0 +1,83 @@
+"""
+Parameter sweeps. Sweep expands base input over grid or random sample of parameters
+into inputs named '{sweep name}_{hash}', e.g. from "sweeps" of input.json:
+{"pso_w": {"base": "pso_f11", "parameters": {"w_set": ["a", "b"], "population": [20, 50]}}}.
+Names of nested parameters are dotted, e.g. "parameters.mod_r" of BA.
+"""
+import copy
+import hashlib
+import itertools
+import json
+
+import numpy as np
+
+
+def config_hash(input_data, w_parameters) -> str:
+    """hash of input with w_set replaced by its values, the same for equal configurations"""
+    resolved = dict(input_data)
+    if 'w_set' in resolved:
+        resolved['w_set'] = w_parameters[resolved['w_set']]
+    return hashlib.sha1(json.dumps(resolved, sort_keys=True).encode()).hexdigest()[:10]
+
+
+def get_parameter(input_data, name):
+    for key in name.split('.'):
+        input_data = input_data.get(key) if isinstance(input_data, dict) else None
+    return input_data
+
+
+def set_parameter(input_data, name, value):
+    *path, key = name.split('.')
+    for part in path:
+        input_data = input_data.setdefault(part, {})
+    input_data[key] = value
+
+
+def configurations(spec) -> list:
+    """
+    Values of swept parameters: every combination of lists in 'grid' mode, 'samples'
+    draws in 'random' mode, where list gives choices and {"low": 0, "high": 1} gives
+    uniform range (of integers if both are integers)
+    """
+    parameters = spec['parameters']
+    mode = spec.get('mode', 'grid')
+    if mode == 'grid':
+        for name, values in parameters.items():
+            if not isinstance(values, list):
+                raise Exception(f'Grid parameter {name} should be list of values, got {values}')
+        return [dict(zip(parameters, values)) for values in itertools.product(*parameters.values())]
+    if mode == 'random':
+        rng = np.random.default_rng(spec.get('seed', None))
+        result = []
+        for _ in range(spec['samples']):
+            configuration = {}
+            for name, values in parameters.items():
+                if isinstance(values, list):
+                    configuration[name] = values[rng.integers(len(values))]
+                elif isinstance(values['low'], int) and isinstance(values['high'], int):
+                    configuration[name] = int(rng.integers(values['low'], values['high'], endpoint=True))
+                else:
+                    configuration[name] = float(rng.uniform(values['low'], values['high']))
+            result.append(configuration)
+        return result
+    raise Exception(f'Sweep mode {mode} not recognised, expected one of {("grid", "random")}')
+
+
+def sweep_inputs(name, data) -> tuple:
+    """
+    Inputs of sweep from input.json data, without duplicated configurations
+    :return: (user_inputs, inputs_data) as in main.py
+    """
+    spec = data['sweeps'][name]
+    base = spec['base']
+    base = data[base] if isinstance(base, str) else base
+    inputs = {}
+    for configuration in configurations(spec):
+        input_data = copy.deepcopy(base)
+        for parameter, value in configuration.items():
+            set_parameter(input_data, parameter, value)
+        if 'w_set' in input_data and input_data['w_set'] not in data['w_parameters']:
+            raise Exception(f'W set {input_data["w_set"]} of sweep {name} does not exist')
+        # the first of equal configurations is kept
+        inputs.setdefault(f'{name}_{config_hash(input_data, data["w_parameters"])}', input_data)
+    return list(inputs), list(inputs.values())
@@ -0,0 +1,96 @@
+"""
+Telemetry sinks of SO.evaluate. Sink gets one record per iteration
+(run, iteration, best y, evaluations, elapsed seconds), keeps at most
+buffer_size of them in memory and appends them to file when buffer is full,
+on flush and on close.
+"""
+import json
+
+import numpy as np
+
+# record of binary sink, run name is not stored (use '{run}' in path for file per run)
+RECORD_DTYPE = np.dtype([
+    ('iteration', '<i8'),
+    ('y', '<f8'),
+    ('evaluations', '<i8'),
+    ('elapsed', '<f8')
+])
+
+
+def sink_switcher(config=None):
+    """
+    Creates sink from config, e.g. {'type': 'jsonl', 'path': 'files/telemetry.jsonl', 'buffer_size': 1000}
+    """
+    if config is None:
+        return None
+    config = dict(config)
+    sink_type = config.pop('type', 'jsonl')
+    sinks = {
+        'jsonl': JsonlSink,
+        'binary': BinarySink
+    }
+    if sink_type not in sinks:
+        raise Exception(f'Telemetry sink {sink_type} not recognised, '
+                        f'expected one of {tuple(sinks)}')
+    return sinks[sink_type](**config)
+
+
+def read_binary(path) -> np.ndarray:
+    """records written by BinarySink as structured array"""
+    return np.fromfile(path, dtype=RECORD_DTYPE)
+
+
+class Sink:
+    """
+    Buffers records and appends them to file at path; path may contain '{run}',
+    which is replaced by run name of the record
+    """
+
+    def __init__(self, path, buffer_size=1000):
+        self.path = path
+        self.buffer_size = buffer_size
+        # buffered records of every file
+        self.buffers = {}
+
+    def __call__(self, record: dict):
+        path = self.path.format(run=record.get('run'))
+        buffer = self.buffers.setdefault(path, [])
+        buffer.append(record)
+        if len(buffer) >= self.buffer_size:
+            self.write(path, buffer)
+            buffer.clear()
+
+    def flush(self):
+        for path, buffer in self.buffers.items():
+            if buffer:
+                self.write(path, buffer)
+        self.buffers = {}
+
+    def close(self):
+        self.flush()
+
+    def write(self, path, records: list):
+        pass
+
+    def __getstate__(self):
+        # buffered records stay with the original sink
+        state = self.__dict__.copy()
+        state['buffers'] = {}
+        return state
+
+
+class JsonlSink(Sink):
+    """one json object per line"""
+
+    def write(self, path, records: list):
+        with open(path, 'a') as f:
+            f.writelines(json.dumps(record) + '\n' for record in records)
+
+
+class BinarySink(Sink):
+    """fixed size records of RECORD_DTYPE, read with read_binary"""
+
+    def write(self, path, records: list):
+        with open(path, 'ab') as f:
+            np.array([tuple(record[name] for name in RECORD_DTYPE.names) for record in records],
+                     dtype=RECORD_DTYPE).tofile(f)
@@ -2,20 +2,27 @@ import random
 from functools import reduce
 from operator import concat
 from random import sample, uniform
-from scipy.stats import levy
 from math import fabs
 
+import numpy as np
+
 
 def bounce(x, x_range):
-    if x > 0:
-        x = x % (2 * fabs(x_range[0] - x_range[1]))
-    elif x < 0:
-        x = (x % (-2 * fabs(x_range[0] - x_range[1])))
-    if x < x_range[0]:
-        return bounce(x_range[0] + fabs(x_range[0] - x), x_range)
-    elif x > x_range[1]:
-        return bounce(x_range[1] - fabs(x_range[1] - x), x_range)
-    return x
+    """reflects x from walls of x_range; for arrays see bounce_array"""
+    if x_range[0] <= x <= x_range[1]:
+        return x
+    width = x_range[1] - x_range[0]
+    # position in (0, 2 * width) period of reflections
+    x = (x - x_range[0]) % (2 * width)
+    return x_range[0] + width - fabs(x - width)
+
+
+def bounce_array(x, x_range):
+    """bounce for whole arrays: reflects x from walls of x_range without recursion"""
+    width = x_range[1] - x_range[0]
+    # position in (0, 2 * width) period of reflections
+    x = np.mod(x - x_range[0], 2 * width)
+    return x_range[0] + width - np.abs(x - width)
 
 
 def glue_to_wall(x, x_range):
@@ -41,8 +48,46 @@ def flatten(iterable):
     return reduce(concat, iterable)
 
 
-def levy_flight(x):
-    if uniform(0, 1) > 0.98:
-        return x * levy.rvs()
+def levy_step(z, scale=1.0):
+    """step from levy distribution (as scipy.stats.levy) made of standard normal z"""
+    return scale / (z * z)
+
+
+def levy_flight(x, probability=0.02, scale=1.0):
+    if uniform(0, 1) < probability:
+        return x * levy_step(random.gauss(0, 1), scale)
     else:
         return x
+
+
+class LevyFlight:
+    """
+    levy_flight for whole arrays: every element flies with given probability.
+    Steps are generated in blocks of buffer_size and handed out from the buffer.
+    """
+
+    def __init__(self, rng, probability=0.02, scale=1.0, buffer_size=4096):
+        self.rng = rng
+        self.probability = probability
+        self.scale = scale
+        self.buffer_size = buffer_size
+        self.buffer = np.empty(0)
+
+    def steps(self, n):
+        if len(self.buffer) < n:
+            self.buffer = np.concatenate((
+                self.buffer,
+                levy_step(self.rng.standard_normal(max(self.buffer_size, n)), self.scale)
+            ))
+        steps, self.buffer = self.buffer[:n], self.buffer[n:]
+        return steps
+
+    def multipliers(self, shape):
+        """array of ones with levy steps in place of flying elements"""
+        multipliers = np.ones(shape)
+        flying = self.rng.random(shape) < self.probability
+        multipliers[flying] = self.steps(np.count_nonzero(flying))
+        return multipliers
+
+    def __call__(self, v):
+        return v * self.multipliers(np.shape(v))
@@ -0,0 +1,35 @@
+import argparse
+import os
+import sys
+
+from app.benchmark import function_benchmarks, optimizer_benchmarks, load_baseline, save_baseline, compare
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Throughput of optimization functions and optimizers')
+    parser.add_argument('--baseline', default='files/benchmark_baseline.json')
+    parser.add_argument('--save', action='store_true', help='save results as new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='allowed slowdown as fraction of baseline rate')
+    parser.add_argument('--quick', action='store_true', help='population 20 and dimension 10 only')
+    args = parser.parse_args()
+
+    matrix = {'populations': (20,), 'dimensions': (10,)} if args.quick else {}
+    results = {**function_benchmarks(**matrix), **optimizer_benchmarks(**matrix)}
+    baseline = load_baseline(args.baseline) if os.path.exists(args.baseline) else {}
+
+    print(f'{"case":<24}{"baseline":>14}{"current":>14}{"ratio":>8}')
+    for case, rate in results.items():
+        if case in baseline:
+            print(f'{case:<24}{baseline[case]:>14.1f}{rate:>14.1f}{rate / baseline[case]:>8.2f}')
+        else:
+            print(f'{case:<24}{"-":>14}{rate:>14.1f}')
+
+    if args.save:
+        save_baseline(args.baseline, {**baseline, **results})
+        print(f'Baseline saved to {args.baseline}')
+    else:
+        regressions = compare(results, baseline, args.tolerance)
+        for case, baseline_rate, rate in regressions:
+            print(f'REGRESSION {case}: {rate:.1f} < {baseline_rate:.1f} per second')
+        if regressions:
+            sys.exit(1)
@@ -1,5 +1,7 @@
 import json
 
+from app.registry import ALGORITHMS
+from app.sweep import sweep_inputs
 from task_manager import TaskManager
 
 
@@ -16,14 +18,17 @@ if __name__ == '__main__':
         data = json.load(json_file)
     assert isinstance(data, dict)
 
+    # inputs of parameter sweep
+    if data['settings'].get('sweep'):
+        user_inputs, inputs_data = sweep_inputs(data['settings']['sweep'], data)
     # auto pass inputs
-    if data['settings']['auto']:
+    elif data['settings']['auto']:
         user_inputs = data['settings']['inputs']
         inputs_data = [data[auto_input] for auto_input in user_inputs]
     # pass input by choosing one from list
     else:
         [print(f'{k} : {v}') for k, v in data.items()
-         if k.startswith(('pso_', 'lcso_', 'cso_', 'glpso', 'ba'))]
+         if k.split('_', 1)[0] in ALGORITHMS]
         user_inputs = check_input(lambda x: x in data, 'Choose your input: ')
         inputs_data = [data[user_inputs]]
         user_inputs = [user_inputs]
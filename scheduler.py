@@ -0,0 +1,163 @@
+import csv
+import json
+import os
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from functools import partial
+from itertools import zip_longest
+
+import numpy as np
+
+from app.SO import SO
+from app.random_stream import spawn_seeds
+from app.registry import algorithm_name
+
+
+def run_repeat(so_object: SO, seed, **evaluate_kwargs) -> dict:
+    """
+    Runs one repeat of optimizer with given seed, result can be saved as json;
+    so_object is a copy of optimizer of input, its workers are stopped afterwards
+    """
+    try:
+        so_object.reseed(seed)
+        so_object.reset()
+        start_time = datetime.now()
+        so_object.evaluate(**evaluate_kwargs)
+        run_time = datetime.now() - start_time
+    finally:
+        so_object.close()
+
+    # y, iterations and time to find solution
+    return {
+        'y': so_object.logs['y'][-1],
+        'iterations': so_object.logs['iterations'],
+        'time': run_time.seconds * 1000 + run_time.microseconds // 1000,
+        'logs_y': list(so_object.logs['y']),
+        'stop_reason': so_object.logs['stop_reason'],
+        'evaluations': so_object.logs['evaluations'],
+        'seed': so_object.logs['seed'],
+        'restarts': so_object.logs.get('restarts', []),
+        'best_global': np.asarray(so_object.best_global).tolist()
+    }
+
+
+class Scheduler:
+    """
+    Runs repeats of all inputs of TaskManager as one queue of jobs on a pool of workers.
+    Jobs are ordered longest-first by runtimes recorded in previous runs (unknown ones
+    go first), details of every job are appended to csv as soon as it finishes.
+    """
+
+    def __init__(self, task_manager, runtimes_file='files/runtimes.json'):
+        self.tm = task_manager
+        self.runtimes_file = runtimes_file
+        # average runtime of one repeat of every input in ms
+        self.runtimes = {}
+        if os.path.exists(runtimes_file):
+            with open(runtimes_file) as f:
+                self.runtimes = json.load(f)
+
+        # optimizer and evaluate kwargs of every input
+        self.tasks = {}
+        # results of every input in order of repeats
+        self.results = {}
+
+    def jobs(self) -> list:
+        """(user_input, repeat, seed) of every repeat to run, longest first"""
+        jobs = []
+        for i, user_input in enumerate(self.tm.user_inputs):
+            # the same seeds as in TaskManager.so_task
+            for repeat, seed in enumerate(spawn_seeds((self.tm.seed, i), self.tm.repeats)):
+                if self.results[user_input][repeat] is None:
+                    jobs.append((user_input, repeat, seed))
+        return sorted(jobs, key=lambda job: -self.runtimes.get(job[0], float('inf')))
+
+    def run(self):
+        for user_input, input_data in zip(self.tm.user_inputs, self.tm.inputs_data):
+            self.tasks[user_input] = self.tm.build_so(user_input, input_data)
+            self.results[user_input] = [self.tm.load_result(user_input, repeat)
+                                        for repeat in range(self.tm.repeats)]
+            if self.tm.save_csv_details:
+                self.write_details(user_input, 'w', [('repeat', f'{user_input}_solution',
+                                                      f'{user_input}_iterations', f'{user_input}_runtime',
+                                                      f'{user_input}_seed')])
+                # repeats restored from checkpoints are written first
+                self.write_details(user_input, 'a', [detail_row(repeat, result) for repeat, result
+                                                     in enumerate(self.results[user_input]) if result is not None])
+            if None not in self.results[user_input]:
+                self.input_finished(user_input)
+        jobs = self.jobs()
+        print(f'Jobs to run: {len(jobs)}')
+
+        if self.tm.workers > 1:
+            with ProcessPoolExecutor(self.tm.workers) as executor:
+                # pool takes jobs in order of submission
+                futures = {executor.submit(self.job(*job)): job for job in jobs}
+                for future in as_completed(futures):
+                    user_input, repeat, _ = futures[future]
+                    self.finish(user_input, repeat, future.result())
+        else:
+            for user_input, repeat, seed in jobs:
+                self.finish(user_input, repeat, self.job(user_input, repeat, seed)())
+
+        # restored inputs are also summarised, in order of inputs
+        self.tm.reset_logs()
+        for user_input in self.tm.user_inputs:
+            results = self.results[user_input]
+            self.tm.avg_y.append(sum(r['y'] for r in results) / self.tm.repeats)
+            self.tm.avg_iterations.append(sum(r['iterations'] for r in results) // self.tm.repeats)
+            self.tm.avg_times.append(sum(r['time'] for r in results) // self.tm.repeats)
+            if self.tm.activate_ga and algorithm_name(user_input) == 'pso':
+                so_object, _ = self.tasks[user_input]
+                self.tm.ga_subtask(self.tm.inputs_data[self.tm.user_inputs.index(user_input)],
+                                   so_object.opt_fun)
+        for so_object, _ in self.tasks.values():
+            so_object.close()
+
+        with open(self.runtimes_file, 'w') as f:
+            json.dump(self.runtimes, f, indent=4)
+
+    def job(self, user_input, repeat, seed):
+        """call running repeat with its own copy of optimizer"""
+        so_object, evaluate_kwargs = self.tasks[user_input]
+        return partial(run_repeat, self.tm.prepare_repeat(so_object, user_input, repeat), seed, **evaluate_kwargs)
+
+    def finish(self, user_input, repeat, result):
+        """saves result of finished job and its input if it was the last job of input"""
+        print(f'===INPUT {user_input} REPEAT {repeat + 1}=== {result["y"]} in {result["time"]} ms')
+        if not self.tm.hide_prints:
+            print(f'Best solution {result["y"]} for {result["best_global"]}')
+        self.tm.save_result(user_input, repeat, result)
+        self.results[user_input][repeat] = result
+        if self.tm.save_csv_details:
+            self.write_details(user_input, 'a', [detail_row(repeat, result)])
+
+        # runtime of input as average of its finished repeats
+        results = [r for r in self.results[user_input] if r is not None]
+        self.runtimes[user_input] = sum(r['time'] for r in results) / len(results)
+
+        if len(results) == self.tm.repeats:
+            self.input_finished(user_input)
+
+    def input_finished(self, user_input):
+        results = self.results[user_input]
+        print(f'Input {user_input} finished, solutions: {[r["y"] for r in results]}')
+        if self.tm.save_csv_y_matrix:
+            write_y_matrix(user_input, [r['logs_y'] for r in results])
+
+    def write_details(self, user_input, mode, rows):
+        with open(f'files/{user_input}.csv', mode, newline='') as f:
+            csv.writer(f).writerows(rows)
+
+
+def detail_row(repeat, result) -> tuple:
+    return repeat + 1, result['y'], result['iterations'], result['time'], result['seed']
+
+
+def write_y_matrix(user_input, y_matrix, csv_dir='files'):
+    with open(f'{csv_dir}/{user_input}_y_matrix.csv', 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(range(1, len(y_matrix) + 1))
+        # needs to rotate matrix
+        writer.writerows(zip_longest(*y_matrix[::-1]))
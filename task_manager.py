@@ -1,15 +1,23 @@
+import copy
 import csv
+import json
+import os
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-from datetime import datetime
 from itertools import zip_longest
 
-from app.GA import GA
-from app.GLPSO import GLPSO
-from app.PSO import PSO
-from app.LCSO import LCSO
-from app.CSO import CSO
+import numpy as np
+
 from app.SO import SO
+from app.evaluators import evaluator_switcher
+from app.telemetry import sink_switcher
 from app.optimization_functions import OptimizationFunction
+from app.random_stream import spawn_seeds
+from app.registry import algorithm_name, algorithm_class, load
+from app.results import ResultsStore
+from app.sweep import config_hash, get_parameter
+from scheduler import Scheduler, run_repeat
 
 
 def write_csv(filename, headers, csv_data, csv_dir='files'):
@@ -19,6 +27,15 @@ def write_csv(filename, headers, csv_data, csv_dir='files'):
         writer.writerows(csv_data)
 
 
+def run_ga_repeat(dimension, opt_function, generations, seed, ga_kwargs) -> float:
+    """runs one repeat of GA, returns y of its best solution"""
+    # pygad is imported only when GA is used
+    ga = load('app.GA:GA')(dimension, opt_function, generations, random_seed=seed % 2 ** 32, **ga_kwargs)
+    ga.run()
+    _, solution_fitness = ga.best_solution()
+    return float(solution_fitness)
+
+
 class TaskManager:
     def __init__(self, data, user_inputs, inputs_data):
         self.data = data
@@ -34,42 +51,185 @@ class TaskManager:
         self.activate_ga = data['settings']['activate_ga']
         # hide_prints: hide prints of details and logs
         self.hide_prints = data['settings']['hide_prints']
+        # workers: number of processes running repeats of input at the same time
+        self.workers = data['settings'].get('workers', 1)
+        # sweep: name of sweep from "sweeps" whose inputs are run, see app.sweep
+        self.sweep = data['settings'].get('sweep', None)
+        # scheduler: run repeats of all inputs as one queue of jobs, longest inputs first (always for sweep)
+        self.scheduler = data['settings'].get('scheduler', False) or self.sweep is not None
+        # checkpoints: directory for states of unfinished repeats and results of finished ones,
+        # e.g. {"dir": "files/checkpoints", "interval": 100}; run again to resume where it stopped
+        self.checkpoints = data['settings'].get('checkpoints', None)
+        if self.checkpoints:
+            os.makedirs(self.checkpoints['dir'], exist_ok=True)
+        # seed: base of seeds for every repeat, drawn if not given
+        self.seed = data['settings'].get('seed', None)
+        if self.seed is None:
+            self.seed = self.load_seed()
+        # evaluator: default way of evaluating batches, e.g. {"type": "process", "workers": 4}
+        self.evaluator = data['settings'].get('evaluator', None)
 
         # save csv-s for logs
         self.save_csv_summary = data['settings']['save_csv_summary']
         self.save_csv_details = data['settings']['save_csv_details']
         self.save_csv_y_matrix = data['settings']['save_csv_y_matrix']
 
+        # telemetry: sink streaming record of every iteration,
+        # e.g. {"type": "jsonl", "path": "files/telemetry.jsonl", "buffer_size": 1000}
+        self.telemetry = sink_switcher(data['settings'].get('telemetry', None))
+        # buffered writes of worker processes to one file could interleave
+        if self.telemetry is not None and self.workers > 1 and '{run}' not in self.telemetry.path:
+            raise Exception(f'Telemetry path should contain {{run}} with more than one worker, '
+                            f'got {self.telemetry.path}')
+        # keep_history: keep y of every iteration in memory (needed for y matrix)
+        self.keep_history = data['settings'].get('keep_history', True)
+        if self.save_csv_y_matrix and not self.keep_history:
+            raise Exception('Saving y matrix needs keep_history')
+        # results: database keeping results of all runs, e.g. {"path": "files/results.db", "batch_size": 100}
+        results = data['settings'].get('results', None)
+        self.results = ResultsStore(**results) if results else None
+        if self.results is not None:
+            self.run_id = self.load_run_id(results['path'], data['settings'])
+
         # logs
         # averages over repeats
         self.avg_y, self.avg_iterations, self.avg_times = [], [], []
         # y-s for each repeat
         self.y_matrix = []
 
+    def load_seed(self) -> int:
+        """draws seed, resumed run reuses seed drawn by the one it continues"""
+        seed_file = self.checkpoints and f'{self.checkpoints["dir"]}/seed.json'
+        if seed_file and os.path.exists(seed_file):
+            with open(seed_file) as f:
+                return json.load(f)
+        seed = int(np.random.SeedSequence().generate_state(1, np.uint64)[0])
+        if seed_file:
+            with open(seed_file, 'w') as f:
+                json.dump(seed, f)
+        return seed
+
+    def load_run_id(self, path, settings) -> int:
+        """
+        Adds run to database at path; resumed run keeps id of the one it continues,
+        so repeats restored from checkpoints replace its rows instead of being counted again
+        """
+        run_file = self.checkpoints and f'{self.checkpoints["dir"]}/run.json'
+        run_id = None
+        if run_file and os.path.exists(run_file):
+            with open(run_file) as f:
+                run = json.load(f)
+            # checkpoints may be resumed with another database
+            if run['path'] == path:
+                run_id = run['run_id']
+        run_id = self.results.add_run(self.seed, self.repeats, settings, run_id)
+        if run_file:
+            with open(run_file, 'w') as f:
+                json.dump({'path': path, 'run_id': run_id}, f)
+        return run_id
+
+    def repeat_file(self, user_input, repeat, extension):
+        return f'{self.checkpoints["dir"]}/{user_input}_{repeat}.{extension}'
+
+    def input_hash(self, user_input) -> str:
+        input_data = self.inputs_data[self.user_inputs.index(user_input)]
+        return config_hash(input_data, self.w_parameters)
+
+    def load_result(self, user_input, repeat):
+        """result of repeat finished in previous run of the same configuration, if there are checkpoints"""
+        result_file = self.checkpoints and self.repeat_file(user_input, repeat, 'json')
+        if result_file and os.path.exists(result_file):
+            with open(result_file) as f:
+                result = json.load(f)
+            if result.pop('config', None) != self.input_hash(user_input):
+                # left by run of other configuration, e.g. with changed iterations
+                print(f'===REPEAT {repeat + 1}=== result of other configuration discarded')
+                os.remove(result_file)
+                return None
+            print(f'===REPEAT {repeat + 1}=== restored from checkpoint')
+            # resumed run has all of its repeats in database
+            self.store_result(user_input, repeat, result)
+            return result
+        return None
+
+    def save_result(self, user_input, repeat, result):
+        if self.checkpoints:
+            with open(self.repeat_file(user_input, repeat, 'json'), 'w') as f:
+                json.dump({**result, 'config': self.input_hash(user_input)}, f)
+        self.store_result(user_input, repeat, result)
+
+    def store_result(self, user_input, repeat, result):
+        if self.results is not None:
+            input_data = self.inputs_data[self.user_inputs.index(user_input)]
+            self.results.add_result(self.run_id, user_input, self.input_hash(user_input),
+                                    input_data, repeat, result)
+
+    def prepare_repeat(self, so_object: SO, user_input, repeat) -> SO:
+        """copy of optimizer with its own run name and checkpoint file"""
+        so_object = copy.copy(so_object)
+        so_object.run = f'{user_input}_{repeat}'
+        if self.checkpoints:
+            so_object.checkpoint = self.repeat_file(user_input, repeat, 'pkl')
+            so_object.checkpoint_interval = self.checkpoints.get('interval', 100)
+            so_object.checkpoint_config = self.input_hash(user_input)
+        return so_object
+
+    def run_repeats(self, so_object: SO, user_input, seeds, **evaluate_kwargs) -> list:
+        """
+        Runs repeats one after another or, with settings.workers > 1, in process pool;
+        with checkpoints, finished repeats are read from their result files
+        :return: results in order of repeats
+        """
+        results = [self.load_result(user_input, repeat) for repeat in range(len(seeds))]
+        pending = [(repeat, seed) for repeat, seed in enumerate(seeds) if results[repeat] is None]
+
+        def finish(repeat, result):
+            print(f'===REPEAT {repeat + 1}===')
+            if not self.hide_prints:
+                print(f'Best solution {result["y"]} for {result["best_global"]}')
+                print(result)
+            self.save_result(user_input, repeat, result)
+            results[repeat] = result
+
+        if self.workers > 1 and len(pending) > 1:
+            # every worker gets its own copy of optimizer
+            with ProcessPoolExecutor(min(self.workers, len(pending))) as executor:
+                futures = {
+                    executor.submit(run_repeat, self.prepare_repeat(so_object, user_input, repeat),
+                                    seed, **evaluate_kwargs): repeat
+                    for repeat, seed in pending
+                }
+                for future in as_completed(futures):
+                    finish(futures[future], future.result())
+        else:
+            for repeat, seed in pending:
+                finish(repeat, run_repeat(self.prepare_repeat(so_object, user_input, repeat),
+                                          seed, **evaluate_kwargs))
+        return results
+
     def reset_logs(self):
         self.avg_y, self.avg_iterations, self.avg_times = [], [], []
         self.y_matrix = []
 
     def start_tasks(self):
-        # loop over all inputs
-        for user_input, input_data \
-                in zip(self.user_inputs, self.inputs_data):
-            print('=' * 100)
-            print(f'{user_input}: {input_data}')
-
-            if user_input.startswith('pso_'):
-                self.pso_task(user_input, input_data)
-            elif user_input.startswith('lcso_'):
-                self.lcso_task(user_input, input_data)
-            elif user_input.startswith('cso_'):
-                self.cso_task(user_input, input_data)
-            elif user_input.startswith('glpso_'):
-                self.glpso_task(user_input, input_data)
-            elif user_input.startswith('ba_'):
-                self.ba_task(user_input, input_data)
-            else:
-                raise Exception(f'Algorithm for input {user_input} not recognised')
-
+        if self.scheduler:
+            Scheduler(self).run()
+        else:
+            # loop over all inputs
+            for user_input, input_data \
+                    in zip(self.user_inputs, self.inputs_data):
+                print('=' * 100)
+                print(f'{user_input}: {input_data}')
+
+                # e.g. pso_task for pso_f11
+                getattr(self, f'{algorithm_name(user_input)}_task')(user_input, input_data)
+
+        if self.telemetry is not None:
+            self.telemetry.close()
+        if self.results is not None:
+            self.results.close()
+
+        print(f'Seed of all repeats: {self.seed}')
         # save to csv avg_y and avg_iterations for every input in one summary
         if self.save_csv_summary:
             write_csv(
@@ -77,25 +237,84 @@ class TaskManager:
                 ('input', 'avg_y', 'avg_iterations', 'avg_times'),
                 zip(self.user_inputs, self.avg_y, self.avg_iterations, self.avg_times)
             )
+        # one table with swept parameters and results of every configuration
+        if self.sweep is not None:
+            parameters = list(self.data['sweeps'][self.sweep]['parameters'])
+            write_csv(
+                f'sweep_{self.sweep}.csv',
+                ('input', *parameters, 'avg_y', 'avg_iterations', 'avg_times'),
+                ((user_input, *(get_parameter(input_data, p) for p in parameters), *averages)
+                 for user_input, input_data, *averages
+                 in zip(self.user_inputs, self.inputs_data, self.avg_y, self.avg_iterations, self.avg_times))
+            )
 
-    def so_task(self, so_object: SO, **evaluate_kwargs) -> [[int], [int]]:
-        y, iterations, times = [], [], []
-        for i in range(self.repeats):
-            print(f'===REPEAT {i + 1}===')
+    def create_evaluator(self, input_data):
+        # input may override evaluator from settings
+        return evaluator_switcher(input_data.get('evaluator', self.evaluator))
+
+    def create_so(self, so_class, input_data, opt_function, **kwargs) -> SO:
+        """
+        Creates optimizer for input; with "islands" in input, e.g. {"no_islands": 4,
+        "migration_interval": 10, "migrants": 2, "topology": "ring"}, population
+        is split into islands of so_class running in separate processes; with "restarts",
+        e.g. {"stagnation": 50, "tolerance": 1e-8, "population_factor": 2, "max_population": 400},
+        so_class is restarted with larger population whenever it stagnates
+        """
+        kwargs['boundary'] = input_data.get('boundary', 'reflect')
+        # stopping: extra stopping criteria, e.g. {"max_evaluations": 20000, "max_time": 60}
+        kwargs['stopping'] = input_data.get('stopping', None)
+        # refinement: local search from best positions, e.g. {"method": "L-BFGS-B", "interval": 50, "top_k": 3}
+        kwargs['refinement'] = input_data.get('refinement', None)
+        kwargs['telemetry'] = self.telemetry
+        kwargs['keep_history'] = self.keep_history
+        if input_data.get('islands'):
+            return load('app.IslandModel:IslandModel')(
+                input_data['population'],
+                input_data['dimension'],
+                opt_function,
+                so_class,
+                **input_data['islands'],
+                **kwargs
+            )
+        if input_data.get('restarts'):
+            return load('app.RestartModel:RestartModel')(
+                input_data['population'],
+                input_data['dimension'],
+                opt_function,
+                so_class,
+                evaluator=self.create_evaluator(input_data),
+                **input_data['restarts'],
+                **kwargs
+            )
+        return so_class(
+            input_data['population'],
+            input_data['dimension'],
+            opt_function,
+            evaluator=self.create_evaluator(input_data),
+            **kwargs
+        )
 
-            start_time = datetime.now()
-            y.append(so_object.evaluate(**evaluate_kwargs))
-            run_time = datetime.now() - start_time
+    def build_so(self, user_input, input_data) -> tuple:
+        """optimizer of input chosen by its prefix, with kwargs of its evaluate"""
+        return getattr(self, f'build_{algorithm_name(user_input)}')(input_data)
 
+    def so_task(self, so_object: SO, user_input, **evaluate_kwargs) -> [[int], [int], [int], [int]]:
+        y, iterations, times, seeds, stop_reasons = [], [], [], [], []
+        # only y-s of current input are kept
+        self.y_matrix = []
+        # independent seeds for repeats of every input (number of inputs done so far)
+        seeds_of_repeats = spawn_seeds((self.seed, len(self.avg_y)), self.repeats)
+        for result in self.run_repeats(so_object, user_input, seeds_of_repeats, **evaluate_kwargs):
             # log y, iterations and time to find solution
-            times.append(run_time.seconds * 1000 + run_time.microseconds // 1000)
-            iterations.append(so_object.logs['iterations'])
-            self.y_matrix.append(so_object.logs['y'])
+            y.append(result['y'])
+            times.append(result['time'])
+            iterations.append(result['iterations'])
+            self.y_matrix.append(tuple(result['logs_y']))
+            seeds.append(result['seed'])
+            stop_reasons.append(result['stop_reason'])
 
-            if not self.hide_prints:
-                print(f'Best solution {so_object.y} for {so_object.best_global}')
-                print(so_object.logs)
-            so_object.reset()
+        # stop workers of pool evaluators and islands
+        so_object.close()
 
         self.avg_y.append(sum(y) / self.repeats)
         self.avg_iterations.append(sum(iterations) // self.repeats)
@@ -103,18 +322,22 @@ class TaskManager:
 
         print(f'Solutions : {y}')
         print(f'Iterations: {iterations}')
+        print(f'Seeds     : {seeds}')
+        print(f'Stopped by: {stop_reasons}')
         print(f'Average best solution        : {self.avg_y[-1]}')
         print(f'Average no iterations        : {self.avg_iterations[-1]}')
         print(f'Average time to find solution: {self.avg_times[-1]} ms')
 
-        return y, iterations, times
+        return y, iterations, times, seeds
 
-    def pso_task(self, user_input, input_data):
-        # init classes
+    def build_pso(self, input_data) -> tuple:
+        """optimizer of input with kwargs of its evaluate"""
         opt_function = OptimizationFunction(input_data['function'])
-        pso = PSO(
-            input_data['population'],
-            input_data['dimension'],
+        # vectorized: use array-backed engine instead of list of dicts
+        pso_class = algorithm_class('pso', input_data.get('vectorized', False))
+        pso = self.create_so(
+            pso_class,
+            input_data,
             opt_function,
             **self.w_parameters[input_data['w_set']]
         )
@@ -123,19 +346,23 @@ class TaskManager:
             'iterations': input_data.get('iterations', None),
             'alternative': input_data.get('alternative', False)
         }
+        return pso, evaluate_kwargs
 
-        y, iterations, _ = self.so_task(pso, **evaluate_kwargs)
+    def pso_task(self, user_input, input_data):
+        pso, evaluate_kwargs = self.build_pso(input_data)
+
+        y, iterations, _, seeds = self.so_task(pso, user_input, **evaluate_kwargs)
 
         if self.activate_ga:
-            self.ga_subtask(input_data, opt_function)
+            self.ga_subtask(input_data, pso.opt_fun)
 
         # save to csv y and iterations
         if self.save_csv_details:
             variant = user_input.removeprefix('pso_')
             write_csv(
                 f'{user_input}.csv',
-                (f'{variant}_solution', f'{variant}_iterations'),
-                zip(y, iterations)
+                (f'{variant}_solution', f'{variant}_iterations', f'{variant}_seed'),
+                zip(y, iterations, seeds)
             )
         # take only actual repeats (from the last input)
         cur_y_matrix = self.y_matrix[-self.repeats:]
@@ -149,19 +376,25 @@ class TaskManager:
             )
 
     def ga_subtask(self, input_data, opt_function):
-        y_ga, iterations_ga = [], []
-        for i in range(self.repeats):
-            print(f'===REPEAT {i + 1}===')
-            ga = GA(
-                input_data['dimension'],
-                opt_function,
-                input_data.get('iterations', 100)
-            )
-            ga.run()
-            solution, solution_fitness = ga.best_solution()
-            y_ga.append(solution_fitness)
-            iterations_ga.append(input_data.get('iterations', 100))
-            print(y_ga)
+        """
+        Runs GA on function of PSO input; "ga" of input sets it up, e.g. {"generations": 100,
+        "sol_per_pop": 50, "fitness_batch_size": 50, "parallel_processing": ["thread", 4]},
+        repeats run in process pool with settings.workers > 1
+        """
+        ga_kwargs = dict(input_data.get('ga', {}))
+        generations = ga_kwargs.pop('generations', input_data.get('iterations', None) or 100)
+        # repeats of GA have their own seeds, different from seeds of PSO
+        seeds = spawn_seeds((self.seed, len(self.avg_y) - 1, 1), self.repeats)
+        if self.workers > 1 and self.repeats > 1:
+            with ProcessPoolExecutor(min(self.workers, self.repeats)) as executor:
+                y_ga = list(executor.map(run_ga_repeat, [input_data['dimension']] * self.repeats,
+                                         [opt_function] * self.repeats, [generations] * self.repeats,
+                                         seeds, [ga_kwargs] * self.repeats))
+        else:
+            y_ga = [run_ga_repeat(input_data['dimension'], opt_function, generations, seed, ga_kwargs)
+                    for seed in seeds]
+        iterations_ga = [generations] * self.repeats
+        print(f'GA solutions: {y_ga}')
 
         if self.save_csv_details:
             write_csv(
@@ -171,22 +404,28 @@ class TaskManager:
                 zip(y_ga, iterations_ga)
             )
 
-    def lcso_task(self, user_input, input_data):
-        # init classes
+    def build_lcso(self, input_data) -> tuple:
+        """optimizer of input with kwargs of its evaluate"""
         opt_function = OptimizationFunction(input_data['function'])
-        lcso = LCSO(
-            input_data['population'],
-            input_data['dimension'],
+        # vectorized: use array-backed engine instead of list of dicts
+        lcso_class = algorithm_class('lcso', input_data.get('vectorized', False))
+        lcso = self.create_so(
+            lcso_class,
+            input_data,
             opt_function,
-            input_data['no_swarms'],
+            no_swarms=input_data['no_swarms'],
             velocity_magnitude=input_data.get('velocity_magnitude', 0.0)
         )
 
         evaluate_kwargs = {
             'iterations': input_data.get('iterations', None)
         }
+        return lcso, evaluate_kwargs
+
+    def lcso_task(self, user_input, input_data):
+        lcso, evaluate_kwargs = self.build_lcso(input_data)
 
-        y, iterations, times = self.so_task(lcso, **evaluate_kwargs)
+        y, iterations, times, seeds = self.so_task(lcso, user_input, **evaluate_kwargs)
 
         # save to csv y and iterations
         if self.save_csv_details:
@@ -194,8 +433,9 @@ class TaskManager:
                 f'{user_input}.csv',
                 (f'{user_input}_solution',
                  f'{user_input}_iterations',
-                 f'{user_input}_runtime'),
-                zip(y, iterations, times)
+                 f'{user_input}_runtime',
+                 f'{user_input}_seed'),
+                zip(y, iterations, times, seeds)
             )
         # take only actual repeats (from the last input)
         cur_y_matrix = self.y_matrix[-self.repeats:]
@@ -208,22 +448,28 @@ class TaskManager:
                 zip_longest(*cur_y_matrix[::-1])
             )
 
-    def cso_task(self, user_input, input_data):
-        # init classes
+    def build_cso(self, input_data) -> tuple:
+        """optimizer of input with kwargs of its evaluate"""
         opt_function = OptimizationFunction(input_data['function'])
-        cso = CSO(
-            input_data['population'],
-            input_data['dimension'],
+        # vectorized: use array-backed engine instead of list of dicts
+        cso_class = algorithm_class('cso', input_data.get('vectorized', False))
+        cso = self.create_so(
+            cso_class,
+            input_data,
             opt_function,
-            input_data['no_swarms'],
+            no_swarms=input_data['no_swarms'],
             velocity_magnitude=input_data.get('velocity_magnitude', 0.0)
         )
 
         evaluate_kwargs = {
             'iterations': input_data.get('iterations', None)
         }
+        return cso, evaluate_kwargs
 
-        y, iterations, times = self.so_task(cso, **evaluate_kwargs)
+    def cso_task(self, user_input, input_data):
+        cso, evaluate_kwargs = self.build_cso(input_data)
+
+        y, iterations, times, seeds = self.so_task(cso, user_input, **evaluate_kwargs)
 
         # save to csv y and iterations
         if self.save_csv_details:
@@ -231,8 +477,9 @@ class TaskManager:
                 f'{user_input}.csv',
                 (f'{user_input}_solution',
                  f'{user_input}_iterations',
-                 f'{user_input}_runtime'),
-                zip(y, iterations, times)
+                 f'{user_input}_runtime',
+                 f'{user_input}_seed'),
+                zip(y, iterations, times, seeds)
             )
         # take only actual repeats (from the last input)
         cur_y_matrix = self.y_matrix[-self.repeats:]
@@ -245,23 +492,31 @@ class TaskManager:
                 zip_longest(*cur_y_matrix[::-1])
             )
 
-    def glpso_task(self, user_input, input_data):
-        # init classes
+    def build_glpso(self, input_data) -> tuple:
+        """optimizer of input with kwargs of its evaluate"""
         opt_function = OptimizationFunction(input_data['function'])
-        glpso = GLPSO(
-            input_data['population'],
-            input_data['dimension'],
+        # vectorized: use array-backed engine instead of list of dicts
+        glpso_class = algorithm_class('glpso', input_data.get('vectorized', False))
+        glpso = self.create_so(
+            glpso_class,
+            input_data,
             opt_function,
-            input_data['pm'],
+            pm=input_data['pm'],
             levy=input_data.get('levy', False),
+            levy_probability=input_data.get('levy_probability', 0.02),
+            levy_scale=input_data.get('levy_scale', 1.0),
             **self.w_parameters[input_data['w_set']]
         )
 
         evaluate_kwargs = {
             'iterations': input_data.get('iterations', None)
         }
+        return glpso, evaluate_kwargs
+
+    def glpso_task(self, user_input, input_data):
+        glpso, evaluate_kwargs = self.build_glpso(input_data)
 
-        y, iterations, times = self.so_task(glpso, **evaluate_kwargs)
+        y, iterations, times, seeds = self.so_task(glpso, user_input, **evaluate_kwargs)
 
         # save to csv y and iterations
         if self.save_csv_details:
@@ -269,8 +524,9 @@ class TaskManager:
                 f'{user_input}.csv',
                 (f'{user_input}_solution',
                  f'{user_input}_iterations',
-                 f'{user_input}_runtime'),
-                zip(y, iterations, times)
+                 f'{user_input}_runtime',
+                 f'{user_input}_seed'),
+                zip(y, iterations, times, seeds)
             )
         # take only actual repeats (from the last input)
         cur_y_matrix = self.y_matrix[-self.repeats:]
@@ -283,22 +539,30 @@ class TaskManager:
                 zip_longest(*cur_y_matrix[::-1])
             )
 
-    def ba_task(self, user_input, input_data):
-        # init classes
+    def build_ba(self, input_data) -> tuple:
+        """optimizer of input with kwargs of its evaluate"""
         opt_function = OptimizationFunction(input_data['function'])
-        pso = PSO(
-            input_data['population'],
-            input_data['dimension'],
+        # vectorized: use array-backed engine instead of list of dicts
+        ba_class = algorithm_class('ba', input_data.get('vectorized', False))
+        ba = self.create_so(
+            ba_class,
+            input_data,
             opt_function,
             levy=input_data.get('levy', False),
-            **input_data.get('parameters', None)
+            levy_probability=input_data.get('levy_probability', 0.02),
+            levy_scale=input_data.get('levy_scale', 1.0),
+            **input_data.get('parameters', {})
         )
 
         evaluate_kwargs = {
             'iterations': input_data.get('iterations', None)
         }
+        return ba, evaluate_kwargs
+
+    def ba_task(self, user_input, input_data):
+        ba, evaluate_kwargs = self.build_ba(input_data)
 
-        y, iterations, times = self.so_task(pso, **evaluate_kwargs)
+        y, iterations, times, seeds = self.so_task(ba, user_input, **evaluate_kwargs)
 
         # save to csv y and iterations
         if self.save_csv_details:
@@ -306,8 +570,9 @@ class TaskManager:
                 f'{user_input}.csv',
                 (f'{user_input}_solution',
                  f'{user_input}_iterations',
-                 f'{user_input}_runtime'),
-                zip(y, iterations, times)
+                 f'{user_input}_runtime',
+                 f'{user_input}_seed'),
+                zip(y, iterations, times, seeds)
             )
         # take only actual repeats (from the last input)
         cur_y_matrix = self.y_matrix[-self.repeats:]
@@ -1,6 +1,7 @@
 import pytest
 
 from app.optimization_functions import OptimizationFunction
+from task_manager import TaskManager
 
 
 @pytest.fixture
@@ -20,3 +21,20 @@ def sum_opt_funct(opt_funct):
 @pytest.fixture
 def f1_opt_funct(opt_funct):
     return opt_funct('f1', (-100, 100), 0.1)
+
+
+@pytest.fixture
+def task_manager():
+    """TaskManager running given inputs (name: input data) with settings overriding defaults"""
+    def _make_task_manager(inputs, **settings):
+        data = {
+            'settings': {
+                'repeats': 3, 'seed': 7, 'activate_ga': False, 'hide_prints': True,
+                'save_csv_summary': False, 'save_csv_details': False, 'save_csv_y_matrix': False,
+                **settings
+            },
+            'w_parameters': {'a': {'w_v': 0.729, 'w_g': 1.494, 'w_l': 1.494}},
+            **inputs
+        }
+        return TaskManager(data, list(inputs), list(inputs.values()))
+    return _make_task_manager
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+from app.ArrayGLPSO import ArrayGLPSO
+
+
+@pytest.mark.parametrize('levy', [False, True])
+def test_array_glpso_step_f1(f1_opt_funct, levy):
+    glpso = ArrayGLPSO(100, 5, f1_opt_funct, 0.05, levy=levy, w_v=[0.5, 1], w_l=[0.5, 1.5], w_g=[0.5, 1.5])
+    best_solution_y = float('inf')
+    for _ in range(30):
+        glpso.step()
+        assert glpso.y <= best_solution_y
+        assert np.all(np.abs(glpso.x) <= 100)
+        assert glpso.y == pytest.approx(f1_opt_funct(glpso.best_global.tolist()))
+        assert np.allclose(glpso.y_best, f1_opt_funct.batch(glpso.best_local))
+        assert np.allclose(glpso.y_exemplars, f1_opt_funct.batch(glpso.exemplars))
+        best_solution_y = glpso.y
+
+
+def test_array_glpso_evaluate(f1_opt_funct):
+    glpso = ArrayGLPSO(50, 10, f1_opt_funct, 0.05, seed=3)
+    y = glpso.evaluate(iterations=100)
+    assert len(glpso.logs['y']) == 100
+    assert y < 10 * 100 ** 2 / 10
+    assert y == ArrayGLPSO(50, 10, f1_opt_funct, 0.05, seed=3).evaluate(iterations=100)
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from app.ArrayCSO import ArrayCSO
+from app.ArrayLCSO import ArrayLCSO
+
+
+@pytest.mark.parametrize('so_class, group_size', [(ArrayCSO, 2), (ArrayLCSO, 3)])
+def test_group(f1_opt_funct, so_class, group_size):
+    so = so_class(47, 3, f1_opt_funct, 4)
+    groups, swarms = so.group(group_size)
+    assert groups.shape[1] == group_size
+    assert len(np.unique(groups)) == groups.size
+    # every group is taken from one swarm
+    assert np.all(so.swarm_ids[groups] == swarms[:, np.newaxis])
+    # only len(swarm) % group_size particles are left out in every swarm
+    assert groups.size == sum(s - s % group_size for s in so.swarm_sizes)
+
+
+@pytest.mark.parametrize('so_class', [ArrayCSO, ArrayLCSO])
+def test_step_f1(f1_opt_funct, so_class):
+    so = so_class(60, 5, f1_opt_funct, 4, velocity_magnitude=1e-3)
+    best_solution_y = float('inf')
+    for _ in range(30):
+        so.step()
+        assert so.y <= best_solution_y
+        assert np.all(np.abs(so.x) <= 100)
+        assert np.allclose(so.y_particles, f1_opt_funct.batch(so.x))
+        assert so.y == pytest.approx(f1_opt_funct(so.best_global.tolist()))
+        best_solution_y = so.y
+
+
+@pytest.mark.parametrize('so_class, no_swarms, population', [
+    (ArrayCSO, 1, 10), (ArrayCSO, 5, 9), (ArrayLCSO, 2, 30), (ArrayLCSO, 5, 14)
+])
+def test_validation(f1_opt_funct, so_class, no_swarms, population):
+    with pytest.raises(Exception):
+        so_class(population, 2, f1_opt_funct, no_swarms)
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from app.ArrayPSO import ArrayPSO
+
+
+def test_array_pso(sum_opt_funct):
+    population = 5
+    dimension = 2
+    pso = ArrayPSO(population, dimension, sum_opt_funct)
+    assert pso.x.shape == (population, dimension)
+    assert pso.v.shape == (population, dimension)
+    assert pso.best_local.shape == (population, dimension)
+    assert len(pso.best_global) == dimension
+    assert np.all(sum_opt_funct.x_range[0] <= pso.x)
+    assert np.all(pso.x <= sum_opt_funct.x_range[1])
+    assert list(pso.y_best) == [sum(x) for x in pso.x.tolist()]
+
+
+def test_array_pso_evaluate(f1_opt_funct):
+    pso = ArrayPSO(20, 5, f1_opt_funct)
+    with pytest.raises(Exception):
+        pso.evaluate(iterations=0)
+    assert 0 <= pso.evaluate(iterations=50) <= 5 * 100 ** 2
+    assert len(pso.logs['y']) == 50
+    pso.reset()
+    assert 0 <= pso.evaluate(iterations=50, alternative=True) <= 5 * 100 ** 2
+
+
+@pytest.mark.parametrize('alternative', [False, True])
+def test_array_pso_step_f1(f1_opt_funct, alternative):
+    pso = ArrayPSO(200, 3, f1_opt_funct, w_v=[0.5, 1], w_l=[0.5, 1.5], w_g=[0.5, 1.5])
+    best_solution_y = float('inf')
+    for _ in range(30):
+        pso.alt_step() if alternative else pso.step()
+        assert pso.y <= best_solution_y
+        assert np.all(np.abs(pso.x) <= 100)
+        assert pso.y == pytest.approx(f1_opt_funct(pso.best_global.tolist()))
+        assert np.allclose(pso.y_best, f1_opt_funct.batch(pso.best_local))
+        best_solution_y = pso.y
+    assert pso.alternative is False
+
+
+def test_array_pso_seed(f1_opt_funct):
+    first = ArrayPSO(30, 4, f1_opt_funct, seed=7).evaluate(iterations=20)
+    second = ArrayPSO(30, 4, f1_opt_funct, seed=7).evaluate(iterations=20)
+    assert first == second
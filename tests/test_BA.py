@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+from app.ArrayBA import ArrayBA
+from app.BA import BA
+
+
+@pytest.mark.parametrize('levy', [False, True])
+def test_ba_step_f1(f1_opt_funct, levy):
+    ba = BA(20, 3, f1_opt_funct, levy=levy)
+    best_solution_y = float('inf')
+    for _ in range(20):
+        ba.step()
+        assert ba.y <= best_solution_y
+        assert len(ba.best_global) == 3
+        assert ba.loudness_sum == pytest.approx(sum(bat['A'] for bat in ba.bats))
+        best_solution_y = ba.y
+
+
+@pytest.mark.parametrize('levy', [False, True])
+def test_array_ba_step_f1(f1_opt_funct, levy):
+    ba = ArrayBA(100, 5, f1_opt_funct, levy=levy, freq_range=(0.0, 2.0), mod_r=0.8, mod_A=0.9)
+    best_solution_y = float('inf')
+    for _ in range(30):
+        ba.step()
+        assert ba.y <= best_solution_y
+        assert ba.y == pytest.approx(f1_opt_funct(ba.best_global.tolist()))
+        assert ba.loudness_sum == pytest.approx(np.sum(ba.A))
+        best_solution_y = ba.y
+
+
+def test_array_ba_same_as_ba(f1_opt_funct):
+    ba = BA(20, 3, f1_opt_funct, seed=5)
+    array_ba = ArrayBA(20, 3, f1_opt_funct, seed=5)
+    for _ in range(30):
+        assert array_ba.step() == pytest.approx(ba.step())
+        assert np.allclose(array_ba.best_global, ba.best_global)
+        assert np.allclose(array_ba.x, [bat['x'] for bat in ba.bats])
+        assert np.allclose(array_ba.A, [bat['A'] for bat in ba.bats])
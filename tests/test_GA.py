@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+pytest.importorskip('pygad')
+
+from app.GA import GA
+from task_manager import run_ga_repeat
+
+
+def test_batch_fitness_same_as_per_solution(f1_opt_funct):
+    # pygad seeds global random state, every run has to follow its own construction
+    single = GA(5, f1_opt_funct, 30, random_seed=1, fitness_batch_size=None)
+    single.run()
+    batched = GA(5, f1_opt_funct, 30, random_seed=1)
+    batched.run()
+    assert batched.ga_instance.fitness_batch_size == 50
+    assert np.allclose(batched.ga_instance.last_generation_fitness, single.ga_instance.last_generation_fitness)
+    assert batched.best_solution()[1] == pytest.approx(single.best_solution()[1])
+
+
+def test_kwargs_override_defaults(f1_opt_funct):
+    ga = GA(5, f1_opt_funct, 10, num_parents_mating=4, sol_per_pop=20, mutation_percent_genes=20)
+    assert (ga.ga_instance.num_parents_mating, ga.ga_instance.sol_per_pop) == (4, 20)
+    assert ga.ga_instance.fitness_batch_size == 20
+
+
+def test_seeded_repeats(f1_opt_funct):
+    kwargs = {'sol_per_pop': 20}
+    # seeds above 2 ** 32 are folded into range of pygad
+    seed = 2 ** 40 + 3
+    assert run_ga_repeat(5, f1_opt_funct, 20, seed, kwargs) == run_ga_repeat(5, f1_opt_funct, 20, seed, kwargs)
+    assert run_ga_repeat(5, f1_opt_funct, 20, 3, kwargs) != run_ga_repeat(5, f1_opt_funct, 20, 4, kwargs)
@@ -0,0 +1,95 @@
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from app.ArrayBA import ArrayBA
+from app.ArrayCSO import ArrayCSO
+from app.ArrayGLPSO import ArrayGLPSO
+from app.ArrayPSO import ArrayPSO
+from app.BA import BA
+from app.CSO import CSO
+from app.GLPSO import GLPSO
+from app.IslandModel import IslandModel, migration_sources
+from app.LCSO import LCSO
+from app.PSO import PSO
+from app.random_stream import RandomStream
+
+
+def test_migration_sources():
+    rng = RandomStream(1)
+    assert migration_sources('ring', 3, rng) == [[2], [0], [1]]
+    assert migration_sources('full', 3, rng) == [[1, 2], [0, 2], [0, 1]]
+    for i, sources in enumerate(migration_sources('random', 5, rng)):
+        assert len(sources) == 1 and sources[0] != i
+    with pytest.raises(Exception):
+        migration_sources('star', 3, rng)
+
+
+@pytest.mark.parametrize('so_class, kwargs', [
+    (PSO, {}),
+    (GLPSO, {'pm': 0.1}),
+    (CSO, {'no_swarms': 2}),
+    (LCSO, {'no_swarms': 3}),
+    (ArrayPSO, {}),
+    (ArrayGLPSO, {'pm': 0.1}),
+    (ArrayCSO, {'no_swarms': 2}),
+    (BA, {}),
+    (ArrayBA, {})
+])
+def test_migration(f1_opt_funct, so_class, kwargs):
+    source = so_class(12, 3, f1_opt_funct, seed=1, **kwargs)
+    target = so_class(12, 3, f1_opt_funct, seed=2, **kwargs)
+    source.evaluate(5)
+    xs, ys = source.emigrants(2)
+    assert xs.shape == (2, 3) and list(ys) == sorted(ys)
+    assert ys[0] == pytest.approx(f1_opt_funct(list(xs[0])))
+
+    # immigrants known to be better than anything on target island
+    ys = np.array([-2.0, -1.0])
+    target.immigrate(xs, ys)
+    assert target.y == -2.0
+    assert list(target.best_global) == list(xs[0])
+    assert target.emigrants(2)[1].tolist() == [-2.0, -1.0]
+
+
+@pytest.mark.parametrize('topology', ['ring', 'full', 'random'])
+def test_island_model(f1_opt_funct, topology):
+    islands = IslandModel(30, 3, f1_opt_funct, PSO, 3, migration_interval=4, migrants=2,
+                          topology=topology, processes=False, seed=5)
+    assert [island.population for island in islands.islands] == [10, 10, 10]
+    y = islands.evaluate(10)
+    # iterations are rounded up to whole epochs
+    assert islands.logs['iterations'] == 12
+    assert len(islands.logs['y']) == 12
+    assert y == islands.y == min(islands.logs['y'])
+    assert y == pytest.approx(f1_opt_funct(list(islands.best_global)))
+
+
+def test_processes_match_serial(f1_opt_funct):
+    serial = IslandModel(20, 3, f1_opt_funct, CSO, 2, migration_interval=3, processes=False,
+                         seed=7, no_swarms=2)
+    parallel = IslandModel(20, 3, f1_opt_funct, CSO, 2, migration_interval=3, processes=True,
+                           seed=7, no_swarms=2)
+    try:
+        assert parallel.evaluate(9) == serial.evaluate(9)
+        assert parallel.logs['y'] == serial.logs['y']
+    finally:
+        parallel.close()
+
+
+def test_workers_started_on_first_epoch(f1_opt_funct):
+    islands = IslandModel(20, 3, f1_opt_funct, PSO, 2, migration_interval=3, seed=7)
+    # model which never runs has no workers to stop
+    assert islands.workers == []
+    islands.close()
+    try:
+        islands.reset()
+        assert islands.workers == []
+        y = islands.evaluate(3)
+        assert len(islands.workers) == 2
+    finally:
+        islands.close()
+    assert islands.workers == [] and multiprocessing.active_children() == []
+    # islands are brought back from workers
+    assert min(island.y for island in islands.islands) == y
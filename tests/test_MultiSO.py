@@ -0,0 +1,18 @@
+import pytest
+from app.CSO import CSO
+from app.LCSO import LCSO
+
+
+@pytest.mark.parametrize('so_class', [CSO, LCSO])
+def test_cached_values(f1_opt_funct, so_class):
+    so = so_class(40, 3, f1_opt_funct, 4, velocity_magnitude=1e-3)
+    assert sorted(p for swarm in so.swarms for p in swarm) == list(range(40))
+    best_solution_y = so.y
+    for _ in range(20):
+        so.step()
+        assert not so.moved
+        for particle in so.particles:
+            assert particle['y'] == pytest.approx(f1_opt_funct(particle['x']))
+        assert so.y == min(particle['y'] for particle in so.particles)
+        assert so.y <= best_solution_y
+        best_solution_y = so.y
@@ -114,6 +114,15 @@ def test_pso_alt_step_f1(f1_opt_funct):
         best_solution_x = pso.best_global.copy()
 
 
+def test_pso_alt_step_keeps_variant(f1_opt_funct):
+    pso = PSO(20, 2, f1_opt_funct)
+    pso.alt_step()
+    assert pso.alternative is False
+    pso.alternative = True
+    pso.alt_step()
+    assert pso.alternative is True
+
+
 def test_pso_alt_step_f1_1particle(f1_opt_funct):
     pso = PSO(1, 5, f1_opt_funct)
     best_solution_x = None
@@ -126,3 +135,11 @@ def test_pso_alt_step_f1_1particle(f1_opt_funct):
             assert pso.best_global != best_solution_x
         best_solution_y = pso.y
         best_solution_x = pso.best_global.copy()
+
+
+def test_pso_cached_local_best(f1_opt_funct):
+    pso = PSO(20, 3, f1_opt_funct)
+    for _ in range(10):
+        pso.step()
+        for particle in pso.particles:
+            assert particle['y_best'] == pytest.approx(f1_opt_funct(particle['best_local']))
@@ -0,0 +1,90 @@
+import os
+
+import pytest
+
+from app.ArrayCSO import ArrayCSO
+from app.BA import BA
+from app.PSO import PSO
+from app.RestartModel import RestartModel
+
+
+@pytest.mark.parametrize('so_class, kwargs', [
+    (PSO, {}),
+    (ArrayCSO, {'no_swarms': 2}),
+    (BA, {})
+])
+def test_restarts(opt_funct, so_class, kwargs):
+    model = RestartModel(10, 3, opt_funct('f5', (-5.12, 5.12), 30), so_class, stagnation=5,
+                         max_population=30, seed=1, **kwargs)
+    model.evaluate(100)
+    restarts = model.logs['restarts']
+    assert restarts
+    # population doubles up to max_population
+    assert [r['population'] for r in restarts][:3] == [20, 30, 30]
+    assert [r['iteration'] for r in restarts] == sorted(r['iteration'] for r in restarts)
+    # best of all runs is kept
+    assert list(model.logs['y']) == sorted(model.logs['y'], reverse=True)
+    assert model.y <= min(r['y_run'] for r in restarts)
+    assert model.y == pytest.approx(model.opt_fun(model.best_global))
+
+
+def test_kwargs_of_restarted_optimizers(opt_funct):
+    model = RestartModel(10, 3, opt_funct('f1', (-100, 100), 0.1), ArrayCSO, seed=1, no_swarms=2,
+                         checkpoint_config='abc', keep_history=True, stopping={'max_evaluations': 100})
+    # configuration of the model stays with it
+    assert model.so_kwargs == {'no_swarms': 2}
+
+
+def test_evaluations_of_all_runs(opt_funct):
+    model = RestartModel(10, 3, opt_funct('f1', (-100, 100), 0.1), PSO, stagnation=3, tolerance=1e9,
+                         population_factor=1, seed=2)
+    model.evaluate(10)
+    # y of every run improves only in its first iteration (from infinity), restart after 3 more
+    assert [r['iteration'] for r in model.logs['restarts']] == [4, 8]
+    # starting particles of 3 runs and 10 iterations
+    assert model.logs['evaluations'] == 3 * 10 + 10 * 10
+
+
+def test_max_restarts(opt_funct):
+    model = RestartModel(10, 3, opt_funct('f1', (-100, 100), 0.1), PSO, stagnation=3, tolerance=1e9,
+                         max_restarts=2, seed=3)
+    model.evaluate(100)
+    assert model.logs['stop_reason'] == 'restarts'
+    assert model.logs['iterations'] == 12
+    assert len(model.logs['restarts']) == 2
+
+
+def test_budget(opt_funct):
+    model = RestartModel(10, 3, opt_funct('f5', (-5.12, 5.12), 30), PSO, stagnation=5, seed=4,
+                         stopping={'max_evaluations': 2000})
+    model.evaluate()
+    assert model.logs['stop_reason'] == 'max_evaluations'
+    assert 2000 - 4 * model.population < model.logs['evaluations'] <= 2000
+
+
+def test_resume(opt_funct, tmp_path):
+    checkpoint = str(tmp_path / 'restarts.pkl')
+
+    def model(fun, **kwargs):
+        return RestartModel(10, 3, fun, PSO, stagnation=4, checkpoint_interval=7, **kwargs)
+    full = model(opt_funct('f5', (-5.12, 5.12), 30), seed=5)
+    full.evaluate(40)
+    assert full.logs['restarts']
+
+    fun = opt_funct('f5', (-5.12, 5.12), 30)
+    function, calls = fun.opt_function, [0]
+
+    def interrupted(x):
+        calls[0] += 1
+        if calls[0] > 600:
+            raise KeyboardInterrupt()
+        return function(x)
+    fun.opt_function = interrupted
+    with pytest.raises(KeyboardInterrupt):
+        model(fun, seed=5, checkpoint=checkpoint).evaluate(40)
+    assert os.path.exists(checkpoint)
+
+    resumed = model(opt_funct('f5', (-5.12, 5.12), 30), checkpoint=checkpoint)
+    assert resumed.evaluate(40) == pytest.approx(full.y)
+    assert resumed.logs['y'] == pytest.approx(full.logs['y'])
+    assert resumed.logs['restarts'] == full.logs['restarts']
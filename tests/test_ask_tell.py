@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from app.ArrayBA import ArrayBA
+from app.ArrayCSO import ArrayCSO
+from app.ArrayGLPSO import ArrayGLPSO
+from app.ArrayLCSO import ArrayLCSO
+from app.ArrayPSO import ArrayPSO
+from app.BA import BA
+from app.CSO import CSO
+from app.GLPSO import GLPSO
+from app.LCSO import LCSO
+from app.PSO import PSO
+
+ENGINES = [
+    (PSO, {}, 1),
+    (GLPSO, {'pm': 0.1}, 2),
+    (CSO, {'no_swarms': 2}, 1),
+    (LCSO, {'no_swarms': 3}, 1),
+    (BA, {}, 2),
+    (ArrayPSO, {}, 1),
+    (ArrayGLPSO, {'pm': 0.1}, 2),
+    (ArrayCSO, {'no_swarms': 2}, 1),
+    (ArrayLCSO, {'no_swarms': 3}, 1),
+    (ArrayBA, {}, 2)
+]
+
+
+@pytest.mark.parametrize('so_class, kwargs, phases', ENGINES)
+def test_ask_tell_matches_evaluate(f1_opt_funct, so_class, kwargs, phases):
+    so = so_class(12, 3, f1_opt_funct, seed=3, **kwargs)
+    so.evaluate(10)
+
+    # the same run driven from outside
+    driven = so_class(12, 3, f1_opt_funct, seed=3, **kwargs)
+    logs_y = []
+    for _ in range(10):
+        for phase in range(phases):
+            positions = driven.ask()
+            assert positions.ndim == 2 and positions.shape[1] == 3
+            values = [f1_opt_funct(list(x)) for x in positions]
+            assert driven.tell(values) == (phase == phases - 1)
+        logs_y.append(driven.y)
+
+    assert driven.y == pytest.approx(so.y)
+    assert logs_y == pytest.approx(list(so.logs['y']))
+
+
+def test_pooled_evaluations(f1_opt_funct):
+    swarms = [PSO(10, 3, f1_opt_funct, seed=seed) for seed in range(3)]
+    alone = [PSO(10, 3, f1_opt_funct, seed=seed) for seed in range(3)]
+    for _ in range(5):
+        # one batch for all optimizers
+        asked = [so.ask() for so in swarms]
+        values = f1_opt_funct.batch(np.concatenate(asked))
+        for so, so_values in zip(swarms, np.split(values, np.cumsum([len(a) for a in asked])[:-1])):
+            assert so.tell(so_values)
+        for so in alone:
+            so.step()
+    assert [so.y for so in swarms] == pytest.approx([so.y for so in alone])
@@ -0,0 +1,48 @@
+from copy import deepcopy
+
+from app.benchmark import best_rate, function_benchmarks, optimizer_benchmarks, compare, load_baseline, \
+    save_baseline, restart
+
+
+def test_best_rate():
+    calls = []
+    rate = best_rate(lambda: calls.append(1), min_time=0.001, repeats=2)
+    assert rate > 0
+    # warmup and every repeat of the last number of calls
+    assert len(calls) > 2
+
+
+def test_best_rate_setup():
+    state = []
+    rate = best_rate(lambda: state.append(1), min_time=0.001, repeats=2, setup=state.clear)
+    assert rate > 0
+    # the last window started from cleared state, its number of calls is power of 2
+    assert len(state) > 1 and len(state) & (len(state) - 1) == 0
+
+
+def test_optimizer_restarted_for_every_window(f1_opt_funct):
+    from app.PSO import PSO
+    so = PSO(10, 3, f1_opt_funct, seed=0)
+    restart(so)
+    y, particles = so.y, deepcopy(so.particles)
+    so.evaluate(iterations=5)
+    restart(so)
+    assert so.y == y and so.particles == particles
+
+
+def test_benchmarks():
+    functions = function_benchmarks((10,), (5,), ('f1', 'f7'), min_time=0.001, repeats=1)
+    # f7 has fixed dimension
+    assert set(functions) == {'f1/scalar/p10/d5', 'f1/batch/p10/d5', 'f7/scalar/p10/d2', 'f7/batch/p10/d2'}
+    optimizers = optimizer_benchmarks((12,), (3,), min_time=0.001, repeats=1)
+    assert set(optimizers) == {f'{name}/p12/d3' for name in ('PSO', 'GLPSO', 'CSO', 'LCSO', 'BA')}
+    assert all(rate > 0 for rate in {**functions, **optimizers}.values())
+
+
+def test_compare(tmp_path):
+    path = str(tmp_path / 'baseline.json')
+    save_baseline(path, {'PSO/p10/d3': 100.0, 'BA/p10/d3': 100.0, 'CSO/p10/d3': 100.0})
+    baseline = load_baseline(path)
+    results = {'PSO/p10/d3': 95.0, 'BA/p10/d3': 80.0, 'LCSO/p10/d3': 1.0}
+    assert compare(results, baseline, 0.1) == [('BA/p10/d3', 100.0, 80.0)]
+    assert compare(results, baseline, 0.25) == []
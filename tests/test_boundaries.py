@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+from app.boundaries import boundary_switcher
+from app.utils import bounce
+
+STRATEGIES = ('reflect', 'clamp', 'wrap', 'random', 'absorb')
+
+
+@pytest.mark.parametrize('strategy', STRATEGIES)
+def test_inside_boundaries(strategy):
+    boundaries = (-1, 3)
+    rng = np.random.default_rng(0)
+    x = np.linspace(-30, 30, 600).reshape(-1, 3)
+    v = np.ones_like(x)
+    new_x, new_v = boundary_switcher(strategy)(x, v, boundaries, rng)
+    assert new_x.shape == x.shape
+    assert np.all(boundaries[0] <= new_x)
+    assert np.all(new_x <= boundaries[1])
+    # positions already inside are not changed
+    inside = (boundaries[0] <= x) & (x <= boundaries[1])
+    assert np.allclose(new_x[inside], x[inside])
+    assert new_v.shape == v.shape
+
+
+def test_reflect():
+    boundaries = (-1, 3)
+    x = np.linspace(-30, 30, 601)
+    reflected, _ = boundary_switcher('reflect')(x, None, boundaries, None)
+    assert np.allclose(reflected, [bounce(xi, boundaries) for xi in x])
+    assert np.allclose(reflected[x == 4], 2)
+
+
+def test_wrap_and_absorb():
+    boundaries = (0, 10)
+    x = np.array([-1.0, 5.0, 12.0])
+    v = np.array([-2.0, 1.0, 3.0])
+    wrapped, wrapped_v = boundary_switcher('wrap')(x, v, boundaries, None)
+    assert np.allclose(wrapped, [9, 5, 2])
+    assert np.allclose(wrapped_v, v)
+    absorbed, absorbed_v = boundary_switcher('absorb')(x, v, boundaries, None)
+    assert np.allclose(absorbed, [0, 5, 10])
+    assert np.allclose(absorbed_v, [0, 1, 0])
+
+
+@pytest.mark.parametrize('strategy', ('reflect', 'clamp', 'wrap', 'absorb'))
+def test_scalar_same_as_array(strategy):
+    boundaries = (-1, 3)
+    x = np.linspace(-30, 30, 601)
+    v = np.ones_like(x)
+    new_x, new_v = boundary_switcher(strategy)(x, v, boundaries, None)
+    scalar = [boundary_switcher(strategy, scalar=True)(xi, vi, boundaries, None) for xi, vi in zip(x, v)]
+    assert np.allclose(new_x, [xi for xi, _ in scalar])
+    assert np.allclose(new_v, [vi for _, vi in scalar])
+
+
+def test_scalar_random():
+    boundaries = (-1, 3)
+    rng = np.random.default_rng(0)
+    reinitialise = boundary_switcher('random', scalar=True)
+    assert reinitialise(2.5, 1.0, boundaries, rng) == (2.5, 1.0)
+    x, v = reinitialise(7.0, 1.0, boundaries, rng)
+    assert boundaries[0] <= x <= boundaries[1] and v == 1.0
+
+
+def test_unknown_strategy():
+    with pytest.raises(Exception):
+        boundary_switcher('bounce')
+
+
+@pytest.mark.parametrize('strategy', STRATEGIES)
+def test_optimizers_boundary_option(f1_opt_funct, strategy):
+    from app.ArrayPSO import ArrayPSO
+    from app.PSO import PSO
+    for so in (PSO(20, 3, f1_opt_funct, boundary=strategy), ArrayPSO(20, 3, f1_opt_funct, boundary=strategy)):
+        so.evaluate(iterations=10)
+        assert so.boundary_handler is boundary_switcher(strategy)
+        assert all(-100 <= x <= 100 for x in so.best_global)
+
+
+@pytest.mark.parametrize('strategy', STRATEGIES)
+def test_list_engines_boundary_option(f1_opt_funct, strategy):
+    from app.BA import BA
+    from app.CSO import CSO
+    from app.GLPSO import GLPSO
+    from app.LCSO import LCSO
+    for so in (BA(20, 3, f1_opt_funct, boundary=strategy), CSO(20, 3, f1_opt_funct, 2, boundary=strategy),
+               GLPSO(20, 3, f1_opt_funct, 0.1, boundary=strategy), LCSO(21, 3, f1_opt_funct, 3, boundary=strategy)):
+        so.evaluate(iterations=10)
+        assert so.boundary_handler_scalar is boundary_switcher(strategy, scalar=True)
+        assert all(-100 <= x <= 100 for x in so.best_global)
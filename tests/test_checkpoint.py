@@ -0,0 +1,107 @@
+import os
+
+import pytest
+
+from app.ArrayCSO import ArrayCSO
+from app.BA import BA
+from app.GLPSO import GLPSO
+from app.IslandModel import IslandModel
+from app.PSO import PSO
+
+
+class Interrupted(Exception):
+    pass
+
+
+def interrupt_after(opt_fun, calls):
+    """makes opt_fun fail after given number of evaluated positions, like killed process"""
+    function = opt_fun.opt_function
+    counter = [0]
+
+    def interrupted(x):
+        counter[0] += 1
+        if counter[0] > calls:
+            raise Interrupted()
+        return function(x)
+    opt_fun.opt_function = interrupted
+
+
+@pytest.mark.parametrize('so_class, kwargs, calls', [
+    (PSO, {}, 250),
+    (GLPSO, {'pm': 0.1}, 600),
+    (BA, {}, 400),
+    (ArrayCSO, {'no_swarms': 2}, 100)
+])
+def test_resume(opt_funct, tmp_path, so_class, kwargs, calls):
+    checkpoint = str(tmp_path / 'so.pkl')
+    so = so_class(10, 3, opt_funct('f1', (-100, 100), 0.1), seed=1, **kwargs)
+    so.evaluate(30)
+
+    interrupted_fun = opt_funct('f1', (-100, 100), 0.1)
+    interrupt_after(interrupted_fun, calls)
+    interrupted = so_class(10, 3, interrupted_fun, seed=1, checkpoint=checkpoint,
+                           checkpoint_interval=4, **kwargs)
+    with pytest.raises(Interrupted):
+        interrupted.evaluate(30)
+    assert os.path.exists(checkpoint)
+
+    # new process with different seed continues interrupted run
+    resumed = so_class(10, 3, opt_funct('f1', (-100, 100), 0.1), seed=2, checkpoint=checkpoint, **kwargs)
+    assert resumed.evaluate(30) == pytest.approx(so.y)
+    assert resumed.logs['y'] == pytest.approx(so.logs['y'])
+    assert resumed.logs['seed'] == 1
+    # finished run does not leave checkpoint
+    assert not os.path.exists(checkpoint)
+
+
+def test_resume_accuracy_mode(opt_funct, tmp_path):
+    checkpoint = str(tmp_path / 'so.pkl')
+    so = PSO(10, 3, opt_funct('f1', (-100, 100), 0.1), seed=3)
+    so.evaluate()
+
+    interrupted_fun = opt_funct('f1', (-100, 100), 0.1)
+    interrupt_after(interrupted_fun, 10 * so.logs['iterations'] // 2)
+    with pytest.raises(Interrupted):
+        PSO(10, 3, interrupted_fun, seed=3, checkpoint=checkpoint, checkpoint_interval=2).evaluate()
+
+    resumed = PSO(10, 3, opt_funct('f1', (-100, 100), 0.1), checkpoint=checkpoint)
+    assert resumed.evaluate() == pytest.approx(so.y)
+    assert resumed.logs['iterations'] == so.logs['iterations']
+
+
+def test_checkpoint_of_other_configuration(opt_funct, tmp_path):
+    checkpoint = str(tmp_path / 'so.pkl')
+    interrupted_fun = opt_funct('f1', (-100, 100), 0.1)
+    interrupt_after(interrupted_fun, 100)
+    with pytest.raises(Interrupted):
+        PSO(10, 3, interrupted_fun, seed=3, checkpoint=checkpoint, checkpoint_interval=2,
+            checkpoint_config='abc').evaluate(30)
+
+    # run of changed input starts from beginning and removes stale checkpoint
+    changed = PSO(10, 3, opt_funct('f1', (-100, 100), 0.1), seed=4, checkpoint=checkpoint, checkpoint_config='def')
+    assert changed.load_checkpoint() is None
+    assert not os.path.exists(checkpoint)
+    changed.evaluate(30)
+    assert changed.logs['seed'] == 4 and changed.logs['iterations'] == 30
+
+
+@pytest.mark.parametrize('processes', [False, True])
+def test_island_model_resume(opt_funct, tmp_path, processes):
+    checkpoint = str(tmp_path / 'islands.pkl')
+    islands = IslandModel(20, 3, opt_funct('f1', (-100, 100), 0.1), PSO, 2, migration_interval=3,
+                          processes=False, seed=4)
+    islands.evaluate(30)
+
+    interrupted_fun = opt_funct('f1', (-100, 100), 0.1)
+    interrupt_after(interrupted_fun, 350)
+    with pytest.raises(Interrupted):
+        IslandModel(20, 3, interrupted_fun, PSO, 2, migration_interval=3, processes=False,
+                    seed=4, checkpoint=checkpoint, checkpoint_interval=2).evaluate(30)
+
+    resumed = IslandModel(20, 3, opt_funct('f1', (-100, 100), 0.1), PSO, 2, migration_interval=3,
+                          processes=processes, checkpoint=checkpoint)
+    try:
+        assert resumed.evaluate(30) == pytest.approx(islands.y)
+        assert resumed.logs['y'] == pytest.approx(islands.logs['y'])
+    finally:
+        resumed.close()
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from app.PSO import PSO
+from app.ArrayPSO import ArrayPSO
+from app.evaluators import evaluator_switcher, SerialEvaluator, ThreadPoolEvaluator, ProcessPoolEvaluator
+
+
+def test_evaluator_switcher(opt_funct):
+    assert isinstance(evaluator_switcher(None), SerialEvaluator)
+    assert isinstance(evaluator_switcher({'type': 'thread', 'workers': 2}), ThreadPoolEvaluator)
+    evaluator = evaluator_switcher({'type': 'process', 'workers': 3, 'chunk_size': 5})
+    assert isinstance(evaluator, ProcessPoolEvaluator)
+    assert (evaluator.workers, evaluator.chunk_size) == (3, 5)
+    with pytest.raises(Exception):
+        evaluator_switcher({'type': 'gpu'})
+
+
+@pytest.mark.parametrize('config', [
+    {'type': 'thread', 'workers': 3},
+    {'type': 'thread', 'workers': 2, 'chunk_size': 7},
+    {'type': 'process', 'workers': 2}
+])
+def test_pool_keeps_order(f1_opt_funct, config):
+    positions = np.random.default_rng(0).uniform(-100, 100, (20, 4))
+    evaluator = evaluator_switcher(config)
+    try:
+        assert evaluator(f1_opt_funct, positions) == pytest.approx(f1_opt_funct.batch(positions))
+        assert len(evaluator(f1_opt_funct, np.empty((0, 4)))) == 0
+    finally:
+        evaluator.close()
+
+
+@pytest.mark.parametrize('so_class', [PSO, ArrayPSO])
+def test_same_result_with_pool(f1_opt_funct, so_class):
+    serial = so_class(10, 3, f1_opt_funct, seed=4)
+    pooled = so_class(10, 3, f1_opt_funct, seed=4, evaluator=ThreadPoolEvaluator(2))
+    assert pooled.evaluate(20) == serial.evaluate(20)
+    pooled.evaluator.close()
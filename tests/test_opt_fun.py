@@ -1,3 +1,5 @@
+import random
+
 import pytest
 from app.optimization_functions import OptimizationFunction
 
@@ -48,3 +50,22 @@ def test_f2_call():
         f('ok')
     with pytest.raises(TypeError):
         f(None)
+
+
+@pytest.mark.parametrize('fun_id', ['f1', 'f2', 'f3', 'f5', 'f7', 'f10', 'f11', 'f12', 'f17', 'f21', 'f24'])
+def test_batch_matches_call(fun_id):
+    f = OptimizationFunction(fun_id)
+    dimension = max(3, f.dimension_constraints[0]) if f.dimension_constraints[1] > 2 else 2
+    population = [[random.uniform(*f.x_range) for _ in range(dimension)] for _ in range(10)]
+    values = f.batch(population)
+    assert values.shape == (10,)
+    for x, y in zip(population, values):
+        assert y == pytest.approx(f(x), rel=1e-9, abs=1e-9)
+
+
+def test_batch_fallback():
+    f = OptimizationFunction('f1')
+    f.opt_function = sum
+    assert list(f.batch([[1, 2, 3], [-1, 0, 4]])) == [6, 3]
+    with pytest.raises(ValueError):
+        f.batch([1, 2, 3])
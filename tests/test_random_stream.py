@@ -0,0 +1,60 @@
+import pytest
+from app.ArrayBA import ArrayBA
+from app.ArrayCSO import ArrayCSO
+from app.ArrayGLPSO import ArrayGLPSO
+from app.ArrayLCSO import ArrayLCSO
+from app.ArrayPSO import ArrayPSO
+from app.BA import BA
+from app.CSO import CSO
+from app.GLPSO import GLPSO
+from app.LCSO import LCSO
+from app.PSO import PSO
+from app.random_stream import RandomStream, spawn_seeds
+
+FACTORIES = {
+    'pso': lambda f, **kw: PSO(20, 3, f, w_v=[0.4, 0.9], **kw),
+    'glpso': lambda f, **kw: GLPSO(20, 3, f, 0.05, levy=True, w_l=[0.5, 1.5], **kw),
+    'cso': lambda f, **kw: CSO(20, 3, f, 2, velocity_magnitude=1e-3, **kw),
+    'lcso': lambda f, **kw: LCSO(21, 3, f, 3, **kw),
+    'ba': lambda f, **kw: BA(20, 3, f, levy=True, **kw),
+    'array_pso': lambda f, **kw: ArrayPSO(20, 3, f, **kw),
+    'array_glpso': lambda f, **kw: ArrayGLPSO(20, 3, f, 0.05, levy=True, **kw),
+    'array_cso': lambda f, **kw: ArrayCSO(20, 3, f, 2, **kw),
+    'array_lcso': lambda f, **kw: ArrayLCSO(21, 3, f, 3, **kw),
+    'array_ba': lambda f, **kw: ArrayBA(20, 3, f, levy=True, **kw),
+}
+
+
+@pytest.mark.parametrize('name', FACTORIES)
+def test_seeded_runs_are_repeatable(f1_opt_funct, name):
+    first = FACTORIES[name](f1_opt_funct, seed=11)
+    first.evaluate(iterations=20)
+    second = FACTORIES[name](f1_opt_funct, seed=11)
+    second.evaluate(iterations=20)
+    assert first.logs == second.logs
+    assert first.logs['seed'] == 11
+
+    # reseed and reset gives the same run again
+    first.reseed(11)
+    first.reset()
+    first.evaluate(iterations=20)
+    assert first.logs == second.logs
+
+
+def test_random_stream():
+    rng = RandomStream()
+    assert isinstance(rng.seed, int)
+    assert rng.coefficients(0.5, (2, 3)) == 0.5
+    block = rng.coefficients([1, 2], (2, 3))
+    assert block.shape == (2, 3)
+    assert ((1 <= block) & (block < 2)).all()
+    state = rng.state
+    numbers = rng.random(5)
+    rng.state = state
+    assert (rng.random(5) == numbers).all()
+    assert sorted(rng.shuffled([3, 1, 2])) == [1, 2, 3]
+
+
+def test_spawn_seeds():
+    assert spawn_seeds(5, 4) == spawn_seeds(5, 4)
+    assert len(set(spawn_seeds(5, 4))) == 4
@@ -0,0 +1,79 @@
+import pytest
+
+from app.ArrayBA import ArrayBA
+from app.ArrayPSO import ArrayPSO
+from app.BA import BA
+from app.CSO import CSO
+from app.GLPSO import GLPSO
+from app.IslandModel import IslandModel
+from app.PSO import PSO
+from app.refinement import Refinement, refinement_switcher
+
+
+@pytest.mark.parametrize('so_class, kwargs', [
+    (PSO, {}),
+    (ArrayPSO, {}),
+    (GLPSO, {'pm': 0.05}),
+    (CSO, {'no_swarms': 2}),
+    (BA, {}),
+    (ArrayBA, {})
+])
+def test_refinement_improves_swarm(opt_funct, so_class, kwargs):
+    so = so_class(10, 5, opt_funct('f1', (-100, 100), 0.1), seed=1, **kwargs)
+    so.evaluate(5)
+    y, evaluations = so.y, so.evaluations
+    assert Refinement(top_k=2, evaluations=100)(so) > 0
+    assert so.y < y
+    # local search shares evaluations of optimizer, within its budget
+    assert evaluations < so.evaluations <= evaluations + 100
+    assert so.emigrants(1)[1][0] == pytest.approx(so.y)
+
+
+@pytest.mark.parametrize('method', ['L-BFGS-B', 'Nelder-Mead'])
+def test_evaluate_with_refinement(opt_funct, method):
+    plain = PSO(20, 5, opt_funct('f1', (-100, 100), 0.1), seed=2)
+    plain.evaluate(20)
+    refined = PSO(20, 5, opt_funct('f1', (-100, 100), 0.1), seed=2,
+                  refinement={'method': method, 'interval': 10, 'top_k': 2, 'evaluations': 200})
+    refined.evaluate(20)
+    assert refined.y < plain.y
+    assert refined.logs['y'][-1] == refined.y
+    assert 20 * 21 < refined.logs['evaluations'] <= 20 * 21 + 3 * 200
+
+
+@pytest.mark.parametrize('so_class', [BA, ArrayBA])
+def test_evaluate_bats_with_refinement(opt_funct, so_class):
+    plain = so_class(20, 5, opt_funct('f1', (-100, 100), 0.1), seed=2)
+    plain.evaluate(20)
+    refined = so_class(20, 5, opt_funct('f1', (-100, 100), 0.1), seed=2,
+                       refinement={'interval': 10, 'top_k': 2, 'evaluations': 200})
+    refined.evaluate(20)
+    assert refined.y < plain.y
+    assert refined.logs['y'][-1] == refined.y
+    # refined positions are flown from as rated ones
+    xs, ys = refined.emigrants(3)
+    assert ys[0] == pytest.approx(refined.y)
+    assert [refined.opt_fun(list(x)) for x in xs] == pytest.approx(ys.tolist())
+
+
+def test_refinement_config(opt_funct):
+    assert refinement_switcher(None) is None
+    assert refinement_switcher({'interval': 5}).due(10)
+    assert not refinement_switcher({}) and not Refinement().due(10)
+    with pytest.raises(Exception):
+        Refinement(method='BFGS')
+    with pytest.raises(Exception):
+        IslandModel(20, 3, opt_funct('f1', (-100, 100), 0.1), PSO, 2, processes=False, refinement={'interval': 5})
+
+
+@pytest.mark.parametrize('refinement', [
+    {'at_end': True, 'evaluations': 500},
+    {'interval': 40, 'top_k': 3, 'evaluations': 300},
+    {'interval': 5, 'top_k': 3, 'evaluations': 77}
+])
+def test_refinement_shares_budget(opt_funct, refinement):
+    so = ArrayPSO(20, 5, opt_funct('f5', (-5.12, 5.12), 30), seed=3, refinement=refinement,
+                  stopping={'max_evaluations': 1000})
+    so.evaluate()
+    assert so.logs['stop_reason'] == 'max_evaluations'
+    assert so.logs['evaluations'] <= 1000
@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from app.ArrayBA import ArrayBA
+from app.LCSO import LCSO
+from app.registry import algorithm_name, algorithm_class
+
+
+def test_algorithm_name():
+    assert algorithm_name('glpso_a_mod') == 'glpso'
+    assert algorithm_name('lcso_ex') == 'lcso'
+    assert algorithm_name('cso_f11_islands') == 'cso'
+    with pytest.raises(Exception):
+        algorithm_name('ga_f11')
+
+
+def test_algorithm_class():
+    assert algorithm_class('lcso') is LCSO
+    assert algorithm_class('ba', vectorized=True) is ArrayBA
+
+
+def test_lazy_imports():
+    # only modules of used algorithms are imported, GA (pygad) only when it is used
+    code = ('import sys, task_manager; '
+            'from app.registry import algorithm_class; algorithm_class("pso"); '
+            'print(sorted(m for m in sys.modules if m in ("app.PSO", "app.BA", "app.GA", "app.IslandModel", "pygad")))')
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout
+    assert output.strip() == "['app.PSO']"
@@ -0,0 +1,62 @@
+import csv
+
+import pytest
+
+from app.results import ResultsStore
+
+
+def result(y, repeat):
+    return {'y': y, 'iterations': 3, 'time': 10 * repeat, 'evaluations': 30, 'stop_reason': 'max_iterations',
+            'seed': 2 ** 64 - 1 - repeat, 'best_global': [0.0, 1.0], 'logs_y': [y + 2, y + 1, y]}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResultsStore(str(tmp_path / 'results.db'), batch_size=3)
+    yield store
+    store.close()
+
+
+def test_store(store):
+    run_id = store.add_run(1, 2, {'repeats': 2})
+    for repeat in range(2):
+        store.add_result(run_id, 'pso_a', 'abc', {'population': 10}, repeat, result(repeat, repeat))
+        store.add_result(run_id, 'pso_b', 'def', {'population': 20}, repeat, result(10 + repeat, repeat))
+    # batch of 3 is written, 1 is still buffered
+    assert len(store.buffer) == 1
+
+    summary = store.query('SELECT input, config_hash, repeats, avg_y, min_y, avg_times FROM summary ORDER BY input')
+    assert summary == [('pso_a', 'abc', 2, 0.5, 0.0, 5.0), ('pso_b', 'def', 2, 10.5, 10.0, 5.0)]
+    assert [list(curve) for curve in store.curves(run_id, 'pso_b')] == [[12, 11, 10], [13, 12, 11]]
+    # seeds out of range of sqlite integers are kept
+    assert store.query('SELECT seed FROM repeats WHERE repeat = 0 LIMIT 1') == [(str(2 ** 64 - 1),)]
+
+
+def test_runs_are_kept(store):
+    for run in range(2):
+        run_id = store.add_run(run, 1, {})
+        store.add_result(run_id, 'pso_a', 'abc', {'population': 10}, 0, result(run, 0))
+    assert store.query('SELECT run_id, avg_y FROM summary') == [(1, 0.0), (2, 1.0)]
+    assert store.query('SELECT COUNT(*) FROM configs') == [(1,)]
+
+
+def test_resumed_run(store):
+    run_id = store.add_run(1, 2, {})
+    store.add_result(run_id, 'pso_a', 'abc', {}, 0, result(1.0, 0))
+    assert store.add_run(1, 2, {}, run_id) == run_id
+    store.add_result(run_id, 'pso_a', 'abc', {}, 0, result(1.0, 0))
+    store.add_result(run_id, 'pso_a', 'abc', {}, 1, result(2.0, 1))
+    assert store.query('SELECT COUNT(*) FROM runs') == [(1,)]
+    assert store.query('SELECT run_id, repeats, avg_y FROM summary') == [(run_id, 2, 1.5)]
+
+
+def test_export_csv(store, tmp_path):
+    run_id = store.add_run(1, 2, {})
+    store.add_result(run_id, 'pso_a', 'abc', {}, 0, result(1.5, 0))
+    store.export_csv(str(tmp_path / 'details.csv'), 'details', run_id)
+    with open(tmp_path / 'details.csv') as f:
+        rows = list(csv.reader(f))
+    assert rows[0][:5] == ['run_id', 'input', 'config_hash', 'repeat', 'y']
+    assert rows[1][:5] == ['1', 'pso_a', 'abc', '0', '1.5']
+    with pytest.raises(Exception):
+        store.export_csv(str(tmp_path / 'runs.csv'), 'runs')
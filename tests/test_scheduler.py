@@ -0,0 +1,106 @@
+import csv
+import json
+import os
+from functools import partial
+
+import pytest
+
+from app.results import ResultsStore
+from scheduler import Scheduler
+
+INPUTS = {
+    'pso_a': {'function': 'f1', 'population': 10, 'dimension': 3, 'w_set': 'a', 'iterations': 5},
+    'ba_a': {'function': 'f1', 'population': 10, 'dimension': 3, 'iterations': 5}
+}
+
+
+@pytest.fixture
+def files(tmp_path, monkeypatch):
+    # task manager writes to files/ of working directory
+    monkeypatch.chdir(tmp_path)
+    os.mkdir('files')
+    return tmp_path / 'files'
+
+
+@pytest.fixture
+def task_manager(task_manager):
+    # inputs of module run by scheduler, with their csv files
+    return partial(task_manager, INPUTS, scheduler=True, save_csv_details=True, save_csv_y_matrix=True)
+
+
+def read_csv(path) -> list:
+    with open(path) as f:
+        return list(csv.reader(f))
+
+
+def test_jobs_longest_first(files, task_manager):
+    with open(files / 'runtimes.json', 'w') as f:
+        json.dump({'pso_a': 10.0}, f)
+    scheduler = Scheduler(task_manager())
+    scheduler.results = {user_input: [None, 'restored', None] for user_input in INPUTS}
+    # input without recorded runtime goes first, restored repeats are not run
+    assert [(user_input, repeat) for user_input, repeat, _ in scheduler.jobs()] == \
+        [('ba_a', 0), ('ba_a', 2), ('pso_a', 0), ('pso_a', 2)]
+
+    scheduler.runtimes = {'pso_a': 10.0, 'ba_a': 1.0}
+    assert [user_input for user_input, _, _ in scheduler.jobs()] == ['pso_a', 'pso_a', 'ba_a', 'ba_a']
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_same_results_as_inputs_loop(files, task_manager, workers):
+    tm = task_manager(scheduler=False)
+    tm.start_tasks()
+    scheduled = task_manager(workers=workers)
+    scheduled.start_tasks()
+    assert scheduled.avg_y == tm.avg_y
+    assert scheduled.avg_iterations == tm.avg_iterations
+
+    # rows are streamed in order of finished jobs
+    rows = read_csv(files / 'pso_a.csv')
+    assert rows[0] == ['repeat', 'pso_a_solution', 'pso_a_iterations', 'pso_a_runtime', 'pso_a_seed']
+    assert sorted(row[0] for row in rows[1:]) == ['1', '2', '3']
+    assert len(read_csv(files / 'ba_a_y_matrix.csv')) == 1 + 5
+    assert set(json.load(open(files / 'runtimes.json'))) == set(INPUTS)
+
+
+def test_resume(files, task_manager):
+    checkpoints = {'dir': str(files / 'checkpoints')}
+    task_manager(checkpoints=checkpoints).start_tasks()
+    rows = sorted(read_csv(files / 'pso_a.csv')[1:])
+    os.remove(files / 'checkpoints' / 'pso_a_1.json')
+    os.remove(files / 'ba_a_y_matrix.csv')
+
+    task_manager(checkpoints=checkpoints).start_tasks()
+    # restored repeats are kept in details, input restored as a whole still gets its y matrix
+    assert [row[:3] for row in sorted(read_csv(files / 'pso_a.csv')[1:])] == [row[:3] for row in rows]
+    assert len(read_csv(files / 'ba_a.csv')) == 4
+    assert os.path.exists(files / 'ba_a_y_matrix.csv')
+
+
+@pytest.mark.parametrize('scheduler', [False, True])
+def test_resume_changed_input(files, task_manager, monkeypatch, scheduler):
+    checkpoints = {'dir': str(files / 'checkpoints')}
+    task_manager(checkpoints=checkpoints, scheduler=scheduler).start_tasks()
+    os.remove(files / 'checkpoints' / 'pso_a_1.json')
+
+    monkeypatch.setitem(INPUTS, 'pso_a', {**INPUTS['pso_a'], 'iterations': 8})
+    tm = task_manager(checkpoints=checkpoints, scheduler=scheduler)
+    tm.start_tasks()
+    # results of 5 iterations are not restored for input changed to 8 iterations
+    assert tm.avg_iterations == [8, 5]
+    assert len(read_csv(files / 'pso_a_y_matrix.csv')) == 1 + 8
+
+
+@pytest.mark.parametrize('scheduler', [False, True])
+def test_resumed_run_in_database(files, task_manager, scheduler):
+    settings = {'checkpoints': {'dir': str(files / 'checkpoints')}, 'results': {'path': str(files / 'results.db')},
+                'scheduler': scheduler}
+    task_manager(**settings).start_tasks()
+    os.remove(files / 'checkpoints' / 'pso_a_1.json')
+
+    task_manager(**settings).start_tasks()
+    # resumed run continues the first one, restored repeats are not counted twice
+    store = ResultsStore(str(files / 'results.db'))
+    assert store.query('SELECT COUNT(*) FROM runs') == [(1,)]
+    assert store.query('SELECT input, repeats FROM summary ORDER BY input') == [('ba_a', 3), ('pso_a', 3)]
+    store.close()
@@ -0,0 +1,86 @@
+import pytest
+
+from app.ArrayPSO import ArrayPSO
+from app.CSO import CSO
+from app.IslandModel import IslandModel
+from app.PSO import PSO
+from app.stopping import stopping_switcher, MaxTime, Stagnation, RelativeImprovement, TargetFitness
+
+
+class Log:
+    """stands for optimizer in criteria"""
+    def __init__(self, y):
+        self.y = y
+
+
+def feed(criterion, ys):
+    """results of criterion for consecutive y-s"""
+    criterion.reset()
+    results, y_prev = [], float('inf')
+    for i, y in enumerate(ys):
+        results.append(criterion(Log(y), i + 1, y_prev))
+        y_prev = y
+    return results
+
+
+def test_stopping_switcher():
+    criteria = stopping_switcher({'max_evaluations': 100, 'stagnation': {'iterations': 5, 'tolerance': 0.1}})
+    assert [c.name for c in criteria] == ['max_evaluations', 'stagnation']
+    assert (criteria[1].iterations, criteria[1].tolerance) == (5, 0.1)
+    assert stopping_switcher(None) == []
+    with pytest.raises(Exception):
+        stopping_switcher({'max_generations': 10})
+
+
+def test_stagnation():
+    assert feed(Stagnation(3), [5, 4, 4, 4, 4]) == [False, False, False, True, True]
+    # not before more than 'iterations' iterations, as in accuracy mode
+    assert feed(Stagnation(3), [4, 4, 4]) == [False, False, False]
+    assert feed(Stagnation(2, tolerance=0.5), [5, 4.8, 4.7, 3]) == [False, False, True, False]
+
+
+def test_relative_improvement():
+    assert feed(RelativeImprovement(0.1, 2), [10, 9.5, 9.4, 5, 4.9]) == [False, False, True, False, False]
+
+
+def test_target_and_time():
+    assert feed(TargetFitness(1), [3, 1, 2]) == [False, True, False]
+    assert feed(MaxTime(0), [3]) == [True]
+    assert feed(MaxTime(60), [3]) == [False]
+
+
+@pytest.mark.parametrize('so_class', [PSO, ArrayPSO])
+@pytest.mark.parametrize('budget, evaluations', [(95, 90), (100, 100)])
+def test_max_evaluations(f1_opt_funct, so_class, budget, evaluations):
+    so = so_class(10, 3, f1_opt_funct, stopping={'max_evaluations': budget})
+    so.evaluate()
+    # 10 evaluations at reset and 10 in every iteration, run does not go over budget
+    assert so.logs['stop_reason'] == 'max_evaluations'
+    assert so.logs['evaluations'] == evaluations
+    assert so.logs['iterations'] == evaluations // 10 - 1
+
+
+def test_default_stop_reasons(f1_opt_funct):
+    so = CSO(20, 3, f1_opt_funct, 2, seed=1)
+    so.evaluate(15)
+    assert (so.logs['stop_reason'], so.logs['iterations']) == ('max_iterations', 15)
+    so.reset()
+    so.evaluate()
+    assert so.logs['stop_reason'] in ('accuracy', 'stagnation', 'max_iterations')
+    assert so.logs['iterations'] == len(so.logs['y'])
+
+
+def test_target_with_iterations(f1_opt_funct):
+    so = PSO(20, 3, f1_opt_funct, seed=2, stopping={'target': 1e3})
+    so.evaluate(500)
+    assert so.logs['stop_reason'] == 'target'
+    assert so.y <= 1e3 < so.logs['y'][-2]
+
+
+def test_island_model_evaluations(f1_opt_funct):
+    islands = IslandModel(20, 3, f1_opt_funct, PSO, 2, migration_interval=3, processes=False,
+                          stopping={'max_evaluations': 100})
+    islands.evaluate()
+    # every epoch is 2 islands * 10 particles * 3 iterations, the second one would go over budget
+    assert islands.logs['evaluations'] == 20 + 60
+    assert islands.logs['iterations'] == 3
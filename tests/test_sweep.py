@@ -0,0 +1,79 @@
+import pytest
+
+from app.sweep import configurations, config_hash, sweep_inputs, get_parameter
+
+DATA = {
+    'w_parameters': {
+        'a': {'w_v': 0.729, 'w_g': 1.494, 'w_l': 1.494},
+        'a_copy': {'w_v': 0.729, 'w_g': 1.494, 'w_l': 1.494},
+        'b': {'w_v': 0.6, 'w_g': 1.7, 'w_l': 1.7}
+    },
+    'pso_f11': {'function': 'f11', 'population': 50, 'dimension': 30, 'w_set': 'a'},
+    'ba_a': {'function': 'f11', 'population': 50, 'dimension': 15, 'parameters': {'mod_r': 0.8}}
+}
+
+
+def sweep_data(**sweeps):
+    return dict(DATA, sweeps=sweeps)
+
+
+def test_grid():
+    user_inputs, inputs_data = sweep_inputs('pso_w', sweep_data(pso_w={
+        'base': 'pso_f11',
+        'parameters': {'w_set': ['a', 'b'], 'population': [20, 50, 80]}
+    }))
+    assert len(user_inputs) == 6
+    assert all(user_input.startswith('pso_w_') for user_input in user_inputs)
+    assert [(d['w_set'], d['population']) for d in inputs_data][:3] == [('a', 20), ('a', 50), ('a', 80)]
+    # base input is not changed
+    assert DATA['pso_f11']['population'] == 50
+
+
+def test_duplicates_removed():
+    # w sets with equal values and repeated values give the same configurations
+    user_inputs, inputs_data = sweep_inputs('pso_w', sweep_data(pso_w={
+        'base': 'pso_f11',
+        'parameters': {'w_set': ['a', 'a_copy', 'b'], 'dimension': [10, 10]}
+    }))
+    assert [d['w_set'] for d in inputs_data] == ['a', 'b']
+    assert len(set(user_inputs)) == 2
+
+
+def test_nested_parameters():
+    user_inputs, inputs_data = sweep_inputs('ba_r', sweep_data(ba_r={
+        'base': 'ba_a',
+        'parameters': {'parameters.mod_r': [0.5, 0.9]}
+    }))
+    assert [get_parameter(d, 'parameters.mod_r') for d in inputs_data] == [0.5, 0.9]
+
+
+def test_random_sample():
+    spec = {
+        'mode': 'random',
+        'samples': 20,
+        'seed': 5,
+        'parameters': {'pm': {'low': 0.01, 'high': 0.1}, 'population': {'low': 20, 'high': 40},
+                       'w_set': ['a', 'b']}
+    }
+    sample = configurations(spec)
+    assert sample == configurations(spec)
+    assert len(sample) == 20
+    for configuration in sample:
+        assert 0.01 <= configuration['pm'] <= 0.1
+        assert isinstance(configuration['population'], int) and 20 <= configuration['population'] <= 40
+        assert configuration['w_set'] in ('a', 'b')
+
+
+def test_hash():
+    assert config_hash({'w_set': 'a', 'population': 20}, DATA['w_parameters']) \
+        == config_hash({'population': 20, 'w_set': 'a_copy'}, DATA['w_parameters'])
+    assert config_hash({'w_set': 'a'}, DATA['w_parameters']) != config_hash({'w_set': 'b'}, DATA['w_parameters'])
+
+
+def test_errors():
+    with pytest.raises(Exception):
+        configurations({'mode': 'grid', 'parameters': {'pm': 0.1}})
+    with pytest.raises(Exception):
+        configurations({'mode': 'latin', 'parameters': {}})
+    with pytest.raises(Exception):
+        sweep_inputs('pso_w', sweep_data(pso_w={'base': 'pso_f11', 'parameters': {'w_set': ['z']}}))
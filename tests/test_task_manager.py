@@ -0,0 +1,51 @@
+import multiprocessing
+from functools import partial
+
+import pytest
+
+from scheduler import run_repeat
+
+INPUT = {'function': 'f1', 'population': 10, 'dimension': 3, 'w_set': 'a', 'iterations': 20}
+
+
+@pytest.fixture
+def task_manager(task_manager):
+    return partial(task_manager, {'pso_a': INPUT}, repeats=4, seed=3)
+
+
+def test_process_pool_same_as_serial(task_manager):
+    results = []
+    for workers in (1, 3):
+        tm = task_manager(workers=workers)
+        pso, evaluate_kwargs = tm.build_pso(INPUT)
+        results.append(tm.run_repeats(pso, 'pso_a', [11, 12, 13, 14], **evaluate_kwargs))
+    serial, pooled = results
+    # results come back in order of repeats, whatever order workers finish in
+    assert [r['seed'] for r in pooled] == [11, 12, 13, 14]
+    assert [(r['y'], r['logs_y'], r['best_global']) for r in pooled] == \
+        [(r['y'], r['logs_y'], r['best_global']) for r in serial]
+
+
+def children_after_repeat(so_object, seed, **evaluate_kwargs) -> int:
+    """processes left behind by repeat in pool worker"""
+    run_repeat(so_object, seed, **evaluate_kwargs)
+    return len(multiprocessing.active_children())
+
+
+def test_island_workers_stopped_after_repeats(task_manager, monkeypatch):
+    islands_input = {**INPUT, 'population': 12, 'islands': {'no_islands': 3, 'migration_interval': 5}}
+    tm = task_manager(workers=2)
+    islands, evaluate_kwargs = tm.build_pso(islands_input)
+    # optimizer of input does not start workers before its repeats are run
+    assert islands.workers == [] and multiprocessing.active_children() == []
+    monkeypatch.setattr('task_manager.run_repeat', children_after_repeat)
+    assert tm.run_repeats(islands, 'pso_a', [11, 12, 13, 14], **evaluate_kwargs) == [0] * 4
+    assert multiprocessing.active_children() == []
+
+
+def test_telemetry_file_per_run_with_workers(task_manager, tmp_path):
+    telemetry = {'type': 'jsonl', 'path': str(tmp_path / 'telemetry.jsonl')}
+    with pytest.raises(Exception):
+        task_manager(workers=2, telemetry=telemetry)
+    task_manager(workers=1, telemetry=telemetry)
+    task_manager(workers=2, telemetry={'type': 'jsonl', 'path': str(tmp_path / '{run}.jsonl')})
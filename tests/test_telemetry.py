@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from app.ArrayPSO import ArrayPSO
+from app.IslandModel import IslandModel
+from app.PSO import PSO
+from app.telemetry import sink_switcher, read_binary, JsonlSink, BinarySink
+
+
+def test_sink_switcher(tmp_path):
+    assert sink_switcher(None) is None
+    sink = sink_switcher({'type': 'binary', 'path': str(tmp_path / 'a.bin'), 'buffer_size': 3})
+    assert isinstance(sink, BinarySink) and sink.buffer_size == 3
+    assert isinstance(sink_switcher({'path': str(tmp_path / 'a.jsonl')}), JsonlSink)
+    with pytest.raises(Exception):
+        sink_switcher({'type': 'csv', 'path': 'a.csv'})
+
+
+def test_bounded_buffer(tmp_path):
+    path = tmp_path / 'telemetry.jsonl'
+    sink = JsonlSink(str(path), buffer_size=4)
+    for i in range(3):
+        sink({'run': 'pso', 'iteration': i})
+    assert not path.exists()
+    # records are written in blocks of buffer_size
+    sink({'run': 'pso', 'iteration': 3})
+    assert len(path.read_text().splitlines()) == 4
+    assert sink.buffers[str(path)] == []
+    sink({'run': 'pso', 'iteration': 4})
+    sink.close()
+    assert len(path.read_text().splitlines()) == 5
+
+
+@pytest.mark.parametrize('so_class', [PSO, ArrayPSO])
+def test_jsonl(f1_opt_funct, tmp_path, so_class):
+    path = tmp_path / 'telemetry.jsonl'
+    so = so_class(10, 3, f1_opt_funct, telemetry=JsonlSink(str(path), buffer_size=7), run='a')
+    so.evaluate(20)
+    so.run = 'b'
+    so.reset()
+    so.evaluate(5)
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r['run'] for r in records] == ['a'] * 20 + ['b'] * 5
+    assert [r['iteration'] for r in records] == list(range(1, 21)) + list(range(1, 6))
+    assert [r['y'] for r in records[-5:]] == list(so.logs['y'])
+    assert records[-1]['evaluations'] == 60
+    assert all(r['elapsed'] >= 0 for r in records)
+
+
+def test_binary_file_per_run(f1_opt_funct, tmp_path):
+    sink = BinarySink(str(tmp_path / '{run}.bin'), buffer_size=4)
+    for repeat in range(2):
+        so = PSO(10, 3, f1_opt_funct, telemetry=sink, run=f'pso_{repeat}')
+        so.evaluate(10)
+        records = read_binary(tmp_path / f'pso_{repeat}.bin')
+        assert records['iteration'].tolist() == list(range(1, 11))
+        assert records['y'].tolist() == list(so.logs['y'])
+        assert records['evaluations'][-1] == so.evaluations
+
+
+def test_without_history(f1_opt_funct):
+    so = PSO(10, 3, f1_opt_funct, keep_history=False, seed=1)
+    full = PSO(10, 3, f1_opt_funct, seed=1)
+    assert so.evaluate(30) == full.evaluate(30)
+    assert so.logs['y'] == (full.y,)
+    assert so.logs['iterations'] == 30
+
+    islands = IslandModel(20, 3, f1_opt_funct, PSO, 2, migration_interval=5, processes=False,
+                          keep_history=False)
+    islands.evaluate(20)
+    assert islands.logs['y'] == (islands.y,)
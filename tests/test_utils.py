@@ -1,4 +1,10 @@
-from app.utils import bounce
+from statistics import median
+
+import numpy as np
+import pytest
+
+from app.random_stream import RandomStream
+from app.utils import bounce, bounce_array, LevyFlight, levy_flight as levy_flight_scalar
 from functools import partial
 
 
@@ -8,3 +14,26 @@ def test_bounce():
     bounce_with_boundaries = partial(bounce, x_range=boundaries)
     for x in vector_x:
         assert boundaries[0] <= bounce_with_boundaries(x) <= boundaries[1]
+
+
+def test_bounce_array():
+    boundaries = (-1, 3)
+    vector_x = np.linspace(-30, 30, 601)
+    bounced = bounce_array(vector_x, boundaries)
+    assert np.all(boundaries[0] <= bounced)
+    assert np.all(bounced <= boundaries[1])
+    assert np.allclose(bounced, [bounce(x, boundaries) for x in vector_x])
+
+
+def test_levy_flight():
+    rng = RandomStream(1)
+    levy_flight = LevyFlight(rng, probability=0.1, scale=2.0, buffer_size=100)
+    multipliers = levy_flight.multipliers((200, 50))
+    flying = multipliers != 1
+    assert 0.08 < flying.mean() < 0.12
+    assert (multipliers > 0).all()
+    # median of levy distribution with scale c is c / (2 * erfcinv(0.5) ** 2)
+    assert median(levy_flight.steps(20000)) == pytest.approx(2.0 * 2.198, rel=0.05)
+    v = np.full((3, 4), 2.0)
+    assert levy_flight(v).shape == v.shape
+    assert levy_flight_scalar(3.0, probability=0) == 3.0